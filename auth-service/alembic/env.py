@@ -9,6 +9,7 @@ from src.config import settings
 
 from src.models.base import Base
 from src.models.user import User  # noqa: F401
+from src.models.outbox import OutboxMessage  # noqa: F401
 
 config = context.config
 
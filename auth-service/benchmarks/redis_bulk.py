@@ -0,0 +1,69 @@
+"""Compares per-key Redis round trips with MGET and pipelined batches.
+
+Run from the service root against a live Redis:
+    python -m benchmarks.redis_bulk --keys 1000 --repeat 5
+"""
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable
+from uuid import uuid4
+
+from src.database.redis_db import async_redis_client
+from src.repositories.redis_repository import AsyncRedisUserRepository
+
+
+async def measure(
+    name: str,
+    repeat: int,
+    func: Callable[[], Awaitable[object]],
+    setup: Callable[[], Awaitable[object]] | None = None,
+) -> None:
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            await setup()
+        started = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - started)
+    best, avg = min(timings), sum(timings) / len(timings)
+    print(f"{name:<28} best={best * 1000:8.2f} ms  avg={avg * 1000:8.2f} ms")
+
+
+async def main(keys: int, repeat: int) -> None:
+    repository = AsyncRedisUserRepository(async_redis_client, key_prefix="benchmark_user")
+    users = {uuid4(): f"Benchmark User {idx}" for idx in range(keys)}
+
+    async def set_per_key() -> None:
+        for user_id, value in users.items():
+            await repository.set_user(user_id, value, ex=60)
+
+    async def get_per_key() -> None:
+        for user_id in users:
+            await repository.get_user(user_id)
+
+    async def delete_per_key() -> None:
+        for user_id in users:
+            await repository.delete_user(user_id)
+
+    print(f"{keys} keys, {repeat} runs")
+    try:
+        await measure("SET per key", repeat, set_per_key)
+        await measure("SET pipelined", repeat, lambda: repository.set_users(users, ex=60))
+        await measure("GET per key", repeat, get_per_key)
+        await measure("MGET", repeat, lambda: repository.get_users(users))
+        await measure("DEL per key", repeat, delete_per_key, setup=lambda: repository.set_users(users, ex=60))
+        await measure(
+            "DEL batch", repeat, lambda: repository.delete_users(users), setup=lambda: repository.set_users(users, ex=60)
+        )
+    finally:
+        await repository.delete_users(users)
+        await async_redis_client.aclose(close_connection_pool=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.keys, args.repeat))
@@ -2,6 +2,7 @@ import json
 from typing import Any
 from uuid import uuid4, UUID
 
+from src.database.redis_db import redis_client
 from src.repositories.redis_repository import redis_user_repository, RedisUserRepository
 from src.repositories.serializers import RedisSerializer
 
@@ -36,5 +37,6 @@ def success_case(user_repository: RedisUserRepository, users: dict[UUID, Any]) -
 
 
 if __name__ == "__main__":
+    redis_client.ping()
     warning_case(redis_user_repository)
     success_case(redis_user_repository, users)
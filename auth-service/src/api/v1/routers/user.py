@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, status
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 
 from src.api.v1.services.user import UserService
+from src.schemas.response import PydanticJSONResponse
 from src.schemas.user import CreateUserRequest, Token, CreateUserResponse, UserWithTasksResponse
 
 router = APIRouter(prefix="/users")
@@ -13,24 +14,24 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/users/login")
 async def register(
     user: CreateUserRequest,
     user_service: UserService = Depends()
-) -> CreateUserResponse:
+) -> PydanticJSONResponse:
     created_user = await user_service.create_user(user)
-    return CreateUserResponse(payload=created_user)
+    return PydanticJSONResponse(CreateUserResponse(payload=created_user), status_code=status.HTTP_201_CREATED)
 
 
 @router.post("/login", response_model=Token, status_code=status.HTTP_200_OK)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     user_service: UserService = Depends()
-) -> Token:
+) -> PydanticJSONResponse:
     token = await user_service.get_jwt_token(form_data.username, form_data.password)
-    return Token(access_token=token, token_type="Bearer")
+    return PydanticJSONResponse(Token(access_token=token, token_type="Bearer"), status_code=status.HTTP_200_OK)
 
 
 @router.get("/info", response_model=UserWithTasksResponse, status_code=status.HTTP_200_OK)
 async def get_info(
     token: str = Depends(oauth2_scheme),
     user_service: UserService = Depends()
-) -> UserWithTasksResponse:
+) -> PydanticJSONResponse:
     user = await user_service.get_current_user_with_tasks_count(token=token)
-    return UserWithTasksResponse(payload=user)
+    return PydanticJSONResponse(UserWithTasksResponse(payload=user), status_code=status.HTTP_200_OK)
@@ -1,18 +1,22 @@
 import datetime
 import logging
 import uuid
+from typing import Any
 
 from fastapi import HTTPException, status
 from jose import JWTError
 from pydantic import EmailStr
 
-from src.messaging.producers import get_tasks_count, send_email_notification
+from src.messaging import queues_names
+from src.messaging.producers import get_tasks_count, email_notification_payload
 from src.models.user import User
 from src.schemas.user import CreateUserRequest, UserDB, UserWithTasksCount
 from src.utils import auth_jwt
-from src.utils.auth_jwt import hash_password, verify_password, decode_jwt
+from src.utils.auth_jwt import decode_jwt_cached
 from src.utils import constants
+from src.utils.hashing import HashingQueueFull, get_password_hasher
 from src.utils.service import BaseService, transaction_mode
+from src.utils.user_cache import UserCache, user_cache
 
 log = logging.getLogger(__name__)
 
@@ -25,6 +29,29 @@ class UserService(BaseService):
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    user_cache: UserCache = user_cache
+
+    @staticmethod
+    async def hash_password(password: str) -> bytes:
+        """Hash a password off the event loop"""
+        try:
+            return await get_password_hasher().hash_password(password)
+        except HashingQueueFull:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=constants.SERVICE_OVERLOADED_MSG
+            )
+
+    @staticmethod
+    async def verify_password(password: str, hashed_password: bytes) -> bool:
+        """Verify a password off the event loop"""
+        try:
+            return await get_password_hasher().verify_password(password, hashed_password)
+        except HashingQueueFull:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=constants.SERVICE_OVERLOADED_MSG
+            )
 
     async def check_user_existence(self, user_id: uuid.UUID) -> bool:
         if not await self.uow.user.get_one_by_id_or_none(user_id):
@@ -39,23 +66,22 @@ class UserService(BaseService):
                 detail=constants.USER_EXISTS_MSG
             )
 
-    @staticmethod
-    async def send_registry_email_notification(email: EmailStr | str) -> None:
-        """Send registry email notification"""
-        try:
-            await send_email_notification(
+    async def send_registry_email_notification(self, email: EmailStr | str) -> None:
+        """Queue registry email notification, it is published by the outbox relay after commit"""
+        await self.uow.outbox.add_message(
+            queues_names.EMAIL_NOTIFICATIONS,
+            email_notification_payload(
                 email,
                 constants.USER_REGISTERED_SUBJECT,
                 constants.USER_REGISTERED_MSG
             )
-        except Exception as e:
-            log.error(f"Error sending registry email notification: {e}")
+        )
 
     @transaction_mode
     async def create_user(self, user: CreateUserRequest, user_id: uuid.UUID = None) -> UserDB:
         """Create new user"""
         await self.check_email_existence(user.email)
-        hashed_password = hash_password(user.password)
+        hashed_password = await self.hash_password(user.password)
         data = user.model_dump(exclude={"password"})
         if user_id:
             data["id"] = user_id
@@ -74,7 +100,7 @@ class UserService(BaseService):
         user = await self.uow.user.get_user_by_email(email)
         if not user:
             raise self.credentials_exception
-        if not verify_password(password, user.hashed_password.encode("utf-8")):
+        if not await self.verify_password(password, user.hashed_password.encode("utf-8")):
             raise self.credentials_exception
         return user
 
@@ -85,10 +111,15 @@ class UserService(BaseService):
         return auth_jwt.encode_jwt(jwt_payload)
 
     @transaction_mode
+    async def load_user(self, user_id: uuid.UUID) -> UserDB | None:
+        """Get user by ID from the database"""
+        user = await self.uow.user.get_one_by_id_or_none(user_id)
+        return user.to_schema() if user else None
+
     async def get_current_user(self, token: str) -> UserDB:
-        """Get current user from token"""
+        """Get current user from token, reading the profile through the cache"""
         try:
-            payload = decode_jwt(token)
+            payload = decode_jwt_cached(token)
             user_id = payload.get("sub")
             if user_id is None:
                 raise self.credentials_exception
@@ -100,12 +131,25 @@ class UserService(BaseService):
         except JWTError:
             raise self.credentials_exception
 
-        user = await self.uow.user.get_one_by_id_or_none(uuid.UUID(user_id))
+        user_id = uuid.UUID(user_id)
+        user = await self.user_cache.get_or_load(user_id, lambda: self.load_user(user_id))
         if user is None:
             raise self.credentials_exception
-        return user.to_schema()
+        return user
 
     @transaction_mode
+    async def update_one_by_id(self, obj_id: uuid.UUID, **kwargs: Any) -> User | None:
+        """Update a user, the cached profile is dropped after the commit"""
+        user = await super().update_one_by_id(obj_id, **kwargs)
+        self.uow.after_commit(lambda: self.user_cache.invalidate(obj_id))
+        return user
+
+    @transaction_mode
+    async def delete_one_by_id(self, obj_id: uuid.UUID) -> None:
+        """Delete a user, the cached profile is dropped after the commit"""
+        await super().delete_one_by_id(obj_id)
+        self.uow.after_commit(lambda: self.user_cache.invalidate(obj_id))
+
     async def get_current_user_with_tasks_count(self, token: str) -> UserWithTasksCount:
         user = await self.get_current_user(token)
         data = UserWithTasksCount(**user.model_dump())
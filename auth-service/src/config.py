@@ -45,6 +45,9 @@ class RedisSettings(EnvDict):
     REDIS_USER: str
     REDIS_PASS: str
     REDIS_DB: int
+    REDIS_MAX_CONNECTIONS: int = 50
+    USER_CACHE_TTL: int = 300
+    USER_CACHE_TTL_JITTER: int = 60
 
     @property
     def REDIS_URL(self):
@@ -56,6 +59,12 @@ class AuthJWT(BaseModel):
     public_key_path: Path = BASE_DIR / "certs" / "jwt-public.pem"
     algorithm: str = "RS256"
     access_token_expire_minutes: int = 15
+    verified_cache_size: int = 10_000
+
+
+class HashingSettings(EnvDict):
+    HASHING_MAX_WORKERS: int = 4
+    HASHING_MAX_QUEUE_SIZE: int = 64
 
 
 class RabbitMQSettings(EnvDict):
@@ -63,6 +72,15 @@ class RabbitMQSettings(EnvDict):
     RABBIT_PORT: int
     RABBIT_USER: str
     RABBIT_PASS: str
+    RABBIT_CHANNEL_POOL_SIZE: int = 8
+    RABBIT_RPC_TIMEOUT: float = 10.0
+    RABBIT_PREFETCH_COUNT: int = 32
+    RABBIT_CONSUMER_CONCURRENCY: int = 16
+    RABBIT_ACK_BATCH_SIZE: int = 16
+    RABBIT_ACK_INTERVAL: float = 0.05
+    RABBIT_STATS_INTERVAL: float = 60.0
+    RABBIT_OUTBOX_BATCH_SIZE: int = 100
+    RABBIT_OUTBOX_POLL_INTERVAL: float = 0.5
 
     @property
     def RABBIT_URL(self):
@@ -72,6 +90,7 @@ class RabbitMQSettings(EnvDict):
 class Settings(PgSettings, RedisSettings):
     auth_jwt: AuthJWT = AuthJWT()
     rabbit_settings: RabbitMQSettings = RabbitMQSettings()
+    hashing_settings: HashingSettings = HashingSettings()
 
 
 settings = Settings()
@@ -1,4 +1,5 @@
 import redis
+import redis.asyncio
 
 from src.config import settings
 
@@ -7,4 +8,10 @@ redis_client = redis.Redis.from_url(
     settings.REDIS_URL,
     decode_responses=True
 )
-redis_client.ping()
+
+async_redis_pool = redis.asyncio.ConnectionPool.from_url(
+    settings.REDIS_URL,
+    decode_responses=True,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+)
+async_redis_client = redis.asyncio.Redis(connection_pool=async_redis_pool)
@@ -6,21 +6,40 @@ from  fastapi import  FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api import router
-from src.messaging.connection import get_connection
-from src.messaging.consumers import check_user_existence
+from src.database.redis_db import async_redis_client
+from src.messaging.connection import get_connection, get_channel_pool
+from src.messaging.consumers import check_user_existence, check_users_existence, get_users_info
+from src.messaging.outbox_relay import relay_outbox
+from src.messaging.rpc import get_rpc_client
+from src.messaging.topology import declare_topology
+from src.utils.hashing import get_password_hasher
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     rabbit_conn = await get_connection()
-    task = asyncio.create_task(check_user_existence())
+    await declare_topology()
+    rpc_client = get_rpc_client()
+    await rpc_client.connect()
+    tasks = [
+        asyncio.create_task(check_user_existence()),
+        asyncio.create_task(check_users_existence()),
+        asyncio.create_task(get_users_info()),
+        asyncio.create_task(relay_outbox()),
+    ]
     yield
-    task.cancel()
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await rpc_client.close()
+    await get_channel_pool().close()
     await rabbit_conn.close()
+    get_password_hasher().shutdown()
+    await async_redis_client.aclose(close_connection_pool=True)
 
 app = FastAPI(lifespan=lifespan)
 
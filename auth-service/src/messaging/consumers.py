@@ -1,40 +1,57 @@
 import logging
 
-from aio_pika import Message
-from pydantic import ValidationError
+from aio_pika.abc import AbstractIncomingMessage
 from sqlalchemy.exc import SQLAlchemyError
 
-from src.messaging.connection import get_channel
-from src.schemas.messaging import UserExists
+from src.messaging.runtime import RpcConsumer
+from src.schemas.messaging import UserExists, UsersExist, UsersInfo, UserInfo
 from src.utils.unit_of_work import UnitOfWork
 from src.messaging import queues_names
 
 log = logging.getLogger(__name__)
 
 
+async def handle_user_existence(message: AbstractIncomingMessage) -> UserExists:
+    body = UserExists.model_validate_json(message.body.decode())
+    uow = UnitOfWork()
+    async with uow:
+        if await uow.user.get_one_by_id_or_none(body.data.user_id):
+            body.data.is_exists = True
+    return body
+
+
+async def handle_users_existence(message: AbstractIncomingMessage) -> UsersExist:
+    body = UsersExist.model_validate_json(message.body.decode())
+    uow = UnitOfWork()
+    async with uow:
+        existing_ids = await uow.user.get_existing_ids(body.data.user_ids)
+    body.data.existence = {
+        user_id: user_id in existing_ids for user_id in body.data.user_ids
+    }
+    return body
+
+
+async def handle_users_info(message: AbstractIncomingMessage) -> UsersInfo:
+    body = UsersInfo.model_validate_json(message.body.decode())
+    uow = UnitOfWork()
+    async with uow:
+        users = await uow.user.get_users_by_ids(body.data.user_ids)
+    body.data.users = {
+        user.id: UserInfo(full_name=user.full_name, email=user.email) for user in users
+    }
+    return body
+
+
 async def check_user_existence():
-    ch = await get_channel()
-    async with ch:
-        queue = await ch.declare_queue(queues_names.CHECK_EXISTENCE)
-
-        uow = UnitOfWork()
-
-        async with queue.iterator() as queue_iter:
-            async for message in queue_iter:
-                try:
-                    async with message.process():
-                        body = UserExists.model_validate_json(message.body.decode())
-                        async with uow:
-                            if await uow.user.get_one_by_id_or_none(body.data.user_id):
-                                body.data.is_exists = True
-
-                        await ch.default_exchange.publish(
-                            Message(
-                                body=body.model_dump_json().encode(),
-                                correlation_id=message.correlation_id,
-                            ),
-                            routing_key=message.reply_to
-                        )
-                except (ValidationError, SQLAlchemyError) as e:
-                    log.error(f"Failed process message ({message.body.decode()}): {e}")
-                    await message.nack(requeue=True)
+    consumer = RpcConsumer(queues_names.CHECK_EXISTENCE, handle_user_existence, requeue_on=(SQLAlchemyError,))
+    await consumer.consume()
+
+
+async def check_users_existence():
+    consumer = RpcConsumer(queues_names.CHECK_EXISTENCE_BATCH, handle_users_existence, requeue_on=(SQLAlchemyError,))
+    await consumer.consume()
+
+
+async def get_users_info():
+    consumer = RpcConsumer(queues_names.USERS_INFO, handle_users_info, requeue_on=(SQLAlchemyError,))
+    await consumer.consume()
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Callable
+
+from aio_pika import DeliveryMode, Message
+
+from src.config import settings
+from src.messaging.connection import ChannelPool, get_channel_pool
+from src.models.outbox import OutboxMessage
+from src.utils.unit_of_work import AbstractUnitOfWork, UnitOfWork
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class OutboxRelayStats:
+    published: int = 0
+    failed: int = 0
+    batches: int = 0
+
+
+class OutboxRelay:
+    """Publishes outbox messages to RabbitMQ.
+
+    A batch is locked with SKIP LOCKED and published on one pooled publisher-confirms
+    channel, the confirms are awaited together, so a batch costs about one broker
+    round trip. Confirmed messages are deleted on commit, the others stay
+    and are published again. Delivery is at least once, `message_id` is the outbox id.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], AbstractUnitOfWork] = UnitOfWork,
+        channel_pool: ChannelPool | None = None,
+        batch_size: int = settings.rabbit_settings.RABBIT_OUTBOX_BATCH_SIZE,
+        poll_interval: float = settings.rabbit_settings.RABBIT_OUTBOX_POLL_INTERVAL,
+    ) -> None:
+        self.uow_factory = uow_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.stats = OutboxRelayStats()
+        self.channel_pool = channel_pool or get_channel_pool()
+
+    @staticmethod
+    def _to_message(message: OutboxMessage) -> Message:
+        return Message(
+            body=message.body.encode(),
+            message_id=str(message.id),
+            delivery_mode=DeliveryMode.PERSISTENT,
+        )
+
+    async def relay_batch(self) -> int:
+        """Publish one batch, returns the number of confirmed messages"""
+        uow = self.uow_factory()
+        async with uow:
+            messages = await uow.outbox.get_batch(self.batch_size)
+            if not messages:
+                return 0
+
+            errors = await self.channel_pool.publish_batch(
+                [(message.routing_key, self._to_message(message)) for message in messages]
+            )
+            confirmed = []
+            for message, error in zip(messages, errors):
+                if error is not None:
+                    self.stats.failed += 1
+                    log.error(f"Failed publish outbox message {message.id} to {message.routing_key}: {error}")
+                else:
+                    confirmed.append(message.id)
+
+            if confirmed:
+                await uow.outbox.delete_messages(confirmed)
+            self.stats.published += len(confirmed)
+            self.stats.batches += 1
+            return len(confirmed)
+
+    async def run(self) -> None:
+        """Relay batches until cancelled, sleeps when the outbox is drained"""
+        while True:
+            try:
+                published = await self.relay_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error(f"Failed relay outbox: {e}")
+                published = 0
+
+            if published < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+
+async def relay_outbox():
+    await OutboxRelay().run()
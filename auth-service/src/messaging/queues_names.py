@@ -1,3 +1,5 @@
 CHECK_EXISTENCE = "user_existence"
+CHECK_EXISTENCE_BATCH = "users_existence"
+USERS_INFO = "users_info"
 TASKS_COUNT = "tasks_count"
 EMAIL_NOTIFICATIONS = "email_notifications"
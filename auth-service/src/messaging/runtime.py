@@ -0,0 +1,193 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from aio_pika import Message
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage, AbstractQueue
+from pydantic import BaseModel
+
+from src.config import settings
+from src.messaging.connection import get_connection
+
+log = logging.getLogger(__name__)
+
+Handler = Callable[[AbstractIncomingMessage], Awaitable[BaseModel | None]]
+
+
+@dataclass
+class ConsumerStats:
+    """Gauges and counters of a single consumer"""
+    queue_depth: int = 0
+    in_flight: int = 0
+    processed: int = 0
+    failed: int = 0
+
+
+_consumers_stats: dict[str, ConsumerStats] = {}
+
+
+def get_consumers_stats() -> dict[str, ConsumerStats]:
+    """Return stats of all running consumers by queue name"""
+    return _consumers_stats
+
+
+class RpcConsumer:
+    """Consumes RPC requests from a queue with bounded concurrency.
+
+    The channel QoS limits unacked deliveries to `prefetch_count`, up to `concurrency`
+    handlers run at the same time, and successful deliveries are acked in batches
+    with `multiple=True` once every earlier delivery on the channel is settled.
+    The handler returns the reply model, which is published to `reply_to`.
+    Exceptions listed in `requeue_on` requeue the message, any other one rejects it.
+    Delivery tags restart when the robust channel reopens, so the tracking of the old
+    channel is dropped: its deliveries are requeued by the broker and never acked here.
+    """
+
+    def __init__(
+        self,
+        queue_name: str,
+        handler: Handler,
+        *,
+        prefetch_count: int = settings.rabbit_settings.RABBIT_PREFETCH_COUNT,
+        concurrency: int = settings.rabbit_settings.RABBIT_CONSUMER_CONCURRENCY,
+        ack_batch_size: int = settings.rabbit_settings.RABBIT_ACK_BATCH_SIZE,
+        ack_interval: float = settings.rabbit_settings.RABBIT_ACK_INTERVAL,
+        stats_interval: float = settings.rabbit_settings.RABBIT_STATS_INTERVAL,
+        requeue_on: tuple[type[Exception], ...] = (),
+    ) -> None:
+        self.queue_name = queue_name
+        self.handler = handler
+        self.prefetch_count = prefetch_count
+        self.concurrency = concurrency
+        self.ack_batch_size = ack_batch_size
+        self.ack_interval = ack_interval
+        self.stats_interval = stats_interval
+        self.requeue_on = requeue_on
+        self.stats = ConsumerStats()
+
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._tasks: set[asyncio.Task] = set()
+        self._unsettled: set[int] = set()
+        self._completed: dict[int, AbstractIncomingMessage] = {}
+        self._generation = 0
+
+    async def consume(self) -> None:
+        """Consume the queue until cancelled, then finish in-flight handlers"""
+        conn = await get_connection()
+        ch = await conn.channel()
+        _consumers_stats[self.queue_name] = self.stats
+
+        ch.reopen_callbacks.add(self._on_channel_reopen)
+
+        async with ch:
+            await ch.set_qos(prefetch_count=self.prefetch_count)
+            queue = await ch.declare_queue(self.queue_name)
+
+            background = [
+                asyncio.create_task(self._flush_acks_periodically()),
+                asyncio.create_task(self._monitor_queue(queue)),
+            ]
+            try:
+                async with queue.iterator() as queue_iter:
+                    async for message in queue_iter:
+                        self._unsettled.add(message.delivery_tag)
+                        generation = self._generation
+                        await self._semaphore.acquire()
+                        task = asyncio.create_task(self._process(ch, message, generation))
+                        self._tasks.add(task)
+                        task.add_done_callback(self._tasks.discard)
+            finally:
+                for task in background:
+                    task.cancel()
+                if self._tasks:
+                    await asyncio.gather(*self._tasks, return_exceptions=True)
+                await self._flush_acks()
+                _consumers_stats.pop(self.queue_name, None)
+
+    def _on_channel_reopen(self, channel: AbstractChannel) -> None:
+        log.warning(
+            f"Channel of '{self.queue_name}' reopened, "
+            f"{len(self._unsettled)} unsettled deliveries are left to the broker"
+        )
+        self._generation += 1
+        self._unsettled.clear()
+        self._completed.clear()
+
+    async def _process(self, channel: AbstractChannel, message: AbstractIncomingMessage, generation: int) -> None:
+        """Handle a delivery received in `generation` of the channel and settle it"""
+        self.stats.in_flight += 1
+        try:
+            reply = await self.handler(message)
+            if reply is not None and message.reply_to:
+                await self._publish_reply(channel, message, reply)
+        except Exception as e:
+            self.stats.failed += 1
+            requeue = isinstance(e, self.requeue_on)
+            log.error(f"Failed process message ({message.body.decode()}): {e}")
+            if generation == self._generation:
+                self._unsettled.discard(message.delivery_tag)
+                await message.nack(requeue=requeue)
+        else:
+            self.stats.processed += 1
+            if generation == self._generation:
+                self._completed[message.delivery_tag] = message
+            if len(self._completed) >= self.ack_batch_size:
+                await self._flush_acks()
+        finally:
+            self.stats.in_flight -= 1
+            self._semaphore.release()
+
+    @staticmethod
+    async def _publish_reply(
+        channel: AbstractChannel,
+        message: AbstractIncomingMessage,
+        reply: BaseModel,
+    ) -> None:
+        await channel.default_exchange.publish(
+            Message(
+                body=reply.model_dump_json().encode(),
+                correlation_id=message.correlation_id,
+            ),
+            routing_key=message.reply_to,
+        )
+
+    async def _flush_acks(self) -> None:
+        """Ack every completed delivery below the oldest still running one with one frame"""
+        if not self._completed:
+            return
+
+        watermark = min(self._unsettled - self._completed.keys(), default=None)
+        tags = [tag for tag in self._completed if watermark is None or tag < watermark]
+        if not tags:
+            return
+
+        last_tag = max(tags)
+        last_message = self._completed[last_tag]
+        for tag in tags:
+            del self._completed[tag]
+            self._unsettled.discard(tag)
+
+        try:
+            await last_message.ack(multiple=True)
+        except Exception as e:
+            log.error(f"Failed ack messages up to delivery_tag={last_tag} on '{self.queue_name}': {e}")
+
+    async def _flush_acks_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.ack_interval)
+            await self._flush_acks()
+
+    async def _monitor_queue(self, queue: AbstractQueue) -> None:
+        while True:
+            try:
+                result = await queue.declare()
+                self.stats.queue_depth = result.message_count
+            except Exception as e:
+                log.warning(f"Failed get depth of queue '{self.queue_name}': {e}")
+            log.info(
+                f"Consumer '{self.queue_name}': queue_depth={self.stats.queue_depth}, "
+                f"in_flight={self.stats.in_flight}, processed={self.stats.processed}, "
+                f"failed={self.stats.failed}"
+            )
+            await asyncio.sleep(self.stats_interval)
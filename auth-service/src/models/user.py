@@ -18,4 +18,4 @@ class User(Base):
     hashed_password: Mapped[str] = mapped_column(String(128))
 
     def to_schema(self) -> UserDB:
-        return UserDB(**self.__dict__)
+        return UserDB.model_validate(self.__dict__)
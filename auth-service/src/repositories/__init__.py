@@ -1,5 +1,7 @@
+from src.repositories.outbox import OutboxRepository
 from src.repositories.user import UserRepository
 
 __all__ = [
+    "OutboxRepository",
     "UserRepository",
 ]
@@ -0,0 +1,34 @@
+from typing import Iterable, Sequence
+
+from sqlalchemy import select, delete, insert, any_, literal, BigInteger
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from src.models.outbox import OutboxMessage
+from src.utils.repository import SqlAlchemyRepository
+
+
+class OutboxRepository(SqlAlchemyRepository[OutboxMessage]):
+    _model = OutboxMessage
+
+    async def add_message(self, routing_key: str, body: str) -> None:
+        """Queue a message, must run in the transaction of the change"""
+        await self._session.execute(insert(self._model).values(routing_key=routing_key, body=body))
+
+    async def get_batch(self, limit: int) -> Sequence[OutboxMessage]:
+        """Get the oldest messages and lock them until the end of the transaction.
+        Messages locked by another relay are skipped.
+        """
+        query = (
+            select(self._model)
+            .order_by(self._model.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        res = await self._session.execute(query)
+        return res.scalars().all()
+
+    async def delete_messages(self, message_ids: Iterable[int]) -> None:
+        query = delete(self._model).filter(
+            self._model.id == any_(literal(list(message_ids), ARRAY(BigInteger)))
+        )
+        await self._session.execute(query)
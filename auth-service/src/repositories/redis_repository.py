@@ -1,9 +1,11 @@
 import logging
+from typing import Iterable, Mapping
 from uuid import UUID
 
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 
-from src.database.redis_db import redis_client
+from src.database.redis_db import redis_client, async_redis_client
 
 
 log = logging.getLogger(__name__)
@@ -45,3 +47,73 @@ class RedisUserRepository:
 
 
 redis_user_repository = RedisUserRepository(redis_client)
+
+
+class AsyncRedisUserRepository:
+    """Asyncio repository of user values in Redis.
+    Bulk methods cost one round trip for any number of keys.
+    """
+
+    def __init__(self, client: AsyncRedis, key_prefix: str = "user") -> None:
+        self.client = client
+        self.key_prefix = key_prefix
+
+    def _key(self, user_id: UUID) -> str:
+        return f"{self.key_prefix}:{user_id}"
+
+    async def get_user(self, user_id: UUID) -> str | None:
+        user = await self.client.get(self._key(user_id))
+        if user is None:
+            log.debug(f"Пользователь c id={user_id} не найден в redis")
+        return user
+
+    async def set_user(self, user_id: UUID, value: str, ex: int | None = None) -> bool:
+        try:
+            await self.client.set(self._key(user_id), value, ex=ex)
+        except Exception as e:
+            log.error(f"Ошибка при добавлении пользователя c id={user_id}: {e}")
+            return False
+        return True
+
+    async def delete_user(self, user_id: UUID) -> bool:
+        return await self.delete_users([user_id]) == 1
+
+    async def get_users(self, user_ids: Iterable[UUID]) -> dict[UUID, str | None]:
+        """Get many users with one MGET"""
+        user_ids = list(user_ids)
+        if not user_ids:
+            return {}
+        values = await self.client.mget([self._key(user_id) for user_id in user_ids])
+        return dict(zip(user_ids, values))
+
+    async def set_users(self, users: Mapping[UUID, str], ex: int | Mapping[UUID, int] | None = None) -> bool:
+        """Set many users with one pipeline, `ex` is a TTL for all or per user"""
+        if not users:
+            return True
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for user_id, value in users.items():
+                    ttl = ex.get(user_id) if isinstance(ex, Mapping) else ex
+                    pipe.set(self._key(user_id), value, ex=ttl)
+                await pipe.execute()
+        except Exception as e:
+            log.error(f"Ошибка при добавлении {len(users)} пользователей: {e}")
+            return False
+        return True
+
+    async def delete_users(self, user_ids: Iterable[UUID]) -> int:
+        """Delete many users with one DEL, returns the number of deleted keys"""
+        keys = [self._key(user_id) for user_id in user_ids]
+        if not keys:
+            return 0
+        try:
+            deleted = await self.client.delete(*keys)
+        except Exception as e:
+            log.error(f"Ошибка при удалении {len(keys)} пользователей: {e}")
+            return 0
+        if deleted < len(keys):
+            log.warning(f"Удалено {deleted} из {len(keys)} пользователей. Остальные не найдены")
+        return deleted
+
+
+async_redis_user_repository = AsyncRedisUserRepository(async_redis_client)
@@ -1,4 +1,8 @@
-from sqlalchemy import select
+from typing import Iterable, Sequence
+
+from pydantic import UUID4
+from sqlalchemy import select, any_, literal, Uuid
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from src.models.user import User
 from src.utils.repository import SqlAlchemyRepository
@@ -14,3 +18,21 @@ class UserRepository(SqlAlchemyRepository[User]):
         )
         res = await self._session.execute(query)
         return res.scalar_one_or_none()
+
+    async def get_existing_ids(self, user_ids: Iterable[UUID4]) -> set[UUID4]:
+        """Get the subset of user_ids that exist, with a single `id = ANY(...)` query"""
+        query = (
+            select(self._model.id)
+            .filter(self._model.id == any_(literal(list(user_ids), ARRAY(Uuid))))
+        )
+        res = await self._session.execute(query)
+        return set(res.scalars().all())
+
+    async def get_users_by_ids(self, user_ids: Iterable[UUID4]) -> Sequence[User]:
+        """Get users by IDs with a single `id = ANY(...)` query"""
+        query = (
+            select(self._model)
+            .filter(self._model.id == any_(literal(list(user_ids), ARRAY(Uuid))))
+        )
+        res = await self._session.execute(query)
+        return res.scalars().all()
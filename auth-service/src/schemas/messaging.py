@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, Field, EmailStr
 
 
 class BaseMessage(BaseModel):
@@ -19,6 +19,31 @@ class UserExists(BaseMessage):
     data: UserExistsData
 
 
+class UsersExistData(BaseModel):
+    user_ids: list[UUID]
+    existence: dict[UUID, bool] = Field(default_factory=dict)
+
+
+class UsersExist(BaseMessage):
+    type: str = "users_exist"
+    data: UsersExistData
+
+
+class UserInfo(BaseModel):
+    full_name: str
+    email: str
+
+
+class UsersInfoData(BaseModel):
+    user_ids: list[UUID]
+    users: dict[UUID, UserInfo] = Field(default_factory=dict)
+
+
+class UsersInfo(BaseMessage):
+    type: str = "users_info"
+    data: UsersInfoData
+
+
 class TasksForUserData(UserID):
     count_authored_tasks: int = 0
     count_assigned_tasks: int = 0
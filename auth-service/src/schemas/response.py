@@ -1,3 +1,6 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from starlette.status import HTTP_200_OK, HTTP_201_CREATED
 
@@ -10,4 +13,15 @@ class BaseResponse(BaseModel):
 class BaseCreateResponse(BaseModel):
     status: int = HTTP_201_CREATED
     error: bool = False
-    
\ No newline at end of file
+
+
+class PydanticJSONResponse(JSONResponse):
+    """Renders a response model straight to JSON bytes with its pydantic-core serializer.
+    Returning it from a route skips the `response_model` validation and serialization,
+    `response_model` is then only used for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return super().render(content)
@@ -1,4 +1,8 @@
 import datetime
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any
 
 import bcrypt
@@ -41,6 +45,75 @@ def decode_jwt(
     return decoded
 
 
+@dataclass
+class TokenCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+class VerifiedTokenCache:
+    """Bounded LRU cache of verified JWT claims.
+
+    Keys are SHA-256 digests of tokens, so the tokens themselves are not kept in memory.
+    An entry is dropped once the token's `exp` has passed.
+    """
+
+    def __init__(self, max_size: int = settings.auth_jwt.verified_cache_size) -> None:
+        self.max_size = max_size
+        self.stats = TokenCacheStats()
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        expire, claims = entry
+        if expire <= time.time():
+            del self._entries[key]
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return claims.copy()
+
+    def set(self, token: str, claims: dict[str, Any]) -> None:
+        expire = claims.get("exp")
+        if not isinstance(expire, (int, float)) or expire <= time.time():
+            return
+
+        key = self._key(token)
+        self._entries[key] = (expire, claims.copy())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+verified_token_cache = VerifiedTokenCache()
+
+
+def decode_jwt_cached(token: str, cache: VerifiedTokenCache = verified_token_cache) -> dict[str, Any]:
+    """Decode a token, skipping signature verification for recently verified ones"""
+    claims = cache.get(token)
+    if claims is None:
+        claims = decode_jwt(token)
+        cache.set(token, claims)
+    return claims
+
+
 def hash_password(password: str) -> bytes:
     salt = bcrypt.gensalt()
     return bcrypt.hashpw(password.encode(), salt)
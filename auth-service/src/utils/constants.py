@@ -1,5 +1,6 @@
 USER_NOT_FOUND_MSG = "User not found"
 USER_EXISTS_MSG = "User with this email exists"
+SERVICE_OVERLOADED_MSG = "Service is overloaded, try again later"
 
 USER_REGISTERED_SUBJECT = "TMS registration"
 USER_REGISTERED_MSG = "Thank you for registering. Your account has been successfully created"
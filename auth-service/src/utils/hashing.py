@@ -0,0 +1,97 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+from src.config import settings
+from src.utils.auth_jwt import hash_password, verify_password
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class HashingQueueFull(Exception):
+    """Raised when too many hashing calls are already waiting"""
+
+
+@dataclass
+class HashingStats:
+    """Counters and queue wait time of the password hasher"""
+    completed: int = 0
+    rejected: int = 0
+    pending: int = 0
+    queue_wait_total: float = 0.0
+    queue_wait_max: float = 0.0
+
+    @property
+    def queue_wait_avg(self) -> float:
+        return self.queue_wait_total / self.completed if self.completed else 0.0
+
+
+class PasswordHasher:
+    """Runs bcrypt hashing and verification in a thread pool.
+
+    bcrypt releases the GIL while hashing, so worker threads run in parallel
+    and the event loop stays free. At most `max_workers + max_queue_size` calls
+    may be pending, the next one raises HashingQueueFull instead of waiting.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = settings.hashing_settings.HASHING_MAX_WORKERS,
+        max_queue_size: int = settings.hashing_settings.HASHING_MAX_QUEUE_SIZE,
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.stats = HashingStats()
+        self._executor: ThreadPoolExecutor | None = None
+
+    async def hash_password(self, password: str) -> bytes:
+        return await self._run(hash_password, password)
+
+    async def verify_password(self, password: str, hashed_password: bytes) -> bool:
+        return await self._run(verify_password, password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        if self.stats.pending >= self.max_workers + self.max_queue_size:
+            self.stats.rejected += 1
+            log.warning(f"Password hashing queue is full ({self.stats.pending} pending)")
+            raise HashingQueueFull()
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="hashing")
+
+        submitted_at = time.perf_counter()
+
+        def run() -> tuple[T, float]:
+            queue_wait = time.perf_counter() - submitted_at
+            return func(*args), queue_wait
+
+        self.stats.pending += 1
+        try:
+            result, queue_wait = await asyncio.get_running_loop().run_in_executor(self._executor, run)
+        finally:
+            self.stats.pending -= 1
+
+        self.stats.completed += 1
+        self.stats.queue_wait_total += queue_wait
+        self.stats.queue_wait_max = max(self.stats.queue_wait_max, queue_wait)
+        return result
+
+
+_password_hasher = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher()
+    return _password_hasher
@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
 from types import TracebackType
-from typing import Never, Type, Any
+from typing import Any, Awaitable, Callable, Never, Type
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import async_session_factory
+from src.repositories.outbox import OutboxRepository
 from src.repositories.user import UserRepository
 from src.schemas.response import BaseCreateResponse
 
@@ -13,6 +14,7 @@ class AbstractUnitOfWork(ABC):
     """Abstract base class for unit of work"""
     is_open: bool = False
     user: UserRepository
+    outbox: OutboxRepository
 
     @abstractmethod
     def __init__(self) -> Never:
@@ -39,14 +41,20 @@ class AbstractUnitOfWork(ABC):
     async def rollback(self) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], Awaitable[Any]]) -> None:
+        raise NotImplementedError
+
 
 class UnitOfWork(AbstractUnitOfWork):
     """The class responsible for the atomicity of transactions."""
 
     __slots__ = (
         "_session",
+        "_after_commit",
         "is_open",
         "user",
+        "outbox",
     )
 
     def __init__(self) -> None:
@@ -55,6 +63,8 @@ class UnitOfWork(AbstractUnitOfWork):
     async def __aenter__(self) -> None:
         self._session: AsyncSession = async_session_factory()
         self.user = UserRepository(session=self._session)
+        self.outbox = OutboxRepository(session=self._session)
+        self._after_commit: list[Callable[[], Awaitable[Any]]] = []
         self.is_open = True
 
     async def __aexit__(
@@ -63,12 +73,21 @@ class UnitOfWork(AbstractUnitOfWork):
         exc_val: BaseCreateResponse | None,
         exc_tb: TracebackType | None
     ) -> None:
-        if not exc_type:
-            await self._session.commit()
-        else:
-            await self.rollback()
-        await self._session.close()
-        self.is_open = False
+        committed = False
+        try:
+            if not exc_type:
+                await self._session.commit()
+                committed = True
+            else:
+                await self.rollback()
+            await self._session.close()
+        finally:
+            self.is_open = False
+            callbacks, self._after_commit = self._after_commit, []
+
+        if committed:
+            for callback in callbacks:
+                await callback()
 
     async def flush(self) -> None:
         await self._session.flush()
@@ -76,6 +95,10 @@ class UnitOfWork(AbstractUnitOfWork):
     async def rollback(self) -> None:
         await self._session.rollback()
 
+    def after_commit(self, callback: Callable[[], Awaitable[Any]]) -> None:
+        """Run the callback once the transaction is committed, it is dropped on rollback"""
+        self._after_commit.append(callback)
+
     async def session_add(self, obj: Any) -> None:
         self._session.add(obj)
 
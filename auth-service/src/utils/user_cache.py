@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import random
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterable
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from src.config import settings
+from src.database.redis_db import async_redis_client
+from src.repositories.redis_repository import AsyncRedisUserRepository
+from src.schemas.user import UserDB
+
+log = logging.getLogger(__name__)
+
+UserLoader = Callable[[], Awaitable[UserDB | None]]
+
+
+@dataclass
+class UserCacheStats:
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+
+
+class UserCache:
+    """Read-through cache of UserDB snapshots in Redis.
+
+    Snapshots are stored as JSON with a TTL plus random jitter, so entries written
+    together do not expire together. Concurrent misses for the same user share one
+    load. Redis errors are logged and treated as misses, so the database stays the
+    source of truth.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncRedisUserRepository,
+        ttl: int = settings.USER_CACHE_TTL,
+        ttl_jitter: int = settings.USER_CACHE_TTL_JITTER,
+    ) -> None:
+        self.repository = repository
+        self.ttl = ttl
+        self.ttl_jitter = ttl_jitter
+        self.stats = UserCacheStats()
+        self._loading: dict[UUID, asyncio.Future[UserDB | None]] = {}
+
+    def _ttl(self) -> int:
+        return self.ttl + random.randint(0, self.ttl_jitter)
+
+    async def get(self, user_id: UUID) -> UserDB | None:
+        return (await self.get_many([user_id]))[user_id]
+
+    async def get_many(self, user_ids: Iterable[UUID]) -> dict[UUID, UserDB | None]:
+        """Get cached users with one round trip, missing ones are None"""
+        user_ids = list(user_ids)
+        try:
+            values = await self.repository.get_users(user_ids)
+        except RedisError as e:
+            self.stats.errors += 1
+            log.warning(f"Failed get {len(user_ids)} users from cache: {e}")
+            return dict.fromkeys(user_ids)
+
+        res = {}
+        for user_id in user_ids:
+            data = values.get(user_id)
+            if data is None:
+                self.stats.misses += 1
+                res[user_id] = None
+            else:
+                self.stats.hits += 1
+                res[user_id] = UserDB.model_validate_json(data)
+        return res
+
+    async def set(self, user: UserDB) -> None:
+        await self.set_many([user])
+
+    async def set_many(self, users: Iterable[UserDB]) -> None:
+        """Put users with one pipeline, each with its own jittered TTL"""
+        users = list(users)
+        if not await self.repository.set_users(
+            {user.id: user.model_dump_json() for user in users},
+            ex={user.id: self._ttl() for user in users},
+        ):
+            self.stats.errors += 1
+
+    async def invalidate(self, *user_ids: UUID) -> None:
+        await self.repository.delete_users(user_ids)
+
+    async def get_or_load(self, user_id: UUID, loader: UserLoader) -> UserDB | None:
+        """Return the cached user or load it once for all concurrent callers.
+        If the loading caller is cancelled, the waiting ones retry the load themselves.
+        """
+        user = await self.get(user_id)
+        if user is not None:
+            return user
+
+        loading = self._loading.get(user_id)
+        if loading is not None:
+            try:
+                return await asyncio.shield(loading)
+            except asyncio.CancelledError:
+                if not loading.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            return await self.get_or_load(user_id, loader)
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[user_id] = future
+        try:
+            user = await loader()
+            if user is not None:
+                await self.set(user)
+            future.set_result(user)
+            return user
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            self._loading.pop(user_id, None)
+
+
+user_cache = UserCache(AsyncRedisUserRepository(async_redis_client, key_prefix="user_profile"))
@@ -1,10 +1,13 @@
-from typing import Any, Sequence
+from typing import Any, Awaitable, Callable, Iterable, Sequence
 from uuid import UUID, uuid4
 from types import TracebackType
 
 from src.api.v1.services.user import UserService
 
+from src.models.outbox import OutboxMessage
 from src.models.user import User
+from src.repositories.redis_repository import AsyncRedisUserRepository
+from src.utils.user_cache import UserCache
 
 from tests.fixtures import db_mocks
 
@@ -34,6 +37,86 @@ class FakeUserRepository:
         self.users.append(user)
         return user
 
+    async def get_existing_ids(self, user_ids: Iterable[UUID]) -> set[UUID]:
+        user_ids = set(user_ids)
+        return {user.id for user in self.users if user.id in user_ids}
+
+    async def get_users_by_ids(self, user_ids: Iterable[UUID]) -> Sequence[User]:
+        user_ids = set(user_ids)
+        return [user for user in self.users if user.id in user_ids]
+
+    async def update_one_by_id(self, obj_id: UUID, **kwargs: Any) -> User | None:
+        user = await self.get_one_by_id_or_none(obj_id)
+        if user is None:
+            return None
+        for k, v in kwargs.items():
+            setattr(user, k, v)
+        return user
+
+    async def delete_one_by_id(self, obj_id: UUID) -> None:
+        self.users = [user for user in self.users if user.id != obj_id]
+
+
+class FakeRedis:
+    """Test class for overriding the async Redis client, TTLs are ignored."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> bool:
+        self.data[key] = value
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Test class for overriding a Redis pipeline, buffers SET commands."""
+
+    def __init__(self, client: FakeRedis) -> None:
+        self.client = client
+        self.commands: list[tuple[str, str, int | None]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.commands.clear()
+
+    def set(self, key: str, value: str, ex: int | None = None) -> "FakePipeline":
+        self.commands.append((key, value, ex))
+        return self
+
+    async def execute(self) -> list[bool]:
+        return [await self.client.set(*command) for command in self.commands]
+
+
+class FakeOutboxRepository:
+    """Test class for overriding the standard OutboxRepository."""
+
+    def __init__(self) -> None:
+        self.messages: list[OutboxMessage] = []
+
+    async def add_message(self, routing_key: str, body: str) -> None:
+        self.messages.append(OutboxMessage(id=len(self.messages) + 1, routing_key=routing_key, body=body))
+
+    async def get_batch(self, limit: int) -> Sequence[OutboxMessage]:
+        return self.messages[:limit]
+
+    async def delete_messages(self, message_ids: Iterable[int]) -> None:
+        message_ids = set(message_ids)
+        self.messages = [message for message in self.messages if message.id not in message_ids]
+
 
 class FakeUnitOfWork:
     """Test class for overriding the standard UnitOfWork.
@@ -46,9 +129,11 @@ class FakeUnitOfWork:
     ) -> None:
         self.is_open: bool = False
         self.user = FakeUserRepository(users)
+        self.outbox = FakeOutboxRepository()
+        self._after_commit: list[Callable[[], Awaitable[Any]]] = []
 
     async def __aenter__(self) -> None:
-        pass
+        self.is_open = True
 
     async def __aexit__(
         self,
@@ -56,7 +141,14 @@ class FakeUnitOfWork:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        pass
+        self.is_open = False
+        callbacks, self._after_commit = self._after_commit, []
+        if not exc_type:
+            for callback in callbacks:
+                await callback()
+
+    def after_commit(self, callback: Callable[[], Awaitable[Any]]) -> None:
+        self._after_commit.append(callback)
 
     def get_users(self) -> list[User]:
         return self.user.get_users()
@@ -67,3 +159,4 @@ class FakeUserService(UserService):
     def __init__(self, uow: FakeUnitOfWork) -> None:
         super().__init__()
         self.uow = uow
+        self.user_cache = UserCache(AsyncRedisUserRepository(FakeRedis()))
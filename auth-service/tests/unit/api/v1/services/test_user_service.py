@@ -1,9 +1,12 @@
 """Contains tests for user services."""
+from uuid import uuid4
 
 import pytest
 
+from src.messaging import queues_names
+from src.schemas.messaging import EmailNotification
 from src.schemas.user import CreateUserRequest, UserDB
-from src.utils import auth_jwt
+from src.utils import auth_jwt, constants
 from tests.fixtures import FakeUserService, FakeUnitOfWork
 from tests.utils import compare_dicts_and_models, BaseTestCase
 from tests.fixtures import testing_cases
@@ -31,6 +34,18 @@ class TestUserService:
             result = await service.create_user(user, user_id=case.data["id"])
             assert compare_dicts_and_models([result], case.expected_data, UserDB)
 
+    async def test_create_user_queues_email_notification(self, fake_uow_with_users: FakeUnitOfWork) -> None:
+        service = self.__get_service(fake_uow_with_users)
+        user = CreateUserRequest(full_name="Egor", email="egr@example.com", password="Test_pass123!")
+
+        await service.create_user(user, user_id=uuid4())
+
+        messages = fake_uow_with_users.outbox.messages
+        assert [message.routing_key for message in messages] == [queues_names.EMAIL_NOTIFICATIONS]
+        notification = EmailNotification.model_validate_json(messages[0].body)
+        assert notification.data.email_to == user.email
+        assert notification.data.subject == constants.USER_REGISTERED_SUBJECT
+
     @pytest.mark.parametrize(
         "case", testing_cases.TEST_USER_SERVICE_AUTHENTICATE_USER_PARAMS,
         ids=[case.description for case in testing_cases.TEST_USER_SERVICE_AUTHENTICATE_USER_PARAMS]
@@ -74,4 +89,29 @@ class TestUserService:
             if not token:
                 token = auth_jwt.encode_jwt(**case.data)
             result = await service.get_current_user(token)
-            assert compare_dicts_and_models([result], case.expected_data, UserDB)
\ No newline at end of file
+            assert compare_dicts_and_models([result], case.expected_data, UserDB)
+
+    async def test_update_invalidates_cache_after_commit(self, fake_uow_with_users: FakeUnitOfWork) -> None:
+        service = self.__get_service(fake_uow_with_users)
+        user = fake_uow_with_users.get_users()[0]
+        await service.user_cache.set(user.to_schema())
+
+        async with fake_uow_with_users:
+            await service.update_one_by_id(user.id, full_name="Renamed")
+            assert await service.user_cache.get(user.id) is not None
+        assert await service.user_cache.get(user.id) is None
+
+        await service.user_cache.set(user.to_schema())
+        await service.delete_one_by_id(user.id)
+        assert await service.user_cache.get(user.id) is None
+
+    async def test_rolled_back_update_keeps_cache(self, fake_uow_with_users: FakeUnitOfWork) -> None:
+        service = self.__get_service(fake_uow_with_users)
+        user = fake_uow_with_users.get_users()[0]
+        await service.user_cache.set(user.to_schema())
+
+        with pytest.raises(RuntimeError):
+            async with fake_uow_with_users:
+                await service.update_one_by_id(user.id, full_name="Renamed")
+                raise RuntimeError("rollback")
+        assert await service.user_cache.get(user.id) is not None
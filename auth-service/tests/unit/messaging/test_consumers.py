@@ -0,0 +1,41 @@
+"""Contains tests for the RPC handlers of auth-service."""
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.messaging import consumers
+from src.schemas.messaging import UsersExist, UsersExistData, UsersInfo, UsersInfoData
+from tests.fixtures import FakeUnitOfWork
+
+
+@pytest.fixture
+def patch_uow(monkeypatch: pytest.MonkeyPatch, fake_uow_with_users: FakeUnitOfWork) -> FakeUnitOfWork:
+    monkeypatch.setattr(consumers, "UnitOfWork", lambda: fake_uow_with_users)
+    return fake_uow_with_users
+
+
+class TestConsumers:
+    async def test_handle_users_existence(self, patch_uow: FakeUnitOfWork) -> None:
+        user_id, unknown_id = patch_uow.get_users()[0].id, uuid4()
+        body = UsersExist(data=UsersExistData(user_ids=[user_id, unknown_id]))
+
+        reply = await consumers.handle_users_existence(MagicMock(body=body.model_dump_json().encode()))
+
+        assert reply.data.existence == {user_id: True, unknown_id: False}
+
+    async def test_handle_users_info(self, patch_uow: FakeUnitOfWork) -> None:
+        user, unknown_id = patch_uow.get_users()[0], uuid4()
+        body = UsersInfo(data=UsersInfoData(user_ids=[user.id, unknown_id]))
+
+        reply = await consumers.handle_users_info(MagicMock(body=body.model_dump_json().encode()))
+
+        assert list(reply.data.users) == [user.id]
+        assert reply.data.users[user.id].email == user.email
+
+    async def test_handle_users_existence_with_no_ids(self, patch_uow: FakeUnitOfWork) -> None:
+        body = UsersExist(data=UsersExistData(user_ids=[]))
+
+        reply = await consumers.handle_users_existence(MagicMock(body=body.model_dump_json().encode()))
+
+        assert reply.data.existence == {}
@@ -0,0 +1,84 @@
+"""Contains tests for the outbox relay."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aio_pika.exceptions import DeliveryError
+
+from src.messaging import connection, queues_names
+from src.messaging.connection import ChannelPool
+from src.messaging.outbox_relay import OutboxRelay
+from tests.fixtures import FakeUnitOfWork
+
+
+def make_relay(
+    uow: FakeUnitOfWork,
+    monkeypatch: pytest.MonkeyPatch,
+    fail_ids: set[str] = frozenset(),
+) -> tuple[OutboxRelay, MagicMock]:
+    channel = MagicMock(is_closed=False)
+
+    async def publish(message, routing_key):
+        if message.message_id in fail_ids:
+            raise DeliveryError(None, MagicMock())
+
+    channel.default_exchange.publish = AsyncMock(side_effect=publish)
+    conn = MagicMock()
+    conn.channel = AsyncMock(return_value=channel)
+    monkeypatch.setattr(connection, "get_connection", AsyncMock(return_value=conn))
+    relay = OutboxRelay(uow_factory=lambda: uow, channel_pool=ChannelPool(size=2), batch_size=10)
+    return relay, channel
+
+
+@pytest.fixture
+def fake_uow() -> FakeUnitOfWork:
+    return FakeUnitOfWork()
+
+
+class TestOutboxRelay:
+    async def test_relay_batch(self, fake_uow: FakeUnitOfWork, monkeypatch: pytest.MonkeyPatch) -> None:
+        for idx in range(3):
+            await fake_uow.outbox.add_message(queues_names.EMAIL_NOTIFICATIONS, f'{{"idx": {idx}}}')
+        relay, channel = make_relay(fake_uow, monkeypatch)
+
+        assert await relay.relay_batch() == 3
+
+        channel.declare_queue.assert_not_called()
+        published = [call.args[0] for call in channel.default_exchange.publish.await_args_list]
+        assert [message.body for message in published] == [f'{{"idx": {idx}}}'.encode() for idx in range(3)]
+        assert [message.message_id for message in published] == ["1", "2", "3"]
+        assert fake_uow.outbox.messages == []
+        assert await relay.relay_batch() == 0
+
+    async def test_relay_batch_keeps_unconfirmed_messages(
+        self,
+        fake_uow: FakeUnitOfWork,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        for idx in range(3):
+            await fake_uow.outbox.add_message(queues_names.EMAIL_NOTIFICATIONS, "{}")
+        relay, _ = make_relay(fake_uow, monkeypatch, fail_ids={"2"})
+
+        assert await relay.relay_batch() == 2
+
+        assert [message.id for message in fake_uow.outbox.messages] == [2]
+        assert relay.stats.published == 2
+        assert relay.stats.failed == 1
+
+    async def test_channel_pool_replaces_closed_channels(
+        self,
+        fake_uow: FakeUnitOfWork,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        relay, channel = make_relay(fake_uow, monkeypatch)
+        pool = relay.channel_pool
+
+        async with pool.acquire() as first:
+            pass
+        async with pool.acquire() as second:
+            assert second is first
+        assert connection.get_connection.await_count == 1
+
+        channel.is_closed = True
+        async with pool.acquire():
+            pass
+        assert connection.get_connection.await_count == 2
@@ -0,0 +1,37 @@
+"""Contains tests for the RPC consumer runtime."""
+from unittest.mock import AsyncMock, MagicMock
+
+from src.messaging.runtime import RpcConsumer
+
+
+def make_message(delivery_tag: int) -> MagicMock:
+    message = MagicMock()
+    message.delivery_tag = delivery_tag
+    message.reply_to = None
+    message.body = b"{}"
+    message.ack = AsyncMock()
+    message.nack = AsyncMock()
+    return message
+
+
+class TestRpcConsumer:
+    async def test_channel_reopen_drops_old_deliveries(self) -> None:
+        consumer = RpcConsumer("test_queue", AsyncMock(side_effect=[None, None, ValueError("boom")]))
+        old_messages = [make_message(tag) for tag in (1, 2)]
+        consumer._unsettled.update((1, 2))
+
+        consumer._on_channel_reopen(MagicMock())
+        new_message = make_message(1)
+        consumer._unsettled.add(1)
+        await consumer._process(MagicMock(), new_message, consumer._generation)
+        await consumer._process(MagicMock(), old_messages[1], 0)
+        await consumer._process(MagicMock(), old_messages[0], 0)
+        await consumer._flush_acks()
+
+        new_message.ack.assert_awaited_once_with(multiple=True)
+        for message in old_messages:
+            message.ack.assert_not_awaited()
+            message.nack.assert_not_awaited()
+        assert not consumer._unsettled
+        assert not consumer._completed
+        assert (consumer.stats.processed, consumer.stats.failed) == (2, 1)
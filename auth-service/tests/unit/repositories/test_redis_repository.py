@@ -0,0 +1,41 @@
+"""Contains tests for the async Redis user repository."""
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from src.repositories.redis_repository import AsyncRedisUserRepository
+from tests.fixtures import FakeRedis
+
+
+class TestAsyncRedisUserRepository:
+    async def test_bulk_operations(self) -> None:
+        client = FakeRedis()
+        client.mget = AsyncMock(wraps=client.mget)
+        repository = AsyncRedisUserRepository(client)
+        users = {uuid4(): f"User {idx}" for idx in range(3)}
+        missing_id = uuid4()
+
+        assert await repository.set_users(users, ex=60)
+        assert await repository.get_users([*users, missing_id]) == {**users, missing_id: None}
+        assert client.mget.await_count == 1
+
+        assert await repository.delete_users([*users, missing_id]) == 3
+        assert await repository.get_users(users) == dict.fromkeys(users)
+
+    async def test_single_key_operations(self) -> None:
+        repository = AsyncRedisUserRepository(FakeRedis(), key_prefix="user_profile")
+        user_id = uuid4()
+
+        assert await repository.set_user(user_id, "User")
+        assert await repository.get_user(user_id) == "User"
+        assert repository.client.data == {f"user_profile:{user_id}": "User"}
+        assert await repository.delete_user(user_id)
+        assert not await repository.delete_user(user_id)
+
+    async def test_empty_batches_skip_redis(self) -> None:
+        client = AsyncMock()
+        repository = AsyncRedisUserRepository(client)
+
+        assert await repository.get_users([]) == {}
+        assert await repository.set_users({})
+        assert await repository.delete_users([]) == 0
+        assert not client.mock_calls
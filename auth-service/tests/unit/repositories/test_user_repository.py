@@ -0,0 +1,34 @@
+"""Contains tests for the user repository."""
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repositories.user import UserRepository
+
+
+class TestUserRepository:
+    async def test_get_existing_ids(
+        self,
+        transaction_session: AsyncSession,
+        setup_users: None,
+        users: tuple[dict],
+    ) -> None:
+        repository = UserRepository(transaction_session)
+        user_ids = [user["id"] for user in users]
+        unknown_id = uuid4()
+
+        assert await repository.get_existing_ids([*user_ids, unknown_id]) == set(user_ids)
+        assert await repository.get_existing_ids([unknown_id]) == set()
+        assert await repository.get_existing_ids([]) == set()
+
+    async def test_get_users_by_ids(
+        self,
+        transaction_session: AsyncSession,
+        setup_users: None,
+        users: tuple[dict],
+    ) -> None:
+        repository = UserRepository(transaction_session)
+        found = await repository.get_users_by_ids([users[0]["id"], uuid4()])
+
+        assert [(user.id, user.email) for user in found] == [(users[0]["id"], users[0]["email"])]
+        assert await repository.get_users_by_ids([]) == []
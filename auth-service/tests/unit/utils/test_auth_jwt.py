@@ -0,0 +1,57 @@
+"""Contains tests for the verified token cache."""
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from jose import JWTError
+
+from src.utils import auth_jwt
+from src.utils.auth_jwt import VerifiedTokenCache, decode_jwt_cached
+
+
+class TestVerifiedTokenCache:
+    def test_repeat_decode_skips_verification(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache = VerifiedTokenCache(max_size=10)
+        token = auth_jwt.encode_jwt({"sub": "user"})
+        decode_mock = MagicMock(wraps=auth_jwt.decode_jwt)
+        monkeypatch.setattr(auth_jwt, "decode_jwt", decode_mock)
+
+        first = decode_jwt_cached(token, cache)
+        second = decode_jwt_cached(token, cache)
+
+        assert first == second
+        assert first["sub"] == "user"
+        assert decode_mock.call_count == 1
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_invalid_token_is_not_cached(self) -> None:
+        cache = VerifiedTokenCache(max_size=10)
+        for _ in range(2):
+            with pytest.raises(JWTError):
+                decode_jwt_cached("invalid-token", cache)
+        assert len(cache) == 0
+        assert cache.stats.misses == 2
+
+    def test_entry_expires_at_exp(self) -> None:
+        cache = VerifiedTokenCache(max_size=10)
+        cache.set("token", {"sub": "user", "exp": time.time() + 60})
+        assert cache.get("token") == {"sub": "user", "exp": pytest.approx(time.time() + 60, abs=1)}
+
+        cache.set("expired", {"sub": "user", "exp": time.time() - 1})
+        assert cache.get("expired") is None
+
+        cache._entries[cache._key("token")] = (time.time() - 1, {"sub": "user"})
+        assert cache.get("token") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = VerifiedTokenCache(max_size=2)
+        exp = time.time() + 60
+        cache.set("first", {"exp": exp})
+        cache.set("second", {"exp": exp})
+        cache.get("first")
+        cache.set("third", {"exp": exp})
+
+        assert cache.get("second") is None
+        assert cache.get("first") is not None
+        assert cache.get("third") is not None
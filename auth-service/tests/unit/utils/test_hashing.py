@@ -0,0 +1,36 @@
+"""Contains tests for the password hasher."""
+import asyncio
+import threading
+
+import pytest
+
+from src.utils.hashing import PasswordHasher, HashingQueueFull
+
+
+class TestPasswordHasher:
+    async def test_hash_and_verify(self) -> None:
+        hasher = PasswordHasher(max_workers=2, max_queue_size=2)
+        hashed = await hasher.hash_password("password")
+
+        assert await hasher.verify_password("password", hashed)
+        assert not await hasher.verify_password("wrong_password", hashed)
+        assert hasher.stats.completed == 3
+        assert hasher.stats.pending == 0
+        assert hasher.stats.queue_wait_max >= hasher.stats.queue_wait_avg >= 0
+        hasher.shutdown()
+
+    async def test_rejects_when_queue_is_full(self) -> None:
+        hasher = PasswordHasher(max_workers=1, max_queue_size=1)
+        release = threading.Event()
+        blocked = [asyncio.create_task(hasher._run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(HashingQueueFull):
+            await hasher.hash_password("password")
+        assert hasher.stats.rejected == 1
+
+        release.set()
+        await asyncio.gather(*blocked)
+        assert hasher.stats.pending == 0
+        assert await hasher.hash_password("password")
+        hasher.shutdown()
@@ -0,0 +1,88 @@
+"""Contains tests for the Redis user cache."""
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from redis.exceptions import ConnectionError
+
+from src.repositories.redis_repository import AsyncRedisUserRepository
+from src.schemas.user import UserDB
+from src.utils.user_cache import UserCache
+from tests.fixtures import FakeRedis
+
+
+def make_user() -> UserDB:
+    return UserDB(id=uuid4(), full_name="Ivanov Ivan", email="ivanov@example.com")
+
+
+class TestUserCache:
+    async def test_read_through(self) -> None:
+        cache = UserCache(AsyncRedisUserRepository(FakeRedis()))
+        user = make_user()
+        loader = AsyncMock(return_value=user)
+
+        assert await cache.get_or_load(user.id, loader) == user
+        assert await cache.get_or_load(user.id, loader) == user
+        assert loader.await_count == 1
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    async def test_concurrent_misses_share_one_load(self) -> None:
+        cache = UserCache(AsyncRedisUserRepository(FakeRedis()))
+        user = make_user()
+
+        async def loader() -> UserDB:
+            await asyncio.sleep(0.01)
+            return user
+
+        loader_mock = AsyncMock(side_effect=loader)
+        results = await asyncio.gather(*(cache.get_or_load(user.id, loader_mock) for _ in range(10)))
+
+        assert results == [user] * 10
+        assert loader_mock.await_count == 1
+
+    async def test_cancelled_load_is_retried_by_waiting_caller(self) -> None:
+        cache = UserCache(AsyncRedisUserRepository(FakeRedis()))
+        user = make_user()
+        started = asyncio.Event()
+
+        async def loader() -> UserDB:
+            started.set()
+            await asyncio.sleep(0.01)
+            return user
+
+        loader_mock = AsyncMock(side_effect=loader)
+        leader = asyncio.create_task(cache.get_or_load(user.id, loader_mock))
+        await started.wait()
+        follower = asyncio.create_task(cache.get_or_load(user.id, loader_mock))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == user
+        assert leader.cancelled()
+        assert loader_mock.await_count == 2
+
+    async def test_get_many(self) -> None:
+        cache = UserCache(AsyncRedisUserRepository(FakeRedis()))
+        users = [make_user() for _ in range(3)]
+        await cache.set_many(users[:2])
+
+        cached = await cache.get_many(user.id for user in users)
+        assert cached == {users[0].id: users[0], users[1].id: users[1], users[2].id: None}
+        assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+
+    async def test_invalidate(self) -> None:
+        cache = UserCache(AsyncRedisUserRepository(FakeRedis()))
+        user = make_user()
+        await cache.set(user)
+        await cache.invalidate(user.id)
+        assert await cache.get(user.id) is None
+
+    async def test_redis_errors_fall_back_to_loader(self) -> None:
+        client = FakeRedis()
+        client.mget = AsyncMock(side_effect=ConnectionError())
+        client.set = AsyncMock(side_effect=ConnectionError())
+        cache = UserCache(AsyncRedisUserRepository(client))
+        user = make_user()
+
+        assert await cache.get_or_load(user.id, AsyncMock(return_value=user)) == user
+        assert cache.stats.errors == 2
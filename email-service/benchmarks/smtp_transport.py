@@ -0,0 +1,82 @@
+"""Compares an SMTP session per email with the pooled SmtpTransport.
+
+Runs offline against the local aiosmtpd sink, from the service root:
+    python -m benchmarks.smtp_transport --emails 500 --concurrency 1 4 16 64
+"""
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+import aiosmtplib
+
+from src.schemas.messaging import EmailNotificationData
+from src.transport.base import build_message
+from src.transport.smtp import SmtpTransport
+from src.transport.sink import start_sink
+
+HOST = "127.0.0.1"
+
+
+async def measure(
+    name: str,
+    emails: int,
+    concurrency: int,
+    send: Callable[[EmailNotificationData], Awaitable[object]],
+) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    data = [
+        EmailNotificationData(
+            email_to=f"user{idx}@example.com",
+            email_from="info@tms.com",
+            subject="Benchmark",
+            message=f"Benchmark message {idx}",
+        )
+        for idx in range(emails)
+    ]
+
+    async def send_one(item: EmailNotificationData) -> None:
+        async with semaphore:
+            await send(item)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(send_one(item) for item in data))
+    elapsed = time.perf_counter() - started
+    print(f"{name:<22} concurrency={concurrency:<4} {emails / elapsed:9.1f} emails/s")
+
+
+async def main(emails: int, concurrency: list[int], pool_size: int, port: int, login: bool) -> None:
+    controller = start_sink(HOST, port)
+    credentials = {"username": "benchmark", "password": "benchmark"} if login else {}
+    print(f"{emails} emails, pool_size={pool_size}, login={login}")
+    try:
+        for value in concurrency:
+            await measure(
+                "session per email", emails, value,
+                lambda item: aiosmtplib.send(
+                    build_message(item), hostname=HOST, port=port, start_tls=False, **credentials
+                ),
+            )
+
+            transport = SmtpTransport(
+                host=HOST, port=port, username=credentials.get("username"), password=credentials.get("password"),
+                start_tls=False, pool_size=min(pool_size, value),
+            )
+            try:
+                await measure("pooled transport", emails, value, transport.send)
+            finally:
+                await transport.close()
+        print(f"sink received {controller.handler.received} emails")
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--emails", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--pool-size", type=int, default=16)
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument("--login", action="store_true", help="Authenticate every session")
+    args = parser.parse_args()
+    asyncio.run(main(args.emails, args.concurrency, args.pool_size, args.port, args.login))
@@ -29,14 +29,37 @@ class RabbitMQSettings(EnvDict):
     RABBIT_PORT: int
     RABBIT_USER: str
     RABBIT_PASS: str
+    RABBIT_CHANNEL_POOL_SIZE: int = 8
+    RABBIT_PREFETCH_COUNT: int = 32
+    RABBIT_CONSUMER_CONCURRENCY: int = 16
+    RABBIT_MESSAGE_TIMEOUT: float = 30.0
+    RABBIT_DRAIN_TIMEOUT: float = 30.0
+    RABBIT_STATS_INTERVAL: float = 60.0
+    RABBIT_RETRY_DELAY: float = 1.0
+    RABBIT_RETRY_MAX_DELAY: float = 30.0
+    RABBIT_MAX_RETRIES: int = 5
 
     @property
     def RABBIT_URL(self):
         return f"amqp://{self.RABBIT_USER}:{self.RABBIT_PASS}@{self.RABBIT_HOST}:{self.RABBIT_PORT}//"
 
 
+class SmtpSettings(EnvDict):
+    EMAIL_TRANSPORT: str = "logging"
+    SMTP_HOST: str = "localhost"
+    SMTP_PORT: int = 25
+    SMTP_USER: str | None = None
+    SMTP_PASS: str | None = None
+    SMTP_USE_TLS: bool = False
+    SMTP_START_TLS: bool | None = None
+    SMTP_POOL_SIZE: int = 8
+    SMTP_TIMEOUT: float = 10.0
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100
+
+
 class Settings(EnvDict):
     rabbit_settings: RabbitMQSettings = RabbitMQSettings()
+    smtp_settings: SmtpSettings = SmtpSettings()
 
 
 settings = Settings()
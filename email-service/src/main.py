@@ -1,15 +1,34 @@
 import asyncio
 import logging
+import signal
 
 import config
 
+from src.messaging.connection import close_connection
 from src.messaging.consumers import send_message
+from src.messaging.topology import declare_topology
 
 log = logging.getLogger(__name__)
 
 
+async def main() -> None:
+    """Run the consumer until SIGINT or SIGTERM, then drain in-flight messages"""
+    await declare_topology()
+    task = asyncio.create_task(send_message())
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, task.cancel)
+
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await close_connection()
+
+
 if __name__ == "__main__":
     try:
-        asyncio.run(send_message())
+        asyncio.run(main())
     except (asyncio.CancelledError, KeyboardInterrupt) as e:
         pass
@@ -1,8 +1,15 @@
-from aio_pika import connect_robust
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Sequence
+
+from aio_pika import Message, connect_robust
 from aio_pika.abc import AbstractConnection, AbstractChannel
 
 from src.config import settings
 
+log = logging.getLogger(__name__)
+
 _rabbit_connection = None
 
 
@@ -16,3 +23,84 @@ async def get_connection() -> AbstractConnection:
 async def get_channel() -> AbstractChannel:
     conn = await get_connection()
     return await conn.channel()
+
+
+class ChannelPool:
+    """Pool of publisher-confirms channels on the shared robust connection.
+
+    Up to `size` channels are opened lazily and reused by producers. A channel
+    is checked on acquire and release, closed ones are dropped and replaced.
+    """
+
+    def __init__(self, size: int = settings.rabbit_settings.RABBIT_CHANNEL_POOL_SIZE) -> None:
+        self.size = size
+        self._idle: asyncio.LifoQueue[AbstractChannel] = asyncio.LifoQueue()
+        self._slots = asyncio.Semaphore(size)
+        self._channels: set[AbstractChannel] = set()
+
+    async def _get_idle(self) -> AbstractChannel | None:
+        while not self._idle.empty():
+            channel = self._idle.get_nowait()
+            if not channel.is_closed:
+                return channel
+            self._channels.discard(channel)
+            log.warning("Dropped a closed channel from the pool")
+        return None
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[AbstractChannel]:
+        async with self._slots:
+            channel = await self._get_idle()
+            if channel is None:
+                conn = await get_connection()
+                channel = await conn.channel(publisher_confirms=True)
+                self._channels.add(channel)
+            try:
+                yield channel
+            finally:
+                if channel.is_closed:
+                    self._channels.discard(channel)
+                else:
+                    self._idle.put_nowait(channel)
+
+    async def publish_batch(self, messages: Sequence[tuple[str, Message]]) -> list[BaseException | None]:
+        """Publish (routing_key, message) pairs to the default exchange on one channel.
+        Publishes are sent back to back and their confirms are awaited together, so a batch
+        costs one round trip. Returns None or the error of each message, in order.
+        """
+        if not messages:
+            return []
+
+        async with self.acquire() as channel:
+            results = await asyncio.gather(
+                *(channel.default_exchange.publish(message, routing_key=routing_key)
+                  for routing_key, message in messages),
+                return_exceptions=True,
+            )
+        return [result if isinstance(result, BaseException) else None for result in results]
+
+    async def close(self) -> None:
+        for channel in self._channels:
+            if not channel.is_closed:
+                await channel.close()
+        self._channels.clear()
+        self._idle = asyncio.LifoQueue()
+
+
+_channel_pool = None
+
+
+def get_channel_pool() -> ChannelPool:
+    global _channel_pool
+    if _channel_pool is None:
+        _channel_pool = ChannelPool()
+    return _channel_pool
+
+
+async def close_connection() -> None:
+    global _rabbit_connection
+    if _channel_pool is not None:
+        await _channel_pool.close()
+    if _rabbit_connection is not None:
+        await _rabbit_connection.close()
+        _rabbit_connection = None
@@ -1,25 +1,29 @@
+import functools
 import logging
 
-from src.messaging.connection import get_channel
+from aio_pika.abc import AbstractIncomingMessage
+
 from src.messaging import queues_names
+from src.messaging.runtime import Consumer
 from src.schemas.messaging import EmailNotification
+from src.transport import EmailTransport, get_transport
 
 log = logging.getLogger(__name__)
 
-async def send_message() -> None:
-    ch = await get_channel()
-    async with ch:
-        queue = await ch.declare_queue(queues_names.EMAIL_NOTIFICATIONS)
 
-        async with queue.iterator() as queue_iter:
-            async for message in queue_iter:
-                try:
-                    async with message.process():
-                        body = EmailNotification.model_validate_json(message.body.decode())
-                        log.info(
-                            f"Send email from {body.data.email_from} to {body.data.email_to}, "
-                            f"subject: '{body.data.subject}', message: '{body.data.message}'"
-                        )
-                except Exception as e:
-                    log.error(f"Failed process message ({message.body.decode()}): {e}")
-                    await message.nack()
+async def handle_email_notification(message: AbstractIncomingMessage, transport: EmailTransport) -> None:
+    body = EmailNotification.model_validate_json(message.body.decode())
+    await transport.send(body.data)
+
+
+async def send_message() -> None:
+    transport = get_transport()
+    consumer = Consumer(
+        queues_names.EMAIL_NOTIFICATIONS,
+        functools.partial(handle_email_notification, transport=transport),
+        requeue_on=(TimeoutError, ConnectionError),
+    )
+    try:
+        await consumer.consume()
+    finally:
+        await transport.close()
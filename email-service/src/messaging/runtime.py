@@ -0,0 +1,198 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from aio_pika import Message
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage, AbstractQueue
+
+from src.config import settings
+from src.messaging.connection import get_connection
+
+log = logging.getLogger(__name__)
+
+Handler = Callable[[AbstractIncomingMessage], Awaitable[None]]
+
+RETRY_HEADER = "x-retry-count"
+
+
+@dataclass
+class ConsumerStats:
+    """Gauges and counters of a single consumer"""
+    queue_depth: int = 0
+    in_flight: int = 0
+    processed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    retried: int = 0
+    throughput: float = 0.0
+
+
+_consumers_stats: dict[str, ConsumerStats] = {}
+
+
+def get_consumers_stats() -> dict[str, ConsumerStats]:
+    """Return stats of all running consumers by queue name"""
+    return _consumers_stats
+
+
+class Consumer:
+    """Consumes a queue with bounded concurrency.
+
+    The channel QoS limits unacked deliveries to `prefetch_count` and up to
+    `concurrency` handlers run at the same time, each limited to `message_timeout`.
+    Exceptions listed in `requeue_on` retry the message: after an exponential backoff
+    from `retry_delay` up to `max_retry_delay` a copy with the attempt in the
+    `x-retry-count` header is published back to the queue and the original is acked.
+    The backoff keeps its concurrency slot, so a failing dependency slows the consumer
+    down instead of spinning on redeliveries. After `max_retries` attempts, or on any
+    other exception, the message is rejected.
+    When cancelled, the consumer stops taking deliveries and waits up to
+    `drain_timeout` for in-flight handlers, unfinished deliveries are redelivered
+    by the broker once the channel closes.
+    """
+
+    def __init__(
+        self,
+        queue_name: str,
+        handler: Handler,
+        *,
+        prefetch_count: int = settings.rabbit_settings.RABBIT_PREFETCH_COUNT,
+        concurrency: int = settings.rabbit_settings.RABBIT_CONSUMER_CONCURRENCY,
+        message_timeout: float = settings.rabbit_settings.RABBIT_MESSAGE_TIMEOUT,
+        drain_timeout: float = settings.rabbit_settings.RABBIT_DRAIN_TIMEOUT,
+        stats_interval: float = settings.rabbit_settings.RABBIT_STATS_INTERVAL,
+        retry_delay: float = settings.rabbit_settings.RABBIT_RETRY_DELAY,
+        max_retry_delay: float = settings.rabbit_settings.RABBIT_RETRY_MAX_DELAY,
+        max_retries: int = settings.rabbit_settings.RABBIT_MAX_RETRIES,
+        requeue_on: tuple[type[Exception], ...] = (),
+    ) -> None:
+        self.queue_name = queue_name
+        self.handler = handler
+        self.prefetch_count = prefetch_count
+        self.concurrency = concurrency
+        self.message_timeout = message_timeout
+        self.drain_timeout = drain_timeout
+        self.stats_interval = stats_interval
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.max_retries = max_retries
+        self.requeue_on = requeue_on
+        self.stats = ConsumerStats()
+
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._tasks: set[asyncio.Task] = set()
+        self._channel: AbstractChannel | None = None
+
+    async def consume(self) -> None:
+        """Consume the queue until cancelled, then drain in-flight handlers"""
+        conn = await get_connection()
+        ch = await conn.channel()
+        self._channel = ch
+        _consumers_stats[self.queue_name] = self.stats
+
+        async with ch:
+            await ch.set_qos(prefetch_count=self.prefetch_count)
+            queue = await ch.declare_queue(self.queue_name)
+
+            monitor = asyncio.create_task(self._monitor_queue(queue))
+            try:
+                async with queue.iterator() as queue_iter:
+                    async for message in queue_iter:
+                        await self._semaphore.acquire()
+                        task = asyncio.create_task(self._process(message))
+                        self._tasks.add(task)
+                        task.add_done_callback(self._tasks.discard)
+            finally:
+                monitor.cancel()
+                await self._drain()
+                self._log_stats()
+                _consumers_stats.pop(self.queue_name, None)
+
+    async def _drain(self) -> None:
+        if not self._tasks:
+            return
+
+        log.info(f"Consumer '{self.queue_name}': draining {len(self._tasks)} in-flight messages")
+        done, pending = await asyncio.wait(self._tasks, timeout=self.drain_timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            log.warning(f"Consumer '{self.queue_name}': {len(pending)} messages not finished in {self.drain_timeout}s")
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _process(self, message: AbstractIncomingMessage) -> None:
+        self.stats.in_flight += 1
+        try:
+            async with asyncio.timeout(self.message_timeout):
+                await self.handler(message)
+        except Exception as e:
+            self.stats.failed += 1
+            if isinstance(e, TimeoutError):
+                self.stats.timed_out += 1
+            log.error(f"Failed process message ({message.body.decode()}): {e!r}")
+            if isinstance(e, self.requeue_on):
+                await self._retry(message)
+            else:
+                await self._settle(message.nack(requeue=False))
+        else:
+            self.stats.processed += 1
+            await self._settle(message.ack())
+        finally:
+            self.stats.in_flight -= 1
+            self._semaphore.release()
+
+    async def _retry(self, message: AbstractIncomingMessage) -> None:
+        attempt = int((message.headers or {}).get(RETRY_HEADER, 0)) + 1
+        if attempt > self.max_retries:
+            log.error(f"Consumer '{self.queue_name}': message rejected after {self.max_retries} retries")
+            await self._settle(message.nack(requeue=False))
+            return
+
+        await asyncio.sleep(min(self.retry_delay * 2 ** (attempt - 1), self.max_retry_delay))
+        retry = Message(
+            message.body,
+            headers={**(message.headers or {}), RETRY_HEADER: attempt},
+            content_type=message.content_type,
+            delivery_mode=message.delivery_mode,
+            message_id=message.message_id,
+            correlation_id=message.correlation_id,
+        )
+        try:
+            await self._channel.default_exchange.publish(retry, routing_key=self.queue_name)
+        except Exception as e:
+            log.error(f"Failed republish message on '{self.queue_name}', requeue it: {e}")
+            await self._settle(message.nack(requeue=True))
+        else:
+            self.stats.retried += 1
+            await self._settle(message.ack())
+
+    async def _settle(self, settle: Awaitable[None]) -> None:
+        try:
+            await settle
+        except Exception as e:
+            log.error(f"Failed settle message on '{self.queue_name}': {e}")
+
+    async def _monitor_queue(self, queue: AbstractQueue) -> None:
+        processed, measured_at = self.stats.processed, time.monotonic()
+        while True:
+            await asyncio.sleep(self.stats_interval)
+            try:
+                result = await queue.declare()
+                self.stats.queue_depth = result.message_count
+            except Exception as e:
+                log.warning(f"Failed get depth of queue '{self.queue_name}': {e}")
+
+            now = time.monotonic()
+            self.stats.throughput = (self.stats.processed - processed) / (now - measured_at)
+            processed, measured_at = self.stats.processed, now
+            self._log_stats()
+
+    def _log_stats(self) -> None:
+        log.info(
+            f"Consumer '{self.queue_name}': queue_depth={self.stats.queue_depth}, "
+            f"in_flight={self.stats.in_flight}, processed={self.stats.processed}, "
+            f"failed={self.stats.failed}, timed_out={self.stats.timed_out}, retried={self.stats.retried}, "
+            f"throughput={self.stats.throughput:.1f} msg/s"
+        )
@@ -0,0 +1,20 @@
+from src.config import settings
+from src.transport.base import EmailTransport, LoggingTransport
+from src.transport.smtp import SmtpTransport
+
+
+def get_transport(name: str = settings.smtp_settings.EMAIL_TRANSPORT) -> EmailTransport:
+    """Create the transport selected by EMAIL_TRANSPORT: `logging` or `smtp`"""
+    if name == "logging":
+        return LoggingTransport()
+    if name == "smtp":
+        return SmtpTransport()
+    raise ValueError(f"Unknown email transport '{name}'")
+
+
+__all__ = (
+    "EmailTransport",
+    "LoggingTransport",
+    "SmtpTransport",
+    "get_transport",
+)
@@ -0,0 +1,37 @@
+import logging
+from abc import ABC, abstractmethod
+from email.message import EmailMessage
+
+from src.schemas.messaging import EmailNotificationData
+
+log = logging.getLogger(__name__)
+
+
+def build_message(data: EmailNotificationData) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = data.email_from
+    message["To"] = data.email_to
+    message["Subject"] = data.subject
+    message.set_content(data.message)
+    return message
+
+
+class EmailTransport(ABC):
+    """Delivers email notifications"""
+
+    @abstractmethod
+    async def send(self, data: EmailNotificationData) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class LoggingTransport(EmailTransport):
+    """Only logs notifications, for development without an SMTP server"""
+
+    async def send(self, data: EmailNotificationData) -> None:
+        log.info(
+            f"Send email from {data.email_from} to {data.email_to}, "
+            f"subject: '{data.subject}', message: '{data.message}'"
+        )
@@ -0,0 +1,70 @@
+"""Local SMTP sink that accepts and counts every message, for tests and benchmarks.
+
+Run from the service root:
+    python -m src.transport.sink --port 8025
+"""
+import argparse
+import asyncio
+import logging
+
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult, Envelope, Session, SMTP
+
+log = logging.getLogger(__name__)
+
+
+class SinkHandler:
+    def __init__(self, keep: bool = False) -> None:
+        self.received = 0
+        self.keep = keep
+        self.messages: list[Envelope] = []
+
+    async def handle_DATA(self, server: SMTP, session: Session, envelope: Envelope) -> str:
+        self.received += 1
+        if self.keep:
+            self.messages.append(envelope)
+        return "250 Message accepted for delivery"
+
+
+def accept_any_login(server: SMTP, session: Session, envelope: Envelope, mechanism: str, auth_data) -> AuthResult:
+    return AuthResult(success=True)
+
+
+def start_sink(host: str = "127.0.0.1", port: int = 8025, keep: bool = False) -> Controller:
+    """Start the sink in a background thread, stop it with `controller.stop()`.
+    Any login is accepted without TLS, so clients with SMTP_USER set work too.
+    """
+    # aiosmtpd logs every SMTP command at INFO
+    logging.getLogger("mail.log").setLevel(logging.ERROR)
+    controller = Controller(
+        SinkHandler(keep),
+        hostname=host,
+        port=port,
+        authenticator=accept_any_login,
+        auth_require_tls=False,
+    )
+    controller.start()
+    return controller
+
+
+async def main(host: str, port: int) -> None:
+    controller = start_sink(host, port)
+    log.info(f"SMTP sink listening on {host}:{port}")
+    try:
+        while True:
+            await asyncio.sleep(60)
+            log.info(f"SMTP sink received {controller.handler.received} messages")
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8025)
+    args = parser.parse_args()
+    try:
+        asyncio.run(main(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
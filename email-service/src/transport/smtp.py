@@ -0,0 +1,136 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+
+from aiosmtplib import SMTP
+
+from src.config import settings
+from src.schemas.messaging import EmailNotificationData
+from src.transport.base import EmailTransport, build_message
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class SmtpPoolStats:
+    sent: int = 0
+    connects: int = 0
+    reconnects: int = 0
+
+
+class _Connection:
+    def __init__(self, client: SMTP) -> None:
+        self.client = client
+        self.sent = 0
+
+
+class SmtpTransport(EmailTransport):
+    """Sends email over a pool of persistent, authenticated SMTP connections.
+
+    Connections are opened lazily up to `pool_size` and reused for
+    `max_messages_per_connection` messages. A connection dropped by the server
+    is reopened and the message is sent again once.
+    """
+
+    def __init__(
+        self,
+        host: str = settings.smtp_settings.SMTP_HOST,
+        port: int = settings.smtp_settings.SMTP_PORT,
+        username: str | None = settings.smtp_settings.SMTP_USER,
+        password: str | None = settings.smtp_settings.SMTP_PASS,
+        use_tls: bool = settings.smtp_settings.SMTP_USE_TLS,
+        start_tls: bool | None = settings.smtp_settings.SMTP_START_TLS,
+        pool_size: int = settings.smtp_settings.SMTP_POOL_SIZE,
+        timeout: float = settings.smtp_settings.SMTP_TIMEOUT,
+        max_messages_per_connection: int = settings.smtp_settings.SMTP_MAX_MESSAGES_PER_CONNECTION,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.start_tls = start_tls
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_messages_per_connection = max_messages_per_connection
+        self.stats = SmtpPoolStats()
+
+        self._idle: asyncio.LifoQueue[_Connection] = asyncio.LifoQueue()
+        self._slots = asyncio.Semaphore(pool_size)
+        self._connections: set[_Connection] = set()
+
+    async def _connect(self, connection: _Connection) -> None:
+        await connection.client.connect()
+        if self.username:
+            await connection.client.login(self.username, self.password or "")
+        connection.sent = 0
+        self.stats.connects += 1
+
+    async def _acquire(self) -> _Connection:
+        await self._slots.acquire()
+        try:
+            connection = self._idle.get_nowait()
+        except asyncio.QueueEmpty:
+            connection = _Connection(SMTP(
+                hostname=self.host,
+                port=self.port,
+                use_tls=self.use_tls,
+                start_tls=self.start_tls,
+                timeout=self.timeout,
+            ))
+            self._connections.add(connection)
+
+        try:
+            if not connection.client.is_connected:
+                await self._connect(connection)
+        except BaseException:
+            self._release(connection)
+            raise
+        return connection
+
+    def _release(self, connection: _Connection) -> None:
+        self._idle.put_nowait(connection)
+        self._slots.release()
+
+    @staticmethod
+    async def _quit(connection: _Connection) -> None:
+        try:
+            await connection.client.quit()
+        except Exception:
+            connection.client.close()
+
+    async def send(self, data: EmailNotificationData) -> None:
+        message = build_message(data)
+        connection = await self._acquire()
+        try:
+            try:
+                await connection.client.send_message(message)
+            except ConnectionError as e:
+                log.warning(f"SMTP connection to {self.host}:{self.port} lost, reconnecting: {e}")
+                connection.client.close()
+                self.stats.reconnects += 1
+                await self._connect(connection)
+                await connection.client.send_message(message)
+
+            connection.sent += 1
+            self.stats.sent += 1
+            if connection.sent >= self.max_messages_per_connection:
+                await self._quit(connection)
+        except BaseException:
+            if connection.client.is_connected:
+                connection.client.close()
+            raise
+        finally:
+            self._release(connection)
+
+    async def close(self) -> None:
+        """Close every connection, waits for sends holding a connection"""
+        for _ in range(self.pool_size):
+            await self._slots.acquire()
+        try:
+            for connection in self._connections:
+                if connection.client.is_connected:
+                    await self._quit(connection)
+        finally:
+            for _ in range(self.pool_size):
+                self._slots.release()
@@ -0,0 +1,204 @@
+"""Contains tests for the email consumer runtime."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.messaging import runtime
+from src.messaging.runtime import Consumer, RETRY_HEADER
+
+
+def make_message(delivery_tag: int, headers: dict | None = None) -> MagicMock:
+    message = MagicMock()
+    message.delivery_tag = delivery_tag
+    message.body = b"{}"
+    message.headers = headers or {}
+    message.content_type = "application/json"
+    message.delivery_mode = 2
+    message.message_id = None
+    message.correlation_id = None
+    message.ack = AsyncMock()
+    message.nack = AsyncMock()
+    return message
+
+
+class FakeQueueIterator:
+    """Yields the given messages, then waits for new ones until cancelled."""
+
+    def __init__(self, messages: list[MagicMock]) -> None:
+        self.messages = list(messages)
+
+    async def __aenter__(self) -> "FakeQueueIterator":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        return None
+
+    def __aiter__(self) -> "FakeQueueIterator":
+        return self
+
+    async def __anext__(self) -> MagicMock:
+        if self.messages:
+            return self.messages.pop(0)
+        await asyncio.Future()
+
+
+@pytest.fixture
+def deliver(monkeypatch: pytest.MonkeyPatch):
+    """Makes `Consumer.consume` read the given messages from a fake channel."""
+    def deliver(messages: list[MagicMock]) -> None:
+        queue = MagicMock()
+        queue.iterator = MagicMock(return_value=FakeQueueIterator(messages))
+        channel = MagicMock()
+        channel.__aenter__ = AsyncMock(return_value=channel)
+        channel.__aexit__ = AsyncMock(return_value=None)
+        channel.set_qos = AsyncMock()
+        channel.declare_queue = AsyncMock(return_value=queue)
+        connection = MagicMock()
+        connection.channel = AsyncMock(return_value=channel)
+        monkeypatch.setattr(runtime, "get_connection", AsyncMock(return_value=connection))
+
+    return deliver
+
+
+class TestConsumer:
+    @staticmethod
+    def __get_consumer(handler: AsyncMock, **kwargs) -> Consumer:
+        kwargs.setdefault("stats_interval", 60)
+        kwargs.setdefault("retry_delay", 0)
+        consumer = Consumer("test_queue", handler, **kwargs)
+        consumer._channel = MagicMock()
+        consumer._channel.default_exchange.publish = AsyncMock()
+        return consumer
+
+    async def test_concurrency_is_bounded(self, deliver) -> None:
+        running, max_running = 0, 0
+        release = asyncio.Event()
+
+        async def handler(message: MagicMock) -> None:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await release.wait()
+            running -= 1
+
+        messages = [make_message(tag) for tag in range(1, 6)]
+        deliver(messages)
+        consumer = self.__get_consumer(handler, concurrency=2)
+        consume = asyncio.create_task(consumer.consume())
+
+        await asyncio.sleep(0.01)
+        assert running == 2
+        assert consumer.stats.in_flight == 2
+        release.set()
+        await asyncio.sleep(0.01)
+        consume.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await consume
+
+        assert max_running == 2
+        assert consumer.stats.processed == 5
+        for message in messages:
+            message.ack.assert_awaited_once()
+
+    async def test_timeout_retries_message(self) -> None:
+        async def handler(message: MagicMock) -> None:
+            await asyncio.sleep(1)
+
+        consumer = self.__get_consumer(handler, message_timeout=0.01, requeue_on=(TimeoutError,))
+        message = make_message(1)
+        await consumer._semaphore.acquire()
+
+        await consumer._process(message)
+        publish = consumer._channel.default_exchange.publish
+        publish.assert_awaited_once()
+        retry = publish.await_args.args[0]
+        assert retry.body == message.body
+        assert retry.headers[RETRY_HEADER] == 1
+        assert publish.await_args.kwargs["routing_key"] == "test_queue"
+        message.ack.assert_awaited_once()
+        message.nack.assert_not_awaited()
+        assert consumer.stats.failed == 1
+        assert consumer.stats.timed_out == 1
+        assert consumer.stats.retried == 1
+
+    async def test_retry_backs_off(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        consumer = self.__get_consumer(
+            AsyncMock(side_effect=ConnectionError), retry_delay=1, max_retry_delay=5, requeue_on=(ConnectionError,),
+        )
+        sleep = AsyncMock()
+        monkeypatch.setattr(runtime.asyncio, "sleep", sleep)
+
+        for attempt in range(4):
+            await consumer._semaphore.acquire()
+            await consumer._process(make_message(1, {RETRY_HEADER: attempt}))
+        assert [call.args[0] for call in sleep.await_args_list] == [1, 2, 4, 5]
+
+    async def test_retries_are_capped(self) -> None:
+        consumer = self.__get_consumer(AsyncMock(side_effect=ConnectionError), max_retries=3, requeue_on=(ConnectionError,))
+        message = make_message(1, {RETRY_HEADER: 3})
+        await consumer._semaphore.acquire()
+
+        await consumer._process(message)
+        consumer._channel.default_exchange.publish.assert_not_awaited()
+        message.nack.assert_awaited_once_with(requeue=False)
+        assert consumer.stats.retried == 0
+
+    async def test_failed_republish_requeues_message(self) -> None:
+        consumer = self.__get_consumer(AsyncMock(side_effect=ConnectionError), requeue_on=(ConnectionError,))
+        consumer._channel.default_exchange.publish.side_effect = ConnectionError
+        message = make_message(1)
+        await consumer._semaphore.acquire()
+
+        await consumer._process(message)
+        message.nack.assert_awaited_once_with(requeue=True)
+        message.ack.assert_not_awaited()
+
+    async def test_other_error_rejects_message(self) -> None:
+        consumer = self.__get_consumer(AsyncMock(side_effect=ValueError("boom")), requeue_on=(TimeoutError,))
+        message = make_message(1)
+        await consumer._semaphore.acquire()
+
+        await consumer._process(message)
+        message.nack.assert_awaited_once_with(requeue=False)
+        assert consumer.stats.failed == 1
+        assert consumer.stats.timed_out == 0
+
+    async def test_cancel_drains_in_flight_handlers(self, deliver) -> None:
+        async def handler(message: MagicMock) -> None:
+            await asyncio.sleep(0.05)
+
+        messages = [make_message(tag) for tag in (1, 2)]
+        deliver(messages)
+        consumer = self.__get_consumer(handler, drain_timeout=1)
+        consume = asyncio.create_task(consumer.consume())
+
+        await asyncio.sleep(0.01)
+        assert consumer.stats.in_flight == 2
+        consume.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await consume
+
+        assert consumer.stats.processed == 2
+        assert consumer.stats.in_flight == 0
+        for message in messages:
+            message.ack.assert_awaited_once()
+
+    async def test_drain_cancels_handlers_after_timeout(self, deliver) -> None:
+        async def handler(message: MagicMock) -> None:
+            await asyncio.sleep(10)
+
+        message = make_message(1)
+        deliver([message])
+        consumer = self.__get_consumer(handler, drain_timeout=0.05)
+        consume = asyncio.create_task(consumer.consume())
+
+        await asyncio.sleep(0.01)
+        consume.cancel()
+        async with asyncio.timeout(1):
+            with pytest.raises(asyncio.CancelledError):
+                await consume
+
+        assert consumer.stats.in_flight == 0
+        assert not consumer._tasks
+        message.ack.assert_not_awaited()
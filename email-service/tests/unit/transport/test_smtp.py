@@ -0,0 +1,104 @@
+"""Contains tests for the pooled SMTP transport against the local sink."""
+import asyncio
+import socket
+from typing import Iterator
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from src.schemas.messaging import EmailNotificationData
+from src.transport.sink import start_sink
+from src.transport.smtp import SmtpTransport
+
+HOST = "127.0.0.1"
+
+
+def make_data(idx: int = 0) -> EmailNotificationData:
+    return EmailNotificationData(
+        email_to=f"user{idx}@example.com",
+        email_from="info@tms.com",
+        subject="Test",
+        message=f"Test message {idx}",
+    )
+
+
+@pytest.fixture
+def port() -> int:
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def sink(port: int) -> Iterator[Controller]:
+    controller = start_sink(HOST, port)
+    yield controller
+    controller.stop()
+
+
+class TestSmtpTransport:
+    @staticmethod
+    def __get_transport(port: int, **kwargs) -> SmtpTransport:
+        return SmtpTransport(host=HOST, port=port, username=None, start_tls=False, **kwargs)
+
+    async def test_connections_are_reused(self, port: int, sink: Controller) -> None:
+        transport = self.__get_transport(port, pool_size=2)
+        try:
+            for idx in range(5):
+                await transport.send(make_data(idx))
+            assert transport.stats.connects == 1
+
+            await asyncio.gather(*(transport.send(make_data(idx)) for idx in range(20)))
+        finally:
+            await transport.close()
+
+        assert sink.handler.received == 25
+        assert transport.stats.sent == 25
+        assert transport.stats.connects <= 2
+        assert len(transport._connections) <= 2
+
+    async def test_connection_is_recycled(self, port: int, sink: Controller) -> None:
+        transport = self.__get_transport(port, pool_size=1, max_messages_per_connection=2)
+        try:
+            for idx in range(5):
+                await transport.send(make_data(idx))
+        finally:
+            await transport.close()
+
+        assert sink.handler.received == 5
+        assert transport.stats.connects == 3
+        assert len(transport._connections) == 1
+
+    async def test_send_after_sink_restart_reconnects(self, port: int) -> None:
+        transport = self.__get_transport(port, pool_size=1)
+        controller = start_sink(HOST, port)
+        try:
+            await transport.send(make_data(0))
+            controller.stop()
+            controller = start_sink(HOST, port)
+
+            await transport.send(make_data(1))
+        finally:
+            await transport.close()
+            controller.stop()
+
+        assert controller.handler.received == 1
+        assert transport.stats.sent == 2
+        assert transport.stats.connects == 2
+
+    async def test_close_waits_for_in_flight_sends(self, port: int, sink: Controller) -> None:
+        received = sink.handler.handle_DATA
+
+        async def slow_handle_data(*args) -> str:
+            await asyncio.sleep(0.2)
+            return await received(*args)
+
+        sink.handler.handle_DATA = slow_handle_data
+        transport = self.__get_transport(port, pool_size=1)
+        sends = [asyncio.create_task(transport.send(make_data(idx))) for idx in range(3)]
+        await asyncio.sleep(0.05)
+
+        await transport.close()
+        assert all(send.done() and send.exception() is None for send in sends)
+        assert sink.handler.received == 3
+        assert not any(connection.client.is_connected for connection in transport._connections)
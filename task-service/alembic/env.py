@@ -9,6 +9,8 @@ from src.config import settings
 
 from src.models.base import Base
 from src.models.task import Task  # noqa: F401
+from src.models.task_counter import TaskCounter  # noqa: F401
+from src.models.task_outbox import TaskOutbox  # noqa: F401
 
 
 config = context.config
@@ -0,0 +1,50 @@
+"""Add task (created_at, id) index for keyset pagination
+
+Revision ID: 5c0e8a1f3b72
+Revises: b41f7c2d9e60
+Create Date: 2026-10-18 11:40:07.518214
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c0e8a1f3b72"
+down_revision: Union[str, None] = "b41f7c2d9e60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_task_schema_task_created_at_id",
+        "task",
+        ["created_at", "id"],
+        unique=False,
+        schema="task_schema",
+    )
+    op.drop_index(
+        op.f("ix_task_schema_task_created_at"),
+        table_name="task",
+        schema="task_schema",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f("ix_task_schema_task_created_at"),
+        "task",
+        ["created_at"],
+        unique=False,
+        schema="task_schema",
+    )
+    op.drop_index(
+        "ix_task_schema_task_created_at_id",
+        table_name="task",
+        schema="task_schema",
+    )
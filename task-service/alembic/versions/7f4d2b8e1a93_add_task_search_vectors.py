@@ -0,0 +1,59 @@
+"""Add generated full-text search vectors to task
+
+Revision ID: 7f4d2b8e1a93
+Revises: e3a7c9f1b284
+Create Date: 2026-10-18 15:02:11.294871
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7f4d2b8e1a93"
+down_revision: Union[str, None] = "e3a7c9f1b284"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+columns = {
+    "search_vector_en": "english",
+    "search_vector_ru": "russian",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column, language in columns.items():
+        op.add_column(
+            "task",
+            sa.Column(
+                column,
+                postgresql.TSVECTOR(),
+                sa.Computed(
+                    f"setweight(to_tsvector('{language}', coalesce(title, '')), 'A') || "
+                    f"setweight(to_tsvector('{language}', coalesce(description, '')), 'B')",
+                    persisted=True,
+                ),
+                nullable=False,
+            ),
+            schema="task_schema",
+        )
+        op.create_index(
+            f"ix_task_schema_task_{column}",
+            "task",
+            [column],
+            unique=False,
+            schema="task_schema",
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in columns:
+        op.drop_index(f"ix_task_schema_task_{column}", table_name="task", schema="task_schema")
+        op.drop_column("task", column, schema="task_schema")
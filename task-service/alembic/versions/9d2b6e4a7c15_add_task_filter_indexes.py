@@ -0,0 +1,36 @@
+"""Add task indexes for list filters
+
+Revision ID: 9d2b6e4a7c15
+Revises: 5c0e8a1f3b72
+Create Date: 2026-10-18 13:05:52.904417
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d2b6e4a7c15"
+down_revision: Union[str, None] = "5c0e8a1f3b72"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+indexes = {
+    "ix_task_schema_task_assignee_id_status_created_at": ["assignee_id", "status", "created_at"],
+    "ix_task_schema_task_author_id_created_at": ["author_id", "created_at"],
+    "ix_task_schema_task_status_created_at": ["status", "created_at"],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, columns in indexes.items():
+        op.create_index(name, "task", columns, unique=False, schema="task_schema")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in indexes:
+        op.drop_index(name, table_name="task", schema="task_schema")
@@ -0,0 +1,54 @@
+"""Create task_counter table
+
+Revision ID: b41f7c2d9e60
+Revises: 457528d27220
+Create Date: 2026-10-18 10:12:41.305118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b41f7c2d9e60"
+down_revision: Union[str, None] = "457528d27220"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+counter_role = sa.Enum("author", "assignee", name="counter_role", schema="task_schema")
+status = postgresql.ENUM(name="status", schema="task_schema", create_type=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "task_counter",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("role", counter_role, nullable=False),
+        sa.Column("status", status, nullable=False),
+        sa.Column("count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "role", "status"),
+        schema="task_schema",
+    )
+    op.execute(
+        """
+        INSERT INTO task_schema.task_counter (user_id, role, status, count)
+        SELECT user_id, role::task_schema.counter_role, status, count(*)
+        FROM (
+            SELECT author_id AS user_id, 'author' AS role, status FROM task_schema.task
+            UNION ALL
+            SELECT assignee_id, 'assignee', status FROM task_schema.task WHERE assignee_id IS NOT NULL
+        ) AS roles
+        GROUP BY user_id, role, status
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("task_counter", schema="task_schema")
+    counter_role.drop(op.get_bind())
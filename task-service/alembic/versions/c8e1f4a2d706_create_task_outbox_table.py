@@ -0,0 +1,47 @@
+"""Create task_outbox table
+
+Revision ID: c8e1f4a2d706
+Revises: 7f4d2b8e1a93
+Create Date: 2026-10-18 17:41:09.518230
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c8e1f4a2d706"
+down_revision: Union[str, None] = "7f4d2b8e1a93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+task_event = sa.Enum("created", "updated", "deleted", name="task_event", schema="task_schema")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "task_outbox",
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False), nullable=False),
+        sa.Column("task_id", sa.Uuid(), nullable=False),
+        sa.Column("event", task_event, nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("TIMEZONE('utc', now())"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        schema="task_schema",
+    )
+    # Project the existing tasks into the read model
+    op.execute(
+        """
+        INSERT INTO task_schema.task_outbox (task_id, event)
+        SELECT id, 'updated' FROM task_schema.task
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("task_outbox", schema="task_schema")
+    task_event.drop(op.get_bind())
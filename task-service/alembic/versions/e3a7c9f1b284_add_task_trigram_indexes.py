@@ -0,0 +1,44 @@
+"""Add trigram indexes for task substring search
+
+Revision ID: e3a7c9f1b284
+Revises: 9d2b6e4a7c15
+Create Date: 2026-10-18 14:21:37.518204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a7c9f1b284"
+down_revision: Union[str, None] = "9d2b6e4a7c15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+indexes = {
+    "ix_task_schema_task_title_trgm": "title",
+    "ix_task_schema_task_description_trgm": "description",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in indexes.items():
+        op.create_index(
+            name,
+            "task",
+            [column],
+            unique=False,
+            schema="task_schema",
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in indexes:
+        op.drop_index(name, table_name="task", schema="task_schema")
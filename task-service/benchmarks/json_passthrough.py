@@ -0,0 +1,96 @@
+"""Compares the ORM and the database JSON paths of `GET /api/v1/tasks`.
+
+The ORM path loads `Task` objects, validates a `TaskDB` per row and renders the response
+with `PydanticJSONResponse`. The passthrough path (`?passthrough=true`) lets Postgres build
+the page with json_agg/json_build_object and splices the bytes into the envelope.
+Needs a migrated database from the environment settings. The tasks are generated inside
+a transaction that is rolled back at the end:
+    python -m benchmarks.json_passthrough --rows 100 1000 10000 --repeat 50
+"""
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.config import settings
+from src.repositories.task import TaskRepository
+from src.schemas.response import PassthroughJSONResponse, PydanticJSONResponse
+from src.schemas.task import TaskFilters, TaskListResponse
+
+SEED_QUERY = text(
+    """
+    INSERT INTO task_schema.task (id, title, description, status, created_at, author_id, assignee_id)
+    SELECT
+        gen_random_uuid(),
+        'Task ' || i,
+        'Task description ' || i,
+        (ARRAY['todo', 'in_progress', 'done'])[i % 3 + 1]::task_schema.status,
+        TIMEZONE('utc', now()) - i * interval '1 second',
+        gen_random_uuid(),
+        gen_random_uuid()
+    FROM generate_series(1, :tasks) AS i
+    """
+)
+
+
+def make_filters(per_page: int) -> TaskFilters:
+    """Filters of the first page, per_page is not limited like in the query parameters"""
+    return TaskFilters(
+        page=None, per_page=per_page, cursor=None, like="",
+        ids=None, status=None, author_id=None, assignee_id=None, search_description=False,
+    )
+
+
+async def measure(name: str, repeat: int, func: Callable[[], Awaitable[bytes]]) -> None:
+    await func()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - started)
+    best, avg = min(timings), sum(timings) / len(timings)
+    print(f"  {name:<12} best={best * 1e3:8.2f} ms  avg={avg * 1e3:8.2f} ms per page")
+
+
+async def main(rows: list[int], repeat: int) -> None:
+    engine = create_async_engine(settings.DATABASE_URL_asyncpg)
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            session = AsyncSession(bind=connection)
+            repository = TaskRepository(session)
+            await session.execute(SEED_QUERY, {"tasks": max(rows)})
+            await session.execute(text("ANALYZE task_schema.task"))
+
+            for count in rows:
+                filters = make_filters(count)
+
+                async def orm() -> bytes:
+                    tasks = await repository.get_tasks_by_filters(filters)
+                    page = TaskListResponse(payload=[task.to_schema() for task in tasks], next_cursor=None)
+                    session.expunge_all()
+                    return PydanticJSONResponse(page).body
+
+                async def passthrough() -> bytes:
+                    payload, _, _ = await repository.get_tasks_json(filters)
+                    return PassthroughJSONResponse(TaskListResponse.model_construct(next_cursor=None), payload).body
+
+                print(f"{count} tasks per page, {repeat} runs")
+                await measure("ORM", repeat, orm)
+                await measure("passthrough", repeat, passthrough)
+
+            await session.close()
+            await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
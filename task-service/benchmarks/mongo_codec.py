@@ -0,0 +1,104 @@
+"""Measures BSON encoding and decoding of task documents with and without the codec options.
+
+The baseline reproduces the former per-key loops that converted ids between
+uuid.UUID and bson.Binary in Python. The codec path leaves the conversion to the
+C extension. Both paths get the same documents, and reads are decoded in batches
+as the driver does for cursor replies. No MongoDB is needed:
+    python -m benchmarks.mongo_codec --documents 100000
+"""
+import argparse
+import datetime
+import time
+from typing import Callable
+from uuid import uuid4
+
+import bson
+from bson import Binary
+from bson.objectid import ObjectId
+
+from src.database.mongo_db import CODEC_OPTIONS
+from src.models.task import Status
+
+
+def ids_from_uuid_to_binary(data: dict) -> None:
+    for k, v in data.items():
+        if "id" in k:
+            data[k] = Binary.from_uuid(v)
+
+
+def ids_from_binary_to_uuid(data: dict) -> None:
+    for k, v in data.items():
+        if "id" in k and not isinstance(v, ObjectId):
+            data[k] = Binary.as_uuid(v)
+
+
+def make_document(idx: int) -> dict:
+    return {
+        "title": f"Task {idx}",
+        "description": "Do something",
+        "status": Status.in_progress.value,
+        "tags": ["tag 1", "tag 2", "tag 3"],
+        "created_at": datetime.datetime.now(datetime.UTC).replace(tzinfo=None),
+        "author_id": uuid4(),
+        "assignee_id": uuid4(),
+        "author": {"full_name": "Ivanov Ivan", "email": "ivan@example.ru"},
+    }
+
+
+def measure(name: str, count: int, func: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"{name:<28} {elapsed * 1000:9.1f} ms  {elapsed / count * 1e6:7.2f} us/doc")
+    return elapsed
+
+
+def main(count: int, batch_size: int) -> None:
+    documents = [make_document(idx) for idx in range(count)]
+
+    def encode_baseline() -> list[bytes]:
+        encoded = []
+        for document in documents:
+            data = dict(document)
+            ids_from_uuid_to_binary(data)
+            encoded.append(bson.encode(data))
+        return encoded
+
+    def encode_codec() -> list[bytes]:
+        return [bson.encode(document, codec_options=CODEC_OPTIONS) for document in documents]
+
+    def to_batches(encoded: list[bytes]) -> list[bytes]:
+        return [b"".join(encoded[idx:idx + batch_size]) for idx in range(0, len(encoded), batch_size)]
+
+    baseline_batches = to_batches(encode_baseline())
+    codec_batches = to_batches(encode_codec())
+
+    def decode_baseline() -> None:
+        for batch in baseline_batches:
+            for data in bson.decode_all(batch):
+                ids_from_binary_to_uuid(data)
+
+    def decode_codec() -> None:
+        for batch in codec_batches:
+            bson.decode_all(batch, codec_options=CODEC_OPTIONS)
+
+    print(f"{count} documents, batches of {batch_size}")
+    encode_before = measure("encode, per-key loop", count, encode_baseline)
+    encode_after = measure("encode, codec options", count, encode_codec)
+    decode_before = measure("decode, per-key loop", count, decode_baseline)
+    decode_after = measure("decode, codec options", count, decode_codec)
+    saved = (encode_before - encode_after + decode_before - decode_after) / count * 1e6
+    print(f"saved per document write and read: {saved:.2f} us")
+
+    document = dict(make_document(0), status=Status.done, author={"id": uuid4()})
+    decoded = bson.decode(bson.encode(document, codec_options=CODEC_OPTIONS), codec_options=CODEC_OPTIONS)
+    assert decoded["author"]["id"] == document["author"]["id"], "nested ids must round trip"
+    assert decoded["status"] == Status.done.value
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    main(args.documents, args.batch_size)
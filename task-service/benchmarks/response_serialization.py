@@ -0,0 +1,80 @@
+"""Measures the CPU cost of rendering a page of tasks for `GET /api/v1/tasks`.
+
+The baseline reproduces the former path: `TaskDB(**task.__dict__)` per row, then
+FastAPI validates the response against `response_model` and encodes it with json.dumps.
+The fast path validates each row once with `Task.to_schema()` and renders the response
+model with its pydantic-core serializer, skipping `response_model`. No database is needed:
+    python -m benchmarks.response_serialization --tasks 100 --repeat 2000
+"""
+import argparse
+import asyncio
+import datetime
+import time
+from typing import Callable
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from src.models.task import Status, Task
+from src.schemas.response import PydanticJSONResponse
+from src.schemas.task import TaskDB, TaskListResponse
+
+
+def make_tasks(count: int) -> list[Task]:
+    now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+    return [
+        Task(
+            id=uuid4(),
+            title=f"Task {idx}",
+            description=f"Task description {idx}",
+            status=Status.in_progress,
+            created_at=now - datetime.timedelta(seconds=idx),
+            author_id=uuid4(),
+            assignee_id=uuid4(),
+        )
+        for idx in range(count)
+    ]
+
+
+def measure(name: str, repeat: int, func: Callable[[], bytes]) -> None:
+    func()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    best, avg = min(timings), sum(timings) / len(timings)
+    print(f"{name:<26} best={best * 1e6:9.1f} µs  avg={avg * 1e6:9.1f} µs per page")
+
+
+def main(tasks: int, repeat: int) -> None:
+    rows = make_tasks(tasks)
+    response_field = create_model_field(name="Response_get_all_tasks", type_=TaskListResponse, mode="serialization")
+    loop = asyncio.new_event_loop()
+
+    def baseline() -> bytes:
+        page = TaskListResponse(payload=[TaskDB(**task.__dict__) for task in rows], next_cursor="cursor")
+        content = loop.run_until_complete(serialize_response(field=response_field, response_content=page))
+        return JSONResponse(content).body
+
+    def fast_path() -> bytes:
+        page = TaskListResponse(payload=[task.to_schema() for task in rows], next_cursor="cursor")
+        return PydanticJSONResponse(page).body
+
+    assert baseline() == fast_path()
+    print(f"{tasks} tasks per page, {repeat} runs")
+    try:
+        measure("response_model + json.dumps", repeat, baseline)
+        measure("PydanticJSONResponse", repeat, fast_path)
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.tasks, args.repeat)
@@ -0,0 +1,22 @@
+import asyncio
+import logging
+
+from src.database.mongo_db import async_mongo_client
+from src.repositories.mongo_repository import async_mongo_task_repository
+
+
+log = logging.getLogger(__name__)
+
+
+async def rebuild_tag_stats() -> None:
+    """Create the tags index and recompute tag stats from the tasks collection"""
+    try:
+        await async_mongo_task_repository.create_indexes()
+        await async_mongo_task_repository.rebuild_tag_stats()
+    finally:
+        await async_mongo_client.close()
+    log.info("Tag stats rebuilt")
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_tag_stats())
@@ -0,0 +1,19 @@
+import asyncio
+import logging
+
+from src.utils.unit_of_work import UnitOfWork
+
+
+log = logging.getLogger(__name__)
+
+
+async def reconcile_task_counters() -> None:
+    """Rebuild task counters from the task table"""
+    uow = UnitOfWork()
+    async with uow:
+        await uow.task_counter.rebuild()
+    log.info("Task counters rebuilt")
+
+
+if __name__ == "__main__":
+    asyncio.run(reconcile_task_counters())
@@ -1,15 +1,21 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import UUID4
 
 from src.api.v1.services.task import TaskService
+from src.schemas.response import PassthroughJSONResponse, PydanticJSONResponse
 from src.schemas.task import (
     CreateTaskRequest,
     CreateTaskResponse,
     TaskResponse,
     TaskListResponse,
     UpdateTaskRequest,
-    TaskFilters, TaskDB
+    TaskFilters, TaskDB,
+    TaskSearchFilters,
+    TaskCardResponse,
+    ExportFormat
 )
+from src.utils.task_export import MEDIA_TYPES
 
 router = APIRouter(prefix="/tasks")
 
@@ -18,30 +24,77 @@ router = APIRouter(prefix="/tasks")
 async def create_task(
     task: CreateTaskRequest,
     task_service: TaskService = Depends()
-) -> CreateTaskResponse:
+) -> PydanticJSONResponse:
     """Create a new task"""
     created_task = await task_service.create_task(task)
-    return CreateTaskResponse(payload=created_task)
+    return PydanticJSONResponse(CreateTaskResponse(payload=created_task), status_code=status.HTTP_201_CREATED)
+
+
+@router.get("/search", response_model=TaskListResponse, status_code=status.HTTP_200_OK)
+async def search_tasks(
+    task_service: TaskService = Depends(),
+    filters: TaskSearchFilters = Depends()
+) -> PydanticJSONResponse:
+    """Full-text search of tasks, most relevant first"""
+    tasks, next_cursor = await task_service.search_tasks(filters)
+    return PydanticJSONResponse(
+        TaskListResponse(payload=tasks, next_cursor=next_cursor), status_code=status.HTTP_200_OK
+    )
+
+
+@router.get("/export", response_class=StreamingResponse, status_code=status.HTTP_200_OK)
+async def export_tasks(
+    task_service: TaskService = Depends(),
+    filters: TaskFilters = Depends(),
+    export_format: ExportFormat = Query(ExportFormat.ndjson, alias="format"),
+) -> StreamingResponse:
+    """Export all tasks by filters as NDJSON or CSV, newest first.
+    Rows are streamed from a server-side cursor, the page and the page size are ignored.
+    """
+    return StreamingResponse(
+        task_service.export_tasks(filters, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{export_format.value}"'},
+    )
 
 
 @router.get("/{task_id}", response_model=TaskResponse, status_code=status.HTTP_200_OK)
 async def get_task(
     task_id: UUID4,
     task_service: TaskService = Depends()
-) -> TaskResponse:
+) -> PydanticJSONResponse:
     """Get a task"""
     task = await task_service.get_task_or_none(task_id)
-    return TaskResponse(payload=task)
+    return PydanticJSONResponse(TaskResponse(payload=task), status_code=status.HTTP_200_OK)
+
+
+@router.get("/{task_id}/card", response_model=TaskCardResponse, status_code=status.HTTP_200_OK)
+async def get_task_card(
+    task_id: UUID4,
+    task_service: TaskService = Depends()
+) -> PydanticJSONResponse:
+    """Get a denormalized task card from the read model"""
+    card = await task_service.get_task_card(task_id)
+    return PydanticJSONResponse(TaskCardResponse(payload=card), status_code=status.HTTP_200_OK)
 
 
 @router.get("/", response_model=TaskListResponse, status_code=status.HTTP_200_OK)
 async def get_all_tasks(
     task_service: TaskService = Depends(),
-    filters: TaskFilters = Depends()
-) -> TaskListResponse:
+    filters: TaskFilters = Depends(),
+    passthrough: bool = Query(False, description="Build the payload in the database, skipping the ORM"),
+) -> PydanticJSONResponse:
     """Get all tasks"""
-    tasks = await task_service.get_tasks_by_filters(filters)
-    return TaskListResponse(payload=tasks)
+    if passthrough:
+        payload, next_cursor = await task_service.get_tasks_page_json(filters)
+        return PassthroughJSONResponse(
+            TaskListResponse.model_construct(next_cursor=next_cursor), payload, status_code=status.HTTP_200_OK
+        )
+
+    tasks, next_cursor = await task_service.get_tasks_page(filters)
+    return PydanticJSONResponse(
+        TaskListResponse(payload=tasks, next_cursor=next_cursor), status_code=status.HTTP_200_OK
+    )
 
 
 @router.patch("/{task_id}", response_model=CreateTaskResponse, status_code=status.HTTP_200_OK)
@@ -49,10 +102,10 @@ async def update_task(
     task_id: UUID4,
     task: UpdateTaskRequest,
     task_service: TaskService = Depends()
-) -> CreateTaskResponse:
+) -> PydanticJSONResponse:
     """Update a task"""
     updated_task = await task_service.partial_update_task(task_id, task)
-    return CreateTaskResponse(payload=updated_task)
+    return PydanticJSONResponse(CreateTaskResponse(payload=updated_task), status_code=status.HTTP_200_OK)
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
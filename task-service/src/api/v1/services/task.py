@@ -1,47 +1,70 @@
+from contextlib import aclosing
+from typing import AsyncIterator
+
 from fastapi import HTTPException, status
 from pydantic import UUID4
 
-from src.messaging.produsers import check_user_existence
+from src.config import settings
+from src.messaging.produsers import check_users_existence
 from src.models.task import Task
+from src.models.task_outbox import TaskEvent
+from src.repositories.mongo_repository import async_mongo_task_repository
+from src.repositories.task_counter import task_counter_deltas
 from src.schemas.task import (
     CreateTaskRequest,
     TaskDB,
     UpdateTaskRequest,
-    TaskFilters
+    TaskFilters,
+    TaskSearchFilters,
+    TaskCard,
+    ExportFormat
 )
-from src.utils.constants import TASK_NOT_FOUND_MSG
+from src.utils.constants import TASK_NOT_FOUND_MSG, INVALID_CURSOR_MSG
+from src.utils.cursor import encode_cursor
 from src.utils.service import BaseService, transaction_mode
+from src.utils.task_export import encode_tasks
+
+COUNTED_FIELDS = {"author_id", "assignee_id", "status"}
 
 
 class TaskService(BaseService):
     """Task service"""
     _repo: str = "task"
+    task_cards = async_mongo_task_repository
 
     @staticmethod
-    async def check_user_existence(user_id: UUID4, field_name: str) -> None:
-        """Check if user exists"""
-        res = await check_user_existence(user_id)
-        if res is not None:
-            if res.data.is_exists:
-                return
+    def validate_cursor(filters: TaskFilters) -> tuple | None:
+        """Decode the cursor of the filters, raises 400 if it is malformed"""
+        try:
+            return filters.after
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=INVALID_CURSOR_MSG)
 
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"{field_name.title()} with id {user_id} not found")
+    @staticmethod
+    async def check_users_existence(users: dict[str, UUID4 | None]) -> None:
+        """Check if users exist with one RPC. `users` maps field name to user ID"""
+        user_ids = {user_id for user_id in users.values() if user_id}
+        if not user_ids:
+            return
+
+        existence = await check_users_existence(user_ids) or {}
+        for field_name, user_id in users.items():
+            if user_id and not existence.get(user_id):
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"{field_name.title()} with id {user_id} not found")
 
     @transaction_mode
     async def create_task(self, task: CreateTaskRequest, task_id: UUID4 = None) -> TaskDB:
         """Create a new task"""
-        if task.author_id:
-            await self.check_user_existence(task.author_id, "author")
-
-        if task.assignee_id:
-            await self.check_user_existence(task.assignee_id, "assignee")
+        await self.check_users_existence({"author": task.author_id, "assignee": task.assignee_id})
 
         data = task.model_dump()
         if task_id:
             data["id"] = task_id
         created_task: Task = await self.uow.task.add_one_and_get_obj(**data)
+        await self.uow.task_counter.apply_deltas(task_counter_deltas(created_task))
+        await self.uow.task_outbox.add_event(created_task.id, TaskEvent.created)
         return created_task.to_schema()
 
     @transaction_mode
@@ -57,6 +80,56 @@ class TaskService(BaseService):
         tasks = await self.uow.task.get_tasks_by_filters(filters)
         return [task.to_schema() for task in tasks]
 
+    @transaction_mode
+    async def get_tasks_page(self, filters: TaskFilters) -> tuple[list[TaskDB], str | None]:
+        """Get a page of tasks by filters and the cursor of the next page"""
+        self.validate_cursor(filters)
+
+        tasks = await self.uow.task.get_tasks_by_filters(filters)
+        next_cursor = None
+        if tasks and len(tasks) == filters.per_page:
+            next_cursor = encode_cursor((tasks[-1].created_at, tasks[-1].id))
+        return [task.to_schema() for task in tasks], next_cursor
+
+    @transaction_mode
+    async def get_tasks_page_json(self, filters: TaskFilters) -> tuple[str, str | None]:
+        """Get a page of tasks by filters as a JSON array built by the database
+        and the cursor of the next page
+        """
+        self.validate_cursor(filters)
+
+        payload, count, last = await self.uow.task.get_tasks_json(filters)
+        next_cursor = None
+        if count and count == filters.per_page:
+            next_cursor = encode_cursor(last)
+        return payload, next_cursor
+
+    def export_tasks(self, filters: TaskFilters, export_format: ExportFormat) -> AsyncIterator[bytes]:
+        """Export tasks by filters as chunks of an NDJSON or CSV file.
+        The cursor is checked before the export starts, the transaction is opened
+        when the first chunk is requested and lasts until the last one.
+        """
+        self.validate_cursor(filters)
+        return self._export_tasks(filters, export_format)
+
+    async def _export_tasks(self, filters: TaskFilters, export_format: ExportFormat) -> AsyncIterator[bytes]:
+        async with self.uow:
+            batches = self.uow.task.stream_tasks_by_filters(filters, settings.export_settings.EXPORT_BATCH_SIZE)
+            async with aclosing(batches):
+                async for chunk in encode_tasks(batches, export_format):
+                    yield chunk
+
+    @transaction_mode
+    async def search_tasks(self, filters: TaskSearchFilters) -> tuple[list[TaskDB], str | None]:
+        """Full-text search of tasks ranked by relevance and the cursor of the next page"""
+        self.validate_cursor(filters)
+
+        rows = await self.uow.task.search_tasks(filters)
+        next_cursor = None
+        if rows and len(rows) == filters.per_page:
+            last_task, last_rank = rows[-1]
+            next_cursor = encode_cursor((last_rank, last_task.id))
+        return [task.to_schema() for task, _ in rows], next_cursor
 
     @transaction_mode
     async def partial_update_task(self, task_id: UUID4, task: UpdateTaskRequest) -> TaskDB:
@@ -65,19 +138,33 @@ class TaskService(BaseService):
         if not data:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No request body specified")
 
-        if task.author_id:
-            await self.check_user_existence(task.author_id, "author")
+        await self.check_users_existence({"author": task.author_id, "assignee": task.assignee_id})
 
-        if task.assignee_id:
-            await self.check_user_existence(task.assignee_id, "assignee")
+        deltas = None
+        if data.keys() & COUNTED_FIELDS:
+            task_before = await self.uow.task.get_one_by_id_for_update(task_id)
+            self.check_existence(task_before, detail=TASK_NOT_FOUND_MSG)
+            deltas = task_counter_deltas(task_before, sign=-1)
 
         updated_task: Task = await self.uow.task.update_one_by_id(task_id=task_id, **data)
         self.check_existence(updated_task, detail=TASK_NOT_FOUND_MSG)
+        if deltas is not None:
+            deltas.update(task_counter_deltas(updated_task))
+            await self.uow.task_counter.apply_deltas(deltas)
+        await self.uow.task_outbox.add_event(task_id, TaskEvent.updated)
         return updated_task.to_schema()
 
     @transaction_mode
     async def delete_one_by_id(self, obj_id: UUID4) -> None:
         """Delete a task by ID"""
-        task = await self.uow.task.get_one_by_id_or_none(obj_id=obj_id)
+        task = await self.uow.task.get_one_by_id_for_update(obj_id)
         self.check_existence(task, detail=TASK_NOT_FOUND_MSG)
         await self.uow.task.delete_task(task)
+        await self.uow.task_counter.apply_deltas(task_counter_deltas(task, sign=-1))
+        await self.uow.task_outbox.add_event(obj_id, TaskEvent.deleted)
+
+    async def get_task_card(self, task_id: UUID4) -> TaskCard:
+        """Get a task card from the read model, cards lag behind writes by the projection delay"""
+        card = await self.task_cards.get_task_card(task_id)
+        self.check_existence(card, detail=TASK_NOT_FOUND_MSG)
+        return TaskCard.model_validate(card)
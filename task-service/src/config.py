@@ -45,6 +45,19 @@ class MongoDBSettings(EnvDict):
     MONGO_USER: str
     MONGO_PASS: str
     MONGO_DB: str
+    MONGO_MAX_POOL_SIZE: int = 100
+    MONGO_MIN_POOL_SIZE: int = 0
+    MONGO_MAX_CONNECTING: int = 2
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int | None = None
+
+    @property
+    def MONGO_POOL_OPTIONS(self) -> dict:
+        return {
+            "maxPoolSize": self.MONGO_MAX_POOL_SIZE,
+            "minPoolSize": self.MONGO_MIN_POOL_SIZE,
+            "maxConnecting": self.MONGO_MAX_CONNECTING,
+            "waitQueueTimeoutMS": self.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        }
 
     @property
     def MONGO_URL_auth(self):
@@ -60,14 +73,35 @@ class RabbitMQSettings(EnvDict):
     RABBIT_PORT: int
     RABBIT_USER: str
     RABBIT_PASS: str
+    RABBIT_CHANNEL_POOL_SIZE: int = 8
+    RABBIT_RPC_TIMEOUT: float = 10.0
+    RABBIT_PREFETCH_COUNT: int = 32
+    RABBIT_CONSUMER_CONCURRENCY: int = 16
+    RABBIT_ACK_BATCH_SIZE: int = 16
+    RABBIT_ACK_INTERVAL: float = 0.05
+    RABBIT_STATS_INTERVAL: float = 60.0
+    RABBIT_BATCH_MAX_SIZE: int = 32
+    RABBIT_BATCH_WINDOW: float = 0.005
+    RABBIT_TASKS_COUNT_BATCHING: bool = True
 
     @property
     def RABBIT_URL(self):
         return f"amqp://{self.RABBIT_USER}:{self.RABBIT_PASS}@{self.RABBIT_HOST}:{self.RABBIT_PORT}//"
 
 
+class ProjectorSettings(EnvDict):
+    PROJECTOR_BATCH_SIZE: int = 100
+    PROJECTOR_POLL_INTERVAL: float = 0.5
+
+
+class ExportSettings(EnvDict):
+    EXPORT_BATCH_SIZE: int = 1000
+
+
 class Settings(PgSettings, MongoDBSettings):
     rabbit_settings: RabbitMQSettings = RabbitMQSettings()
+    projector_settings: ProjectorSettings = ProjectorSettings()
+    export_settings: ExportSettings = ExportSettings()
 
 
 settings = Settings()
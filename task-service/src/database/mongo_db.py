@@ -1,7 +1,59 @@
-from pymongo import MongoClient
+import datetime
+import enum
+from typing import Any
+
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions, TypeEncoder, TypeRegistry
+from pymongo import AsyncMongoClient, MongoClient
 
 from src.config import settings
+from src.models.task import Status, Role
+from src.models.task_counter import CounterRole
+
+
+class EnumEncoder(TypeEncoder):
+    """Stores an enum member as its value"""
+
+    def __init__(self, enum_type: type[enum.Enum]) -> None:
+        self._enum_type = enum_type
+
+    @property
+    def python_type(self) -> type[enum.Enum]:
+        return self._enum_type
+
+    def transform_python(self, value: enum.Enum) -> Any:
+        return value.value
+
+
+class DateEncoder(TypeEncoder):
+    """Stores a date as a UTC midnight datetime, BSON has no date type"""
+    python_type = datetime.date
+
+    def transform_python(self, value: datetime.date) -> datetime.datetime:
+        return datetime.datetime.combine(value, datetime.time(), tzinfo=datetime.UTC)
+
+
+# UUIDs are stored as binary subtype 4 and decoded back to uuid.UUID in C, at any depth.
+# Datetimes are read as naive UTC, like the timestamps of the SQL models.
+CODEC_OPTIONS = CodecOptions(
+    uuid_representation=UuidRepresentation.STANDARD,
+    type_registry=TypeRegistry([
+        EnumEncoder(Status),
+        EnumEncoder(Role),
+        EnumEncoder(CounterRole),
+        DateEncoder(),
+    ]),
+)
+
+MONGO_CLIENT_OPTIONS = {
+    "uuidRepresentation": "standard",
+    "type_registry": CODEC_OPTIONS.type_registry,
+    **settings.MONGO_POOL_OPTIONS,
+}
+
 
+mongo_client = MongoClient(settings.MONGO_URL_noauth, **MONGO_CLIENT_OPTIONS)
+mongo_db = mongo_client.get_database(settings.MONGO_DB, codec_options=CODEC_OPTIONS)
 
-mongo_client = MongoClient(settings.MONGO_URL_noauth)
-mongo_db = mongo_client[f"{settings.MONGO_DB}"]
+async_mongo_client = AsyncMongoClient(settings.MONGO_URL_noauth, **MONGO_CLIENT_OPTIONS)
+async_mongo_db = async_mongo_client.get_database(settings.MONGO_DB, codec_options=CODEC_OPTIONS)
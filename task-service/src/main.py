@@ -6,22 +6,37 @@ from  fastapi import  FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api import router
-from src.messaging.connection import get_connection
+from src.database.mongo_db import async_mongo_client
+from src.messaging.connection import get_connection, get_channel_pool
 from src.messaging.consumers import get_tasks_count
+from src.messaging.rpc import get_rpc_client
+from src.messaging.topology import declare_topology
+from src.utils.task_projector import project_task_cards
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     rabbit_conn = await get_connection()
-    task = asyncio.create_task(get_tasks_count())
+    await declare_topology()
+    rpc_client = get_rpc_client()
+    await rpc_client.connect()
+    tasks = [
+        asyncio.create_task(get_tasks_count()),
+        asyncio.create_task(project_task_cards()),
+    ]
 
     yield
 
-    task.cancel()
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await rpc_client.close()
+    await get_channel_pool().close()
+    await async_mongo_client.close()
     await rabbit_conn.close()
 
 app = FastAPI(lifespan=lifespan)
@@ -1,11 +1,12 @@
 import logging
 
-from aio_pika import Message
+from aio_pika.abc import AbstractIncomingMessage
 from pydantic import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
-from src.messaging.connection import get_channel
+from src.config import settings
 from src.messaging import queues_names
+from src.messaging.runtime import RpcConsumer, BatchRpcConsumer
 from src.schemas.messaging import TasksCount
 from src.utils.unit_of_work import UnitOfWork
 
@@ -13,29 +14,45 @@ from src.utils.unit_of_work import UnitOfWork
 log = logging.getLogger(__name__)
 
 
+async def handle_tasks_count(message: AbstractIncomingMessage) -> TasksCount:
+    body = TasksCount.model_validate_json(message.body.decode())
+    uow = UnitOfWork()
+    async with uow:
+        counts = await uow.task_counter.get_counts_for_users([body.data.user_id])
+    body.data.count_assigned_tasks, body.data.count_authored_tasks = counts.get(body.data.user_id, (0, 0))
+    return body
+
+
+async def handle_tasks_count_batch(messages: list[AbstractIncomingMessage]) -> list[TasksCount | ValidationError]:
+    """Answer a batch of tasks_count requests with a single query.
+    Invalid requests get their ValidationError instead of a reply and are rejected.
+    """
+    bodies: list[TasksCount | ValidationError] = []
+    for message in messages:
+        try:
+            bodies.append(TasksCount.model_validate_json(message.body.decode()))
+        except ValidationError as e:
+            bodies.append(e)
+
+    user_ids = {body.data.user_id for body in bodies if isinstance(body, TasksCount)}
+    if not user_ids:
+        return bodies
+
+    uow = UnitOfWork()
+    async with uow:
+        counts = await uow.task_counter.get_counts_for_users(user_ids)
+
+    for body in bodies:
+        if isinstance(body, TasksCount):
+            body.data.count_assigned_tasks, body.data.count_authored_tasks = counts.get(body.data.user_id, (0, 0))
+    return bodies
+
+
 async def get_tasks_count():
-    ch = await get_channel()
-    async with ch:
-        queue = await ch.declare_queue(queues_names.TASKS_COUNT)
-
-        uow = UnitOfWork()
-
-        async with queue.iterator() as queue_iter:
-            async for message in queue_iter:
-                try:
-                    async with message.process():
-                        body = TasksCount.model_validate_json(message.body.decode())
-                        async with uow:
-                            data = await uow.task.get_tasks_count_for_user(body.data.user_id)
-                            body.data.count_assigned_tasks, body.data.count_authored_tasks = data
-
-                        await ch.default_exchange.publish(
-                            Message(
-                                body=body.model_dump_json().encode(),
-                                correlation_id=message.correlation_id,
-                            ),
-                            routing_key=message.reply_to
-                        )
-                except (ValidationError, SQLAlchemyError) as e:
-                    log.error(f"Failed process message ({message.body.decode()}): {e}")
-                    await message.nack(requeue=True)
+    if settings.rabbit_settings.RABBIT_TASKS_COUNT_BATCHING:
+        consumer = BatchRpcConsumer(
+            queues_names.TASKS_COUNT, handle_tasks_count_batch, requeue_on=(SQLAlchemyError,)
+        )
+    else:
+        consumer = RpcConsumer(queues_names.TASKS_COUNT, handle_tasks_count, requeue_on=(SQLAlchemyError,))
+    await consumer.consume()
@@ -1,46 +1,45 @@
-import asyncio
 import logging
-from uuid import UUID, uuid4
+from typing import Iterable
+from uuid import UUID
 
-from aio_pika import Message
-from aio_pika.abc import AbstractIncomingMessage
 from pydantic import ValidationError
 
-from src.messaging.connection import get_channel
+from src.messaging.rpc import get_rpc_client
 from src.messaging import queues_names
-from src.schemas.messaging import UserExists, UserExistsData
+from src.schemas.messaging import UsersExist, UsersExistData, UsersInfo, UsersInfoData, UserInfo
 
 log = logging.getLogger(__name__)
 
 
-async def check_user_existence(user_id: UUID) -> UserExists | None:
-    ch = await get_channel()
-    async with ch:
-        queue = await ch.declare_queue(queues_names.CHECK_EXISTENCE)
+async def check_users_existence(user_ids: Iterable[UUID]) -> dict[UUID, bool] | None:
+    """Check several users with a single RPC.
+    Returns a user_id -> is_exists map, or None if auth-service did not answer.
+    """
+    payload = UsersExist(data=UsersExistData(user_ids=list(user_ids))).model_dump_json()
 
-        payload = UserExists(data=UserExistsData(user_id=user_id)).model_dump_json()
+    body = await get_rpc_client().call(queues_names.CHECK_EXISTENCE_BATCH, payload.encode())
+    if body is None:
+        return None
 
-        callback_queue = await ch.declare_queue(exclusive=True, auto_delete=True)
-        correlation_id = str(uuid4())
-        future = asyncio.get_event_loop().create_future()
+    try:
+        return UsersExist.model_validate_json(body.decode()).data.existence
+    except ValidationError as e:
+        log.error(f"Failed validate UsersExist({body.decode()}): {e}")
+    return None
 
-        async def on_response(message: AbstractIncomingMessage) -> None:
-            if message.correlation_id == correlation_id:
-                try:
-                    data = UserExists.model_validate_json(message.body.decode())
-                    future.set_result(data)
-                except ValidationError as e:
-                    log.error(f"Failed validate UserExists({message.body.decode()}): {e}")
 
-        await callback_queue.consume(on_response)
+async def get_users_info(user_ids: Iterable[UUID]) -> dict[UUID, UserInfo] | None:
+    """Get names and emails of several users with a single RPC.
+    Unknown users are missing from the result, None means auth-service did not answer.
+    """
+    payload = UsersInfo(data=UsersInfoData(user_ids=list(user_ids))).model_dump_json()
 
-        await ch.default_exchange.publish(
-            Message(
-                body=payload.encode(),
-                reply_to=callback_queue.name,
-                correlation_id=correlation_id,
-            ),
-            routing_key=queue.name,
-        )
+    body = await get_rpc_client().call(queues_names.USERS_INFO, payload.encode())
+    if body is None:
+        return None
 
-        return await future
+    try:
+        return UsersInfo.model_validate_json(body.decode()).data.users
+    except ValidationError as e:
+        log.error(f"Failed validate UsersInfo({body.decode()}): {e}")
+    return None
@@ -1,2 +1,4 @@
 CHECK_EXISTENCE = "user_existence"
+CHECK_EXISTENCE_BATCH = "users_existence"
+USERS_INFO = "users_info"
 TASKS_COUNT = "tasks_count"
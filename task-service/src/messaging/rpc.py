@@ -0,0 +1,97 @@
+import asyncio
+import logging
+from uuid import uuid4
+
+from aio_pika import Message
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage, AbstractQueue
+
+from src.config import settings
+from src.messaging.connection import get_connection
+
+log = logging.getLogger(__name__)
+
+
+class RpcClient:
+    """Long-lived RPC client.
+
+    Owns one channel and one exclusive reply queue for the whole process.
+    Pending calls are tracked in a correlation_id -> future map, so concurrent
+    requests share the same plumbing and each call costs one publish and one reply.
+    Request queues are declared by `declare_topology` at startup.
+    """
+
+    def __init__(self, timeout: float = settings.rabbit_settings.RABBIT_RPC_TIMEOUT) -> None:
+        self.timeout = timeout
+        self._channel: AbstractChannel | None = None
+        self._callback_queue: AbstractQueue | None = None
+        self._futures: dict[str, asyncio.Future[bytes]] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_connected(self) -> bool:
+        return self._channel is not None and not self._channel.is_closed
+
+    async def connect(self) -> None:
+        async with self._lock:
+            if self.is_connected:
+                return
+            conn = await get_connection()
+            self._channel = await conn.channel()
+            self._callback_queue = await self._channel.declare_queue(exclusive=True, auto_delete=True)
+            await self._callback_queue.consume(self._on_response, no_ack=True)
+
+    async def close(self) -> None:
+        for future in self._futures.values():
+            if not future.done():
+                future.cancel()
+        self._futures.clear()
+
+        if self._channel is not None and not self._channel.is_closed:
+            await self._channel.close()
+        self._channel = None
+        self._callback_queue = None
+
+    async def call(self, routing_key: str, payload: bytes) -> bytes | None:
+        """Publish a request and wait for the reply body.
+        Returns None if no reply arrived within the timeout.
+        """
+        if not self.is_connected:
+            await self.connect()
+
+        correlation_id = str(uuid4())
+        future = asyncio.get_running_loop().create_future()
+        self._futures[correlation_id] = future
+
+        try:
+            await self._channel.default_exchange.publish(
+                Message(
+                    body=payload,
+                    reply_to=self._callback_queue.name,
+                    correlation_id=correlation_id,
+                ),
+                routing_key=routing_key,
+            )
+            return await asyncio.wait_for(future, timeout=self.timeout)
+        except asyncio.TimeoutError:
+            log.error(f"RPC call to '{routing_key}' timed out (correlation_id={correlation_id})")
+            return None
+        finally:
+            self._futures.pop(correlation_id, None)
+
+    async def _on_response(self, message: AbstractIncomingMessage) -> None:
+        future = self._futures.get(message.correlation_id)
+        if future is None:
+            log.warning(f"Got reply with unknown correlation_id={message.correlation_id}")
+            return
+        if not future.done():
+            future.set_result(message.body)
+
+
+_rpc_client = None
+
+
+def get_rpc_client() -> RpcClient:
+    global _rpc_client
+    if _rpc_client is None:
+        _rpc_client = RpcClient()
+    return _rpc_client
@@ -0,0 +1,30 @@
+import logging
+
+from aio_pika.abc import AbstractChannel
+
+from src.messaging import queues_names
+from src.messaging.connection import get_connection
+
+log = logging.getLogger(__name__)
+
+# Every queue name of queues_names.py, the single source of the broker topology
+QUEUES: tuple[str, ...] = tuple(
+    value for name, value in vars(queues_names).items() if name.isupper() and isinstance(value, str)
+)
+
+_topology_channel: AbstractChannel | None = None
+
+
+async def declare_topology() -> None:
+    """Declare every queue once at startup, producers publish without declaring.
+    The channel stays open, so the robust connection declares them again after a reconnect.
+    """
+    global _topology_channel
+    if _topology_channel is not None and not _topology_channel.is_closed:
+        return
+
+    conn = await get_connection()
+    _topology_channel = await conn.channel()
+    for queue_name in QUEUES:
+        await _topology_channel.declare_queue(queue_name)
+    log.info(f"Declared queues: {', '.join(QUEUES)}")
@@ -3,7 +3,8 @@ import enum
 from uuid import UUID
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Text, ForeignKey, text, Enum
+from sqlalchemy import String, Text, ForeignKey, text, Enum, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
 
 from src.models.base import Base, uuid_pk, str_100
 
@@ -19,8 +20,36 @@ class Role(enum.Enum):
     watcher = "watcher"
 
 
+class SearchLanguage(enum.Enum):
+    en = "english"
+    ru = "russian"
+
+
+def search_vector_expression(language: SearchLanguage) -> str:
+    """SQL of the generated tsvector: the title weighs more than the description"""
+    return (
+        f"setweight(to_tsvector('{language.value}', coalesce(title, '')), 'A') || "
+        f"setweight(to_tsvector('{language.value}', coalesce(description, '')), 'B')"
+    )
+
+
 class Task(Base):
     __tablename__ = "task"
+    __table_args__ = (
+        Index("ix_task_schema_task_created_at_id", "created_at", "id"),
+        Index("ix_task_schema_task_assignee_id_status_created_at", "assignee_id", "status", "created_at"),
+        Index("ix_task_schema_task_author_id_created_at", "author_id", "created_at"),
+        Index("ix_task_schema_task_status_created_at", "status", "created_at"),
+        Index(
+            "ix_task_schema_task_title_trgm", "title",
+            postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index(
+            "ix_task_schema_task_description_trgm", "description",
+            postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}),
+        Index("ix_task_schema_task_search_vector_en", "search_vector_en", postgresql_using="gin"),
+        Index("ix_task_schema_task_search_vector_ru", "search_vector_ru", postgresql_using="gin"),
+        {"schema": "task_schema"},
+    )
     repr_cols_num = 4
 
     id: Mapped[uuid_pk]
@@ -28,14 +57,17 @@ class Task(Base):
     description: Mapped[str | None] = mapped_column(Text)
     status: Mapped[Status] = mapped_column(Enum(Status, name="status", schema="task_schema"))
     created_at: Mapped[datetime] = mapped_column(
-        server_default=text("TIMEZONE('utc', now())"),
-        index=True)
+        server_default=text("TIMEZONE('utc', now())"))
     author_id: Mapped[UUID]
     assignee_id: Mapped[UUID | None]
     column_id: Mapped[UUID | None] = mapped_column(ForeignKey("task_schema.column.id", ondelete="SET NULL"))
     sprint_id: Mapped[UUID | None] = mapped_column(ForeignKey("task_schema.sprint.id", ondelete="SET NULL"))
     board_id: Mapped[UUID | None] = mapped_column(ForeignKey("task_schema.board.id", ondelete="SET NULL"))
     group_id: Mapped[UUID | None] = mapped_column(ForeignKey("task_schema.group.id", ondelete="SET NULL"))
+    search_vector_en: Mapped[str] = mapped_column(
+        TSVECTOR, Computed(search_vector_expression(SearchLanguage.en), persisted=True), deferred=True)
+    search_vector_ru: Mapped[str] = mapped_column(
+        TSVECTOR, Computed(search_vector_expression(SearchLanguage.ru), persisted=True), deferred=True)
 
     # participants: Mapped[list[UUID]] = relationship( # type: ignore  # noqa: F821
     #     back_populates="participant_tasks",
@@ -48,7 +80,7 @@ class Task(Base):
 
     def to_schema(self):
         from src.schemas.task import TaskDB
-        return TaskDB(**self.__dict__)
+        return TaskDB.model_validate(self.__dict__)
 
 
 class TaskParticipant(Base):
@@ -0,0 +1,27 @@
+import enum
+from uuid import UUID
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Enum, text
+
+from src.models.base import Base
+from src.models.task import Status
+
+
+class CounterRole(enum.Enum):
+    author = "author"
+    assignee = "assignee"
+
+
+class TaskCounter(Base):
+    """Number of tasks per (user, role, status), maintained together with the task table"""
+    __tablename__ = "task_counter"
+
+    user_id: Mapped[UUID] = mapped_column(primary_key=True)
+    role: Mapped[CounterRole] = mapped_column(
+        Enum(CounterRole, name="counter_role", schema="task_schema"),
+        primary_key=True)
+    status: Mapped[Status] = mapped_column(
+        Enum(Status, name="status", schema="task_schema"),
+        primary_key=True)
+    count: Mapped[int] = mapped_column(server_default=text("0"))
@@ -0,0 +1,25 @@
+import enum
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, Enum, Identity, text
+
+from src.models.base import Base
+
+
+class TaskEvent(enum.Enum):
+    created = "created"
+    updated = "updated"
+    deleted = "deleted"
+
+
+class TaskOutbox(Base):
+    """Task change events, written in the same transaction as the change and consumed by the projector"""
+    __tablename__ = "task_outbox"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    task_id: Mapped[UUID]
+    event: Mapped[TaskEvent] = mapped_column(Enum(TaskEvent, name="task_event", schema="task_schema"))
+    created_at: Mapped[datetime] = mapped_column(
+        server_default=text("TIMEZONE('utc', now())"))
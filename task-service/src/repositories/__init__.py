@@ -1,5 +1,9 @@
 from src.repositories.task import TaskRepository
+from src.repositories.task_counter import TaskCounterRepository
+from src.repositories.task_outbox import TaskOutboxRepository
 
 __all__ = [
     "TaskRepository",
+    "TaskCounterRepository",
+    "TaskOutboxRepository",
 ]
@@ -1,67 +1,75 @@
 import logging
+from collections import Counter
+from typing import Iterable
+from uuid import UUID
+
+from pymongo import ASCENDING, DeleteOne, InsertOne, UpdateOne
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.database import Database
+from pymongo.errors import BulkWriteError
 
-from bson import Binary
 from bson.objectid import ObjectId
 from bson.errors import InvalidId
 
-from src.database.mongo_db import mongo_db
+from src.database.mongo_db import mongo_db, async_mongo_db
 
 
 log = logging.getLogger(__name__)
 
+# A tag repeated in one document is counted once, like in `_count_tags`
+TAGS_PIPELINE = [
+    {"$project": {"tags": {"$setUnion": [{"$ifNull": ["$tags", []]}, []]}}},
+    {"$unwind": "$tags"},
+    {"$group": {"_id": "$tags", "task_count": {"$sum": 1}}},
+]
+
+
+class BaseMongoTaskRepository:
+    """UUIDs, enums and datetimes are converted by the codec options of the database"""
+
+    @staticmethod
+    def _to_object_id(task_id: str | ObjectId) -> ObjectId | None:
+        if isinstance(task_id, str):
+            try:
+                return ObjectId(task_id)
+            except (InvalidId, TypeError) as e:
+                log.error(f"Неверный формат task_id={task_id}: {e}")
+                return None
+        return task_id
+
 
-class MongoTaskRepository:
+class MongoTaskRepository(BaseMongoTaskRepository):
     def __init__(self, db: Database) -> None:
         self.db = db
         self.tasks = db.tasks
-    
-    def _ids_from_binary_to_uuid(self, data: dict) -> None:
-        for k, v in data.items():
-            if "id" in k and not isinstance(v, ObjectId):
-                data[k] = Binary.as_uuid(v)
-
-    def _ids_from_uuid_to_binary(self, data: dict) -> None:
-        for k, v in data.items():
-            if "id" in k:
-                data[k] = Binary.from_uuid(v)
 
     def create_task(self, data: dict) -> str | None:
         try:
-            self._ids_from_uuid_to_binary(data)
             res = self.tasks.insert_one(data)
             log.info(f"Задача c id={res.inserted_id} успешно добавлена в MongoDB")
             return res.inserted_id
         except Exception as e:
             log.error(f"Ошибка при добавлении задачи: {e}")
 
-    
+
     def get_task_by_id(self, task_id: str | ObjectId) -> dict | None:
-        if isinstance(task_id, str):
-            try:
-                task_id = ObjectId(task_id)
-            except (InvalidId, TypeError) as e:
-                log.error(f"Неверный формат task_id={task_id}: {e}")
-                return
+        task_id = self._to_object_id(task_id)
+        if task_id is None:
+            return
 
         try:
             res = self.tasks.find_one({"_id": task_id})
 
             if res is None:
                 log.warning(f"Не удалось получить задачу c id={task_id}")
-            else:
-                self._ids_from_binary_to_uuid(res)
             return res
         except Exception as e:
             log.error(f"Ошибка при получении задачи с id={task_id}: {e}")
-    
+
     def delete_task(self, task_id: str | ObjectId) -> bool:
-        if isinstance(task_id, str):
-            try:
-                task_id = ObjectId(task_id)
-            except (InvalidId, TypeError) as e:
-                log.error(f"Неверный формат task_id={task_id}: {e}")
-                return False
+        task_id = self._to_object_id(task_id)
+        if task_id is None:
+            return False
 
         try:
             res = self.tasks.delete_one({"_id": task_id})
@@ -71,19 +79,209 @@ class MongoTaskRepository:
         except Exception as e:
             log.error(f"Ошибка при удалении задачи с id={task_id}: {e}")
         return False
-    
+
     def aggregate_by_tags(self) -> list[dict]:
         """
-        :return list: [{'_id': ['tag_1', 'tag_2', n], 'task_count': n}]
+        :return list: [{'_id': 'tag_1', 'task_count': n}]
         """
-        pipeline = [{
-            "$group": {
-                "_id": "$tags",
-                "task_count": {"$sum": 1},
-            }
-        }]
-        tags = self.tasks.aggregate(pipeline)
+        tags = self.tasks.aggregate(TAGS_PIPELINE)
         return tags.to_list()
 
 
+class AsyncMongoTaskRepository(BaseMongoTaskRepository):
+    """Asyncio counterpart of MongoTaskRepository with bulk operations.
+    Bulk methods send one unordered bulk_write, so a failed document does not
+    stop the rest of the batch.
+
+    Per-tag task counts are kept in the `tag_stats` collection ({_id: tag, task_count: n})
+    and updated with $inc on every insert and delete. The updates are not transactional
+    with the task writes, `rebuild_tag_stats` recomputes the collection from tasks.
+    """
+
+    def __init__(self, db: AsyncDatabase) -> None:
+        self.db = db
+        self.tasks = db.tasks
+        self.tag_stats = db.tag_stats
+
+    async def create_indexes(self) -> None:
+        """Multikey index on tags for per-tag queries and the rebuild"""
+        await self.tasks.create_index([("tags", ASCENDING)], name="tags")
+
+    async def _inc_tag_stats(self, counts: Counter) -> None:
+        counts = {tag: count for tag, count in counts.items() if count}
+        if not counts:
+            return
+
+        try:
+            await self.tag_stats.bulk_write(
+                [
+                    UpdateOne({"_id": tag}, {"$inc": {"task_count": count}}, upsert=True)
+                    for tag, count in sorted(counts.items())
+                ],
+                ordered=False,
+            )
+            decremented = sorted(tag for tag, count in counts.items() if count < 0)
+            if decremented:
+                await self.tag_stats.delete_many({"_id": {"$in": decremented}, "task_count": {"$lte": 0}})
+        except Exception as e:
+            log.error(f"Ошибка при обновлении статистики тегов {list(counts)}: {e}")
+
+    @staticmethod
+    def _count_tags(documents: Iterable[dict], sign: int = 1) -> Counter:
+        counts = Counter()
+        for data in documents:
+            for tag in set(data.get("tags") or ()):
+                counts[tag] += sign
+        return counts
+
+    async def create_task(self, data: dict) -> ObjectId | None:
+        try:
+            res = await self.tasks.insert_one(data)
+            log.info(f"Задача c id={res.inserted_id} успешно добавлена в MongoDB")
+            await self._inc_tag_stats(self._count_tags([data]))
+            return res.inserted_id
+        except Exception as e:
+            log.error(f"Ошибка при добавлении задачи: {e}")
+
+    async def get_task_by_id(self, task_id: str | ObjectId) -> dict | None:
+        task_id = self._to_object_id(task_id)
+        if task_id is None:
+            return
+
+        try:
+            res = await self.tasks.find_one({"_id": task_id})
+
+            if res is None:
+                log.warning(f"Не удалось получить задачу c id={task_id}")
+            return res
+        except Exception as e:
+            log.error(f"Ошибка при получении задачи с id={task_id}: {e}")
+
+    async def delete_task(self, task_id: str | ObjectId) -> bool:
+        task_id = self._to_object_id(task_id)
+        if task_id is None:
+            return False
+
+        try:
+            res = await self.tasks.find_one_and_delete({"_id": task_id}, projection={"tags": True})
+
+            log.info(f"Задача c id={task_id} удалена из MongoDB")
+            if res is not None:
+                await self._inc_tag_stats(self._count_tags([res], sign=-1))
+            return True
+        except Exception as e:
+            log.error(f"Ошибка при удалении задачи с id={task_id}: {e}")
+        return False
+
+    async def bulk_create(self, documents: Iterable[dict]) -> list[ObjectId]:
+        """Insert documents with one unordered bulk_write.
+        Returns the ids of inserted documents, in the input order.
+        """
+        ids, docs = [], []
+        for data in documents:
+            data = dict(data)
+            data.setdefault("_id", ObjectId())
+            ids.append(data["_id"])
+            docs.append(data)
+        if not docs:
+            return []
+
+        failed = set()
+        try:
+            await self.tasks.bulk_write([InsertOne(data) for data in docs], ordered=False)
+            log.info(f"{len(ids)} задач успешно добавлено в MongoDB")
+        except BulkWriteError as e:
+            failed = {error["index"] for error in e.details.get("writeErrors", [])}
+            log.error(f"Ошибка при добавлении {len(failed)} из {len(ids)} задач: {e.details.get('writeErrors')}")
+        except Exception as e:
+            log.error(f"Ошибка при добавлении {len(ids)} задач: {e}")
+            return []
+
+        await self._inc_tag_stats(self._count_tags(data for idx, data in enumerate(docs) if idx not in failed))
+        return [task_id for idx, task_id in enumerate(ids) if idx not in failed]
+
+    async def bulk_delete(self, task_ids: Iterable[str | ObjectId]) -> int:
+        """Delete tasks with one unordered bulk_write, returns the number of deleted ones"""
+        task_ids = [task_id for task_id in map(self._to_object_id, task_ids) if task_id is not None]
+        if not task_ids:
+            return 0
+
+        try:
+            found = await self.tasks.find({"_id": {"$in": task_ids}}, projection={"tags": True}).to_list()
+            res = await self.tasks.bulk_write(
+                [DeleteOne({"_id": task_id}) for task_id in task_ids], ordered=False
+            )
+            deleted_count = res.deleted_count
+        except BulkWriteError as e:
+            log.error(f"Ошибка при удалении задач: {e.details.get('writeErrors')}")
+            failed = {task_ids[error["index"]] for error in e.details.get("writeErrors", [])}
+            found = [data for data in found if data["_id"] not in failed]
+            deleted_count = e.details.get("nRemoved", 0)
+        except Exception as e:
+            log.error(f"Ошибка при удалении {len(task_ids)} задач: {e}")
+            return 0
+
+        log.info(f"{deleted_count} задач удалено из MongoDB")
+        await self._inc_tag_stats(self._count_tags(found, sign=-1))
+        return deleted_count
+
+    async def upsert_task_cards(self, cards: Iterable[dict]) -> int:
+        """Write projected task cards with one unordered bulk_write.
+        Cards are keyed by the task UUID, tags are kept as they are in Mongo.
+        Errors are raised, so the projector retries the batch.
+        """
+        requests = [
+            UpdateOne(
+                {"_id": card["_id"]},
+                {
+                    "$set": {key: value for key, value in card.items() if key != "_id"},
+                    "$setOnInsert": {"tags": []},
+                },
+                upsert=True,
+            )
+            for card in cards
+        ]
+        if not requests:
+            return 0
+
+        res = await self.tasks.bulk_write(requests, ordered=False)
+        log.info(f"{res.upserted_count + res.modified_count} карточек задач обновлено в MongoDB")
+        return res.upserted_count + res.modified_count
+
+    async def delete_task_cards(self, task_ids: list[UUID]) -> int:
+        """Delete the task cards of deleted tasks, returns the number of deleted cards.
+        Cards are not counted in tag_stats. Errors are raised, so the projector retries the batch.
+        """
+        if not task_ids:
+            return 0
+
+        res = await self.tasks.delete_many({"_id": {"$in": task_ids}})
+        log.info(f"{res.deleted_count} карточек задач удалено из MongoDB")
+        return res.deleted_count
+
+    async def get_task_card(self, task_id: UUID) -> dict | None:
+        """Get a task card by the task UUID, a lookup on the _id index.
+        Errors are raised, so an unavailable Mongo is not reported as a missing card.
+        """
+        return await self.tasks.find_one({"_id": task_id})
+
+    async def aggregate_by_tags(self) -> list[dict]:
+        """Count tasks per tag over the whole collection
+        :return list: [{'_id': 'tag_1', 'task_count': n}]
+        """
+        tags = await self.tasks.aggregate(TAGS_PIPELINE)
+        return await tags.to_list()
+
+    async def get_tag_stats(self, tags: Iterable[str] | None = None) -> dict[str, int]:
+        """Read per-tag task counts from the maintained collection"""
+        query = {} if tags is None else {"_id": {"$in": list(tags)}}
+        stats = await self.tag_stats.find(query).to_list()
+        return {data["_id"]: data["task_count"] for data in stats}
+
+    async def rebuild_tag_stats(self) -> None:
+        """Recompute tag_stats from tasks, $out replaces the collection atomically"""
+        await self.tasks.aggregate([*TAGS_PIPELINE, {"$out": self.tag_stats.name}])
+
+
 mongo_task_repository = MongoTaskRepository(mongo_db)
+async_mongo_task_repository = AsyncMongoTaskRepository(async_mongo_db)
@@ -1,26 +1,49 @@
-from typing import Any, Sequence
+from datetime import datetime
+from itertools import chain
+from typing import Any, AsyncIterator, Sequence
 
 from pydantic import UUID4
-from sqlalchemy import select, update, func, case
+from sqlalchemy import RowMapping, Select, String, Text, select, update, tuple_, or_, func, literal, literal_column, cast
+from sqlalchemy.dialects.postgresql import REGCONFIG, aggregate_order_by, array_agg
+from sqlalchemy.orm import joinedload
 
-from src.models.task import Task
-from src.schemas.task import TaskFilters
+from src.models.task import Task, SearchLanguage
+from src.schemas.task import TaskDB, TaskFilters, TaskSearchFilters
 from src.utils.repository import SqlAlchemyRepository
 
 
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so that the value is matched literally"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 class TaskRepository(SqlAlchemyRepository[Task]):
     _model = Task
 
-    async def get_tasks_count_for_user(self, user_id: UUID4) -> tuple[Any, Any]:
-        """Get assigned_count and authored_count by user_id"""
-        query = select(
-                func.count(case((self._model.assignee_id == user_id, 1))).label("assigned_count"),
-                func.count(case((self._model.author_id == user_id, 1))).label("authored_count")
-            )
+    async def get_one_by_id_for_update(self, task_id: UUID4) -> Task | None:
+        """Get a task by ID and lock its row until the end of the transaction"""
+        query = (
+            select(self._model)
+            .filter(self._model.id == task_id)
+            .with_for_update()
+        )
+        res = await self._session.execute(query)
+        return res.scalar_one_or_none()
 
+    async def get_tasks_for_projection(self, task_ids: Sequence[UUID4]) -> Sequence[Task]:
+        """Get tasks with their board, column, sprint and group in one query"""
+        query = (
+            select(self._model)
+            .filter(self._model.id.in_(task_ids))
+            .options(
+                joinedload(self._model.board),
+                joinedload(self._model.column),
+                joinedload(self._model.sprint),
+                joinedload(self._model.group),
+            )
+        )
         res = await self._session.execute(query)
-        assigned_count, authored_count = res.one()
-        return assigned_count, authored_count
+        return res.scalars().all()
 
     async def update_one_by_id(self, task_id: UUID4, **kwargs: Any) -> Task | None:
         """Update a task by ID"""
@@ -37,10 +60,8 @@ class TaskRepository(SqlAlchemyRepository[Task]):
         """Delete a task"""
         await self._session.delete(task)
 
-    async def get_tasks_by_filters(self, filters: TaskFilters) -> Sequence[Task]:
-        """Get tasks by filters"""
-        query = select(self._model)
-
+    def apply_filters(self, query: Select, filters: TaskFilters) -> Select:
+        """Add the WHERE clauses of the filters to a query over tasks"""
         if filters.ids:
             query = query.filter(self._model.id.in_(filters.ids))
 
@@ -54,12 +75,128 @@ class TaskRepository(SqlAlchemyRepository[Task]):
             query = query.filter(self._model.assignee_id.in_(filters.assignee_id))
 
         if filters.like:
-            query = query.filter(self._model.title.like(f"%{filters.like}%"))
+            pattern = f"%{escape_like(filters.like)}%"
+            condition = self._model.title.ilike(pattern, escape="\\")
+            if filters.search_description:
+                condition = or_(condition, self._model.description.ilike(pattern, escape="\\"))
+            query = query.filter(condition)
+
+        return query
+
+    def get_tasks_by_filters_query(self, filters: TaskFilters) -> Select:
+        """Build the query of a page of tasks by filters, newest first.
+        With a cursor, selects the page after it using the (created_at, id) index.
+        """
+        query = (
+            select(self._model)
+            .order_by(self._model.created_at.desc(), self._model.id.desc())
+        )
+        query = self.apply_filters(query, filters)
 
-        if filters.page is not None:
+        if filters.cursor:
+            query = (
+                query
+                .filter(tuple_(self._model.created_at, self._model.id) < tuple_(*filters.after))
+                .limit(filters.per_page)
+            )
+        elif filters.page is not None:
             query = query.offset(filters.offset).limit(filters.limit)
         elif filters.per_page:
             query = query.limit(filters.per_page)
 
-        res = await self._session.execute(query)
+        return query
+
+    async def get_tasks_by_filters(self, filters: TaskFilters) -> Sequence[Task]:
+        """Get tasks by filters"""
+        res = await self._session.execute(self.get_tasks_by_filters_query(filters))
         return res.scalars().all()
+
+    async def stream_tasks_by_filters(
+        self, filters: TaskFilters, batch_size: int
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """Stream tasks by filters from a server-side cursor in batches of rows, newest first.
+        Selects the `TaskDB` columns only, so no objects are kept by the session.
+        With a cursor, starts after it, the page and the page size are not applied.
+        """
+        query = (
+            select(*(getattr(self._model, name) for name in TaskDB.model_fields))
+            .order_by(self._model.created_at.desc(), self._model.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        query = self.apply_filters(query, filters)
+        if filters.cursor:
+            query = query.filter(tuple_(self._model.created_at, self._model.id) < tuple_(*filters.after))
+
+        res = await self._session.stream(query)
+        try:
+            async for rows in res.mappings().partitions():
+                yield rows
+        finally:
+            await res.close()
+
+    def get_tasks_json_query(self, filters: TaskFilters) -> Select:
+        """Build the query of a page of tasks by filters rendered by Postgres as one JSON array.
+        The page is the same as of `get_tasks_by_filters_query`, each row is a `TaskDB` object.
+        Also selects the number of rows and (created_at, id) of the last one for the cursor.
+        """
+        fields = list(TaskDB.model_fields)
+        page = (
+            self.get_tasks_by_filters_query(filters)
+            .with_only_columns(*(getattr(self._model, name) for name in fields), self._model.created_at)
+            .subquery()
+        )
+        row = func.json_build_object(*chain.from_iterable((literal(name, String), page.c[name]) for name in fields))
+        payload = func.json_agg(aggregate_order_by(row, page.c.created_at.desc(), page.c.id.desc()))
+        oldest_first = (page.c.created_at.asc(), page.c.id.asc())
+        return select(
+            cast(func.coalesce(payload, literal_column("'[]'::json")), Text),
+            func.count(),
+            array_agg(aggregate_order_by(page.c.created_at, *oldest_first))[1],
+            array_agg(aggregate_order_by(page.c.id, *oldest_first))[1],
+        )
+
+    async def get_tasks_json(self, filters: TaskFilters) -> tuple[str, int, tuple[datetime, UUID4] | None]:
+        """Get a page of tasks by filters as a JSON array built by the database,
+        without loading the rows into the session.
+        Returns the array, the number of tasks in it and (created_at, id) of the last one.
+        """
+        res = await self._session.execute(self.get_tasks_json_query(filters))
+        payload, count, created_at, task_id = res.one()
+        return payload, count, (created_at, task_id) if count else None
+
+    def search_tasks_query(self, filters: TaskSearchFilters) -> Select:
+        """Build the full-text search query of a page of tasks, most relevant first.
+        Matches the generated tsvector of the chosen language, so the GIN index
+        is combined with the indexes of the other filters.
+        """
+        if filters.lang == SearchLanguage.ru:
+            vector = self._model.search_vector_ru
+        else:
+            vector = self._model.search_vector_en
+        ts_query = func.websearch_to_tsquery(cast(literal(filters.lang.value), REGCONFIG), filters.q)
+        rank = func.ts_rank(vector, ts_query)
+
+        query = (
+            select(self._model, rank.label("rank"))
+            .filter(vector.bool_op("@@")(ts_query))
+            .order_by(rank.desc(), self._model.id.desc())
+        )
+        query = self.apply_filters(query, filters)
+
+        if filters.cursor:
+            query = (
+                query
+                .filter(tuple_(rank, self._model.id) < tuple_(*filters.after))
+                .limit(filters.per_page)
+            )
+        elif filters.page is not None:
+            query = query.offset(filters.offset).limit(filters.limit)
+        elif filters.per_page:
+            query = query.limit(filters.per_page)
+
+        return query
+
+    async def search_tasks(self, filters: TaskSearchFilters) -> list[tuple[Task, float]]:
+        """Search tasks by text, returns the tasks with their ranks"""
+        res = await self._session.execute(self.search_tasks_query(filters))
+        return [(task, rank) for task, rank in res.all()]
@@ -0,0 +1,89 @@
+from collections import Counter
+from typing import Any, Iterable
+
+from pydantic import UUID4
+from sqlalchemy import select, delete, insert, func, case, literal, text, union_all, any_, Uuid
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+
+from src.models.task import Task, Status
+from src.models.task_counter import TaskCounter, CounterRole
+from src.utils.repository import SqlAlchemyRepository
+
+CounterKey = tuple[UUID4, CounterRole, Status]
+
+
+def task_counter_deltas(task: Any, sign: int = 1) -> Counter[CounterKey]:
+    """Counter deltas of adding (sign=1) or removing (sign=-1) a task"""
+    status = Status(task.status)
+    deltas: Counter[CounterKey] = Counter()
+    if task.author_id:
+        deltas[(task.author_id, CounterRole.author, status)] += sign
+    if task.assignee_id:
+        deltas[(task.assignee_id, CounterRole.assignee, status)] += sign
+    return deltas
+
+
+class TaskCounterRepository(SqlAlchemyRepository[TaskCounter]):
+    _model = TaskCounter
+
+    async def apply_deltas(self, deltas: Counter[CounterKey]) -> None:
+        """Add deltas to the counters with one upsert"""
+        values = [
+            {"user_id": user_id, "role": role, "status": status, "count": delta}
+            for (user_id, role, status), delta in sorted(deltas.items(), key=lambda item: str(item[0]))
+            if delta
+        ]
+        if not values:
+            return
+
+        query = pg_insert(self._model).values(values)
+        query = query.on_conflict_do_update(
+            index_elements=[self._model.user_id, self._model.role, self._model.status],
+            set_={"count": self._model.count + query.excluded.count},
+        )
+        await self._session.execute(query)
+
+    async def get_counts_for_users(self, user_ids: Iterable[UUID4]) -> dict[UUID4, tuple[int, int]]:
+        """Get assigned_count and authored_count for several users"""
+        query = (
+            select(
+                self._model.user_id,
+                func.sum(case((self._model.role == CounterRole.assignee, self._model.count), else_=0)),
+                func.sum(case((self._model.role == CounterRole.author, self._model.count), else_=0)),
+            )
+            .filter(self._model.user_id == any_(literal(list(user_ids), ARRAY(Uuid))))
+            .group_by(self._model.user_id)
+        )
+        res = await self._session.execute(query)
+        return {user_id: (assigned, authored) for user_id, assigned, authored in res.all()}
+
+    async def rebuild(self) -> None:
+        """Rebuild all counters from the task table.
+        Task writes are blocked until the transaction ends.
+        """
+        await self._session.execute(text(f"LOCK TABLE {Task.__table__.fullname} IN SHARE MODE"))
+        await self._session.execute(delete(self._model))
+
+        roles = union_all(
+            select(
+                Task.author_id.label("user_id"),
+                literal(CounterRole.author.value).label("role"),
+                Task.status,
+            ),
+            select(
+                Task.assignee_id.label("user_id"),
+                literal(CounterRole.assignee.value).label("role"),
+                Task.status,
+            ).filter(Task.assignee_id.is_not(None)),
+        ).subquery()
+        counts = (
+            select(
+                roles.c.user_id,
+                roles.c.role.cast(self._model.role.type),
+                roles.c.status,
+                func.count(),
+            )
+            .group_by(roles.c.user_id, roles.c.role, roles.c.status)
+        )
+        query = insert(self._model).from_select(["user_id", "role", "status", "count"], counts)
+        await self._session.execute(query)
@@ -0,0 +1,42 @@
+from typing import Iterable, Sequence
+
+from pydantic import UUID4
+from sqlalchemy import select, delete, insert, func, any_, literal, BigInteger
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from src.models.task_outbox import TaskOutbox, TaskEvent
+from src.utils.repository import SqlAlchemyRepository
+
+PROJECTION_LOCK_KEY = 7_310_517_001
+
+
+class TaskOutboxRepository(SqlAlchemyRepository[TaskOutbox]):
+    _model = TaskOutbox
+
+    async def add_event(self, task_id: UUID4, event: TaskEvent) -> None:
+        """Record a task change, must run in the transaction of the change"""
+        await self._session.execute(insert(self._model).values(task_id=task_id, event=event))
+
+    async def try_lock_projection(self) -> bool:
+        """Take the projection lock until the end of the transaction.
+        Only one projector applies events at a time, so they reach Mongo in order.
+        """
+        res = await self._session.execute(select(func.pg_try_advisory_xact_lock(PROJECTION_LOCK_KEY)))
+        return bool(res.scalar_one())
+
+    async def get_batch(self, limit: int) -> Sequence[TaskOutbox]:
+        """Get the oldest events and lock them until the end of the transaction"""
+        query = (
+            select(self._model)
+            .order_by(self._model.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        res = await self._session.execute(query)
+        return res.scalars().all()
+
+    async def delete_events(self, event_ids: Iterable[int]) -> None:
+        query = delete(self._model).filter(
+            self._model.id == any_(literal(list(event_ids), ARRAY(BigInteger)))
+        )
+        await self._session.execute(query)
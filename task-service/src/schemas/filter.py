@@ -7,6 +7,7 @@ from fastapi import Query
 class BaseFilter:
     page: int | None = Query(ge=0, default=None, description="Page number")
     per_page: int = Query(ge=1, le=100, default=100, description="Page size")
+    cursor: str | None = Query(default=None, description="Cursor of the next page, overrides page")
 
     @property
     def offset(self) -> int:
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class BaseMessage(BaseModel):
@@ -27,4 +27,29 @@ class UserExistsData(UserID):
 
 class UserExists(BaseMessage):
     type: str = "user_exists"
-    data: UserExistsData
\ No newline at end of file
+    data: UserExistsData
+
+
+class UsersExistData(BaseModel):
+    user_ids: list[UUID]
+    existence: dict[UUID, bool] = Field(default_factory=dict)
+
+
+class UsersExist(BaseMessage):
+    type: str = "users_exist"
+    data: UsersExistData
+
+
+class UserInfo(BaseModel):
+    full_name: str
+    email: str
+
+
+class UsersInfoData(BaseModel):
+    user_ids: list[UUID]
+    users: dict[UUID, UserInfo] = Field(default_factory=dict)
+
+
+class UsersInfo(BaseMessage):
+    type: str = "users_info"
+    data: UsersInfoData
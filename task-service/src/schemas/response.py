@@ -1,3 +1,6 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from starlette.status import HTTP_200_OK, HTTP_201_CREATED
 
@@ -10,4 +13,31 @@ class BaseResponse(BaseModel):
 class BaseCreateResponse(BaseModel):
     status: int = HTTP_201_CREATED
     error: bool = False
-    
\ No newline at end of file
+
+
+class PydanticJSONResponse(JSONResponse):
+    """Renders a response model straight to JSON bytes with its pydantic-core serializer.
+    Returning it from a route skips the `response_model` validation and serialization,
+    `response_model` is then only used for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return super().render(content)
+
+
+class PassthroughJSONResponse(PydanticJSONResponse):
+    """Renders a response model whose `payload` is already encoded JSON, e.g. built by the database.
+    The envelope is rendered without the payload and the payload bytes are spliced in as they are,
+    so they are neither parsed nor encoded again.
+    """
+
+    def __init__(self, content: BaseModel, payload: str | bytes, **kwargs: Any) -> None:
+        self.payload = payload.encode() if isinstance(payload, str) else payload
+        super().__init__(content, **kwargs)
+
+    def render(self, content: BaseModel) -> bytes:
+        envelope = content.__pydantic_serializer__.to_json(content, exclude={"payload"})
+        separator = b"," if envelope != b"{}" else b""
+        return b"".join((envelope[:-1], separator, b'"payload":', self.payload, b"}"))
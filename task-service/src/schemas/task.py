@@ -1,13 +1,16 @@
+import enum
 import re
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import Query
 from pydantic import UUID4, BaseModel, Field, field_validator
 
-from src.models.task import Status
+from src.models.task import Status, SearchLanguage
 from src.schemas.filter import TypeFilter
 from src.schemas.response import BaseCreateResponse, BaseResponse
+from src.utils.cursor import decode_cursor
 
 FORBIDDEN_SYMBOLS = r"<>{}|"
 
@@ -65,6 +68,45 @@ class TaskResponse(BaseResponse):
 
 class TaskListResponse(BaseResponse):
     payload: list[TaskDB]
+    next_cursor: str | None = None
+
+
+class CardUser(BaseModel):
+    full_name: str
+    email: str
+
+
+class CardRef(BaseModel):
+    id: UUID
+    name: str
+
+
+class TaskCard(BaseModel):
+    """Denormalized task document of the Mongo read model"""
+    id: UUID = Field(validation_alias="_id")
+    title: str
+    description: str | None = None
+    status: Status
+    tags: list[str] = Field(default_factory=list)
+    created_at: datetime
+    author_id: UUID
+    assignee_id: UUID | None = None
+    author: CardUser | None = None
+    assignee: CardUser | None = None
+    board: CardRef | None = None
+    column: CardRef | None = None
+    sprint: CardRef | None = None
+    group: CardRef | None = None
+    projected_at: datetime
+
+
+class TaskCardResponse(BaseResponse):
+    payload: TaskCard
+
+
+class ExportFormat(enum.Enum):
+    ndjson = "ndjson"
+    csv = "csv"
 
 
 @dataclass
@@ -73,3 +115,20 @@ class TaskFilters(TypeFilter):
     status: list[Status] | None = Query(None)
     author_id: list[UUID] | None = Query(None)
     assignee_id: list[UUID] | None = Query(None)
+    search_description: bool = Query(False, description="Match `like` against the description too")
+
+    @property
+    def after(self) -> tuple[datetime, UUID] | None:
+        """(created_at, id) of the last task of the previous page"""
+        return decode_cursor(self.cursor, tuple[datetime, UUID]) if self.cursor else None
+
+
+@dataclass
+class TaskSearchFilters(TaskFilters):
+    q: str = Query(min_length=1, max_length=255, description="Search query in web search syntax")
+    lang: SearchLanguage = Query(SearchLanguage.en, description="Text search configuration")
+
+    @property
+    def after(self) -> tuple[float, UUID] | None:
+        """(rank, id) of the last task of the previous page"""
+        return decode_cursor(self.cursor, tuple[float, UUID]) if self.cursor else None
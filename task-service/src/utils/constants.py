@@ -1 +1,2 @@
 TASK_NOT_FOUND_MSG = "Task not found"
+INVALID_CURSOR_MSG = "Invalid cursor"
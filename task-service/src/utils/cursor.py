@@ -0,0 +1,23 @@
+import base64
+from typing import Any, TypeVar
+
+from pydantic import TypeAdapter, ValidationError
+
+T = TypeVar("T")
+
+
+def encode_cursor(position: tuple[Any, ...]) -> str:
+    """Encode the sort key of the last row into an opaque cursor"""
+    raw = TypeAdapter(tuple).dump_json(position)
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, position_type: type[T]) -> T:
+    """Decode a cursor created by `encode_cursor`.
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return TypeAdapter(position_type).validate_json(raw)
+    except (ValueError, ValidationError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
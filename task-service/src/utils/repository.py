@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any, Never, TypeVar, Generic, Type, Sequence
+from typing import Any, AsyncIterator, Never, TypeVar, Generic, Type, Sequence
 
 from pydantic import UUID4
-from sqlalchemy import insert, select, update, delete
+from sqlalchemy import insert, select, update, delete, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.base import Base
@@ -36,6 +36,11 @@ class AbstractRepository(ABC):
         """Get all from the repository"""
         raise NotImplementedError
 
+    @abstractmethod
+    async def iter_chunks(self, *args: Any, **kwargs: Any) -> Never:
+        """Iterate over all from the repository in chunks"""
+        raise NotImplementedError
+
     @abstractmethod
     async def update_one_by_id(self, *args: Any, **kwargs: Any) -> Never:
         """Update one from the repository"""
@@ -85,6 +90,27 @@ class SqlAlchemyRepository(AbstractRepository, Generic[M]):
         res = await self._session.execute(query)
         return res.scalars().all()
 
+    async def iter_chunks(self, batch_size: int = 1000) -> AsyncIterator[Sequence[M]]:
+        """Yield all rows in chunks of up to `batch_size`, ordered by the primary key.
+        Each chunk is a keyset query after the last key of the previous one, so memory
+        is bounded by one chunk and no server-side cursor is held between them.
+        Rows added or deleted meanwhile may be seen or skipped, like with any keyset scan.
+        """
+        mapper = self._model.__mapper__
+        primary_key = tuple_(*mapper.primary_key)
+        query = select(self._model).order_by(*mapper.primary_key).limit(batch_size)
+        last_key = None
+        while True:
+            chunk_query = query if last_key is None else query.filter(primary_key > tuple_(*last_key))
+            res = await self._session.execute(chunk_query)
+            chunk = res.scalars().all()
+            if not chunk:
+                return
+            yield chunk
+            if len(chunk) < batch_size:
+                return
+            last_key = mapper.primary_key_from_instance(chunk[-1])
+
     async def update_one_by_id(self, obj_id: UUID4, **kwargs: Any) -> M | None:
         query = (
             update(self._model)
@@ -0,0 +1,40 @@
+import csv
+import io
+from typing import Any, AsyncIterator, Iterable, Mapping, Sequence
+
+from src.schemas.task import ExportFormat, TaskDB
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv",
+}
+
+
+def encode_ndjson(tasks: Iterable[TaskDB]) -> bytes:
+    """Encode tasks as JSON objects, one per line"""
+    return b"".join(task.__pydantic_serializer__.to_json(task) + b"\n" for task in tasks)
+
+
+def encode_csv(tasks: Iterable[TaskDB], header: bool = False) -> bytes:
+    """Encode tasks as CSV rows in the order of the TaskDB fields, None is an empty value"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(TaskDB.model_fields)
+    writer.writerows(task.model_dump(mode="json").values() for task in tasks)
+    return buffer.getvalue().encode()
+
+
+async def encode_tasks(batches: AsyncIterator[Sequence[Mapping[str, Any]]], export_format: ExportFormat) -> AsyncIterator[bytes]:
+    """Encode batches of task rows into chunks of the export file, one chunk per batch.
+    Only one batch is held at a time, so memory does not grow with the number of tasks.
+    """
+    if export_format == ExportFormat.csv:
+        yield encode_csv((), header=True)
+
+    async for rows in batches:
+        tasks = [TaskDB.model_validate(row) for row in rows]
+        if export_format == ExportFormat.csv:
+            yield encode_csv(tasks)
+        else:
+            yield encode_ndjson(tasks)
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+from datetime import datetime, UTC
+from typing import Awaitable, Callable, Iterable
+from uuid import UUID
+
+from src.config import settings
+from src.messaging.produsers import get_users_info
+from src.models.task import Task
+from src.repositories.mongo_repository import AsyncMongoTaskRepository, async_mongo_task_repository
+from src.schemas.messaging import UserInfo
+from src.utils.unit_of_work import AbstractUnitOfWork, UnitOfWork
+
+log = logging.getLogger(__name__)
+
+UsersInfoLoader = Callable[[Iterable[UUID]], Awaitable[dict[UUID, UserInfo] | None]]
+
+
+class ProjectionError(Exception):
+    """Raised when a batch can not be projected and must be retried"""
+
+
+class TaskProjector:
+    """Applies task_outbox events to the task cards in Mongo.
+
+    Each batch runs in one transaction: the events are locked, the cards are written
+    and the events are deleted on commit. If anything fails the transaction rolls back
+    and the same events are projected again, card writes are idempotent upserts.
+    An advisory lock lets a single instance project at a time.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], AbstractUnitOfWork] = UnitOfWork,
+        cards: AsyncMongoTaskRepository = async_mongo_task_repository,
+        users_info_loader: UsersInfoLoader = get_users_info,
+        batch_size: int = settings.projector_settings.PROJECTOR_BATCH_SIZE,
+        poll_interval: float = settings.projector_settings.PROJECTOR_POLL_INTERVAL,
+    ) -> None:
+        self.uow_factory = uow_factory
+        self.cards = cards
+        self.users_info_loader = users_info_loader
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+
+    @staticmethod
+    def build_card(task: Task, users: dict[UUID, UserInfo], projected_at: datetime) -> dict:
+        def user(user_id: UUID | None) -> dict | None:
+            info = users.get(user_id) if user_id else None
+            return info.model_dump() if info else None
+
+        def ref(obj) -> dict | None:
+            return {"id": obj.id, "name": obj.name} if obj else None
+
+        return {
+            "_id": task.id,
+            "title": task.title,
+            "description": task.description,
+            "status": task.status,
+            "created_at": task.created_at,
+            "author_id": task.author_id,
+            "assignee_id": task.assignee_id,
+            "author": user(task.author_id),
+            "assignee": user(task.assignee_id),
+            "board": ref(task.board),
+            "column": ref(task.column),
+            "sprint": ref(task.sprint),
+            "group": ref(task.group),
+            "projected_at": projected_at,
+        }
+
+    async def project_batch(self) -> int:
+        """Project one batch of events, returns the number of processed events"""
+        uow = self.uow_factory()
+        async with uow:
+            if not await uow.task_outbox.try_lock_projection():
+                return 0
+
+            events = await uow.task_outbox.get_batch(self.batch_size)
+            if not events:
+                return 0
+
+            # Several events of one task need a single projection of its current state
+            task_ids = list(dict.fromkeys(event.task_id for event in events))
+            tasks = await uow.task.get_tasks_for_projection(task_ids)
+
+            user_ids = {user_id for task in tasks for user_id in (task.author_id, task.assignee_id) if user_id}
+            users = {}
+            if user_ids:
+                users = await self.users_info_loader(user_ids)
+                if users is None:
+                    raise ProjectionError("auth-service did not answer users_info")
+
+            projected_at = datetime.now(UTC).replace(tzinfo=None)
+            await self.cards.upsert_task_cards(self.build_card(task, users, projected_at) for task in tasks)
+
+            found = {task.id for task in tasks}
+            deleted = [task_id for task_id in task_ids if task_id not in found]
+            if deleted:
+                await self.cards.delete_task_cards(deleted)
+
+            await uow.task_outbox.delete_events(event.id for event in events)
+            return len(events)
+
+    async def run(self) -> None:
+        """Project batches until cancelled, sleeps when the outbox is empty"""
+        while True:
+            try:
+                processed = await self.project_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error(f"Failed project task cards: {e}")
+                processed = 0
+
+            if processed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+
+async def project_task_cards():
+    await TaskProjector().run()
@@ -6,6 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import async_session_factory
 from src.repositories.task import TaskRepository
+from src.repositories.task_counter import TaskCounterRepository
+from src.repositories.task_outbox import TaskOutboxRepository
 from src.schemas.response import BaseCreateResponse
 
 
@@ -13,6 +15,8 @@ class AbstractUnitOfWork(ABC):
     """Abstract base class for unit of work"""
     is_open: bool = False
     task: TaskRepository
+    task_counter: TaskCounterRepository
+    task_outbox: TaskOutboxRepository
 
     @abstractmethod
     def __init__(self) -> Never:
@@ -47,6 +51,8 @@ class UnitOfWork(AbstractUnitOfWork):
         "_session",
         "is_open",
         "task",
+        "task_counter",
+        "task_outbox",
     )
 
     def __init__(self) -> None:
@@ -55,6 +61,8 @@ class UnitOfWork(AbstractUnitOfWork):
     async def __aenter__(self) -> None:
         self._session: AsyncSession = async_session_factory()
         self.task = TaskRepository(session=self._session)
+        self.task_counter = TaskCounterRepository(session=self._session)
+        self.task_outbox = TaskOutboxRepository(session=self._session)
         self.is_open = True
 
     async def __aexit__(
@@ -90,6 +90,8 @@ async def setup_schemas(db_engine: AsyncEngine) -> None:
         for schema in schemas:
             await conn.execute(sqlalchemy.schema.CreateSchema(schema, if_not_exists=True))
             await conn.commit()
+        await conn.execute(sqlalchemy.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.commit()
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -1,13 +1,20 @@
-from typing import Any, Sequence
+from collections import Counter
+from dataclasses import replace
+from datetime import datetime, timedelta, UTC
+from typing import Any, AsyncIterator, Iterable, Sequence
 from uuid import UUID, uuid4
 from types import TracebackType
 
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 
 from src.api.v1.services.task import TaskService
 
 from src.models.task import Task, TaskParticipant, Status
-from src.schemas.task import TaskFilters
+from src.models.task_counter import CounterRole
+from src.models.task_outbox import TaskOutbox, TaskEvent
+from src.repositories.task_counter import task_counter_deltas
+from src.schemas.task import TaskDB, TaskFilters, TaskSearchFilters
 
 from tests.fixtures import db_mocks
 from tests.fixtures.db_mocks import USERS
@@ -18,6 +25,10 @@ class FakeTaskRepository:
 
     def __init__(self, tasks: list[Task] = None, participants: list[TaskParticipant] = None):
         self.tasks: list[Task] = tasks or []
+        now = datetime.now(UTC).replace(tzinfo=None)
+        for idx, task in enumerate(self.tasks):
+            if task.created_at is None:
+                task.created_at = now - timedelta(seconds=idx)
 
     def get_tasks(self):
         return self.tasks
@@ -28,12 +39,16 @@ class FakeTaskRepository:
                 return task
         return None
 
+    async def get_one_by_id_for_update(self, task_id: UUID) -> Task | None:
+        return await self.get_one_by_id_or_none(task_id)
+
     async def get_task_with_participants(self, task_id: UUID) -> Task | None:
         return await self.get_one_by_id_or_none(task_id)
 
     async def add_one_and_get_obj(self, **kwargs: Any) -> Task:
         if "id" not in kwargs:
             kwargs["id"] = uuid4()
+        kwargs.setdefault("created_at", datetime.now(UTC).replace(tzinfo=None))
         task = Task(**kwargs)
         self.tasks.append(task)
         return task
@@ -65,7 +80,11 @@ class FakeTaskRepository:
                 add_task = task
             if filters.like:
                 has_filters = True
-                if filters.like not in task.title:
+                like = filters.like.lower()
+                texts = [task.title]
+                if filters.search_description is True:
+                    texts.append(task.description or "")
+                if not any(like in text.lower() for text in texts):
                     continue
                 add_task = task
             if add_task:
@@ -74,12 +93,51 @@ class FakeTaskRepository:
         if not has_filters:
             res = self.tasks
 
+        res = sorted(res, key=lambda task: (task.created_at, task.id), reverse=True)
+        if isinstance(filters.cursor, str):
+            after = filters.after
+            res = [task for task in res if (task.created_at, task.id) < after]
+            return res[:filters.per_page]
         if filters.page is not None:
             return res[filters.offset:filters.limit]
         elif filters.per_page:
             return res[:filters.per_page]
         return res
 
+    async def get_tasks_json(self, filters: TaskFilters) -> tuple[str, int, tuple[datetime, UUID] | None]:
+        tasks = await self.get_tasks_by_filters(filters)
+        payload = TypeAdapter(list[TaskDB]).dump_json([task.to_schema() for task in tasks]).decode()
+        return payload, len(tasks), (tasks[-1].created_at, tasks[-1].id) if tasks else None
+
+    async def stream_tasks_by_filters(self, filters: TaskFilters, batch_size: int) -> AsyncIterator[list[dict]]:
+        tasks = await self.get_tasks_by_filters(replace(filters, page=None, per_page=len(self.tasks) or 1))
+        for idx in range(0, len(tasks), batch_size):
+            yield [task.to_schema().model_dump() for task in tasks[idx:idx + batch_size]]
+
+    async def search_tasks(self, filters: TaskSearchFilters) -> list[tuple[Task, float]]:
+        """Ranks tasks by the number of query words in the title (weight 1) and description (weight 0.4)."""
+        words = filters.q.lower().split()
+        res = []
+        for task in self.tasks:
+            if filters.status and Status(task.status) not in filters.status:
+                continue
+            if filters.author_id and task.author_id not in filters.author_id:
+                continue
+            if filters.assignee_id and task.assignee_id not in filters.assignee_id:
+                continue
+            title_words = task.title.lower().split()
+            description_words = (task.description or "").lower().split()
+            if not all(word in title_words or word in description_words for word in words):
+                continue
+            rank = sum(1.0 * (word in title_words) + 0.4 * (word in description_words) for word in words)
+            res.append((task, rank))
+
+        res = sorted(res, key=lambda row: (row[1], row[0].id), reverse=True)
+        if isinstance(filters.cursor, str):
+            after = filters.after
+            res = [row for row in res if (row[1], row[0].id) < after]
+        return res[:filters.per_page]
+
     async def update_one_by_id(self, task_id: UUID, **kwargs: Any) -> Task | None:
         """Update a task by ID"""
         task = await self.get_one_by_id_or_none(task_id)
@@ -92,6 +150,70 @@ class FakeTaskRepository:
     async def delete_task(self, task: Task) -> None:
         self.tasks.remove(task)
 
+    async def get_tasks_for_projection(self, task_ids: Sequence[UUID]) -> Sequence[Task]:
+        return [task for task in self.tasks if task.id in task_ids]
+
+
+class FakeTaskCounterRepository:
+    """Test class for overriding the standard TaskCounterRepository."""
+
+    def __init__(self) -> None:
+        self.counters: Counter = Counter()
+
+    async def apply_deltas(self, deltas: Counter) -> None:
+        self.counters.update(deltas)
+        self.counters = +self.counters
+
+    async def get_counts_for_users(self, user_ids: Iterable[UUID]) -> dict[UUID, tuple[int, int]]:
+        res = {}
+        for user_id in user_ids:
+            assigned = sum(v for (uid, role, _), v in self.counters.items() if uid == user_id and role == CounterRole.assignee)
+            authored = sum(v for (uid, role, _), v in self.counters.items() if uid == user_id and role == CounterRole.author)
+            if assigned or authored:
+                res[user_id] = (assigned, authored)
+        return res
+
+
+class FakeTaskOutboxRepository:
+    """Test class for overriding the standard TaskOutboxRepository."""
+
+    def __init__(self) -> None:
+        self.events: list[TaskOutbox] = []
+        self.locked: bool = False
+
+    async def add_event(self, task_id: UUID, event: TaskEvent) -> None:
+        self.events.append(TaskOutbox(id=len(self.events) + 1, task_id=task_id, event=event))
+
+    async def try_lock_projection(self) -> bool:
+        return not self.locked
+
+    async def get_batch(self, limit: int) -> Sequence[TaskOutbox]:
+        return self.events[:limit]
+
+    async def delete_events(self, event_ids: Iterable[int]) -> None:
+        event_ids = set(event_ids)
+        self.events = [event for event in self.events if event.id not in event_ids]
+
+
+class FakeTaskCardRepository:
+    """Test class for overriding the task card methods of AsyncMongoTaskRepository."""
+
+    def __init__(self, cards: Iterable[dict] = ()) -> None:
+        self.cards: dict[UUID, dict] = {card["_id"]: card for card in cards}
+
+    async def upsert_task_cards(self, cards: Iterable[dict]) -> int:
+        count = 0
+        for card in cards:
+            self.cards[card["_id"]] = {"tags": [], **self.cards.get(card["_id"], {}), **card}
+            count += 1
+        return count
+
+    async def get_task_card(self, task_id: UUID) -> dict | None:
+        return self.cards.get(task_id)
+
+    async def delete_task_cards(self, task_ids: list[UUID]) -> int:
+        return len([self.cards.pop(task_id) for task_id in task_ids if task_id in self.cards])
+
 
 class FakeUnitOfWork:
     """Test class for overriding the standard UnitOfWork.
@@ -105,6 +227,10 @@ class FakeUnitOfWork:
     ) -> None:
         self.is_open: bool = False
         self.task = FakeTaskRepository(tasks, participants)
+        self.task_counter = FakeTaskCounterRepository()
+        self.task_outbox = FakeTaskOutboxRepository()
+        for task in self.task.tasks:
+            self.task_counter.counters.update(task_counter_deltas(task))
 
     async def __aenter__(self) -> None:
         pass
@@ -120,18 +246,25 @@ class FakeUnitOfWork:
     def get_tasks(self) -> list[Task]:
         return self.task.get_tasks()
 
+    def get_counters(self) -> Counter:
+        return self.task_counter.counters
+
+    def get_events(self) -> list[tuple[UUID, TaskEvent]]:
+        return [(event.task_id, event.event) for event in self.task_outbox.events]
+
 
 class FakeTaskService(TaskService):
     """Test class for overriding the standard TaskService."""
     def __init__(self, uow: FakeUnitOfWork) -> None:
         super().__init__()
         self.uow = uow
+        self.task_cards = FakeTaskCardRepository()
 
     @staticmethod
-    async def check_user_existence(user_id: UUID, field_name: str) -> None:
-        for user in USERS:
-            if user["id"] == user_id:
-                return
-        raise HTTPException(422)
+    async def check_users_existence(users: dict[str, UUID | None]) -> None:
+        user_ids = {user["id"] for user in USERS}
+        for user_id in users.values():
+            if user_id and user_id not in user_ids:
+                raise HTTPException(422)
 
 
@@ -4,6 +4,10 @@ from tests.fixtures.testing_cases.task_service import (
     TEST_TASK_SERVICE_PARTIAL_UPDATE_TASK_PARAMS,
     TEST_TASK_SERVICE_DELETE_ONE_BY_ID_PARAMS,
 )
+from tests.fixtures.testing_cases.task_query_plans import (
+    TEST_TASK_QUERY_PLAN_PARAMS,
+    TEST_TASK_SEARCH_QUERY_PLAN_PARAMS,
+)
 from tests.fixtures.testing_cases.task_router import (
     TEST_TASK_ROUTE_CREATE_PARAMS,
     TEST_TASK_ROUTE_GET_ALL_PARAMS,
@@ -18,4 +22,6 @@ __all__ = (
     "TEST_TASK_ROUTE_CREATE_PARAMS",
     "TEST_TASK_ROUTE_GET_ALL_PARAMS",
     "TEST_TASK_ROUTE_DELETE_PARAMS",
+    "TEST_TASK_QUERY_PLAN_PARAMS",
+    "TEST_TASK_SEARCH_QUERY_PLAN_PARAMS",
 )
\ No newline at end of file
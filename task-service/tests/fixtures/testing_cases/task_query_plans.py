@@ -0,0 +1,112 @@
+import hashlib
+from datetime import datetime, timedelta, UTC
+from uuid import UUID
+
+from src.models.task import Status, SearchLanguage
+from src.schemas.task import TaskFilters, TaskSearchFilters
+from src.utils.cursor import encode_cursor
+from tests.utils import BaseTestCase
+
+SEED_TASKS_COUNT = 50_000
+SEED_USERS_COUNT = 1_000
+
+
+def seeded_id(prefix: str, number: int) -> UUID:
+    """Returns the same UUID as md5(prefix || number)::uuid in the seed query."""
+    return UUID(hashlib.md5(f"{prefix}{number}".encode()).hexdigest())
+
+
+def make_filters(**kwargs) -> TaskFilters:
+    data = {
+        "ids": None,
+        "status": None,
+        "author_id": None,
+        "assignee_id": None,
+        "page": None,
+        "like": "",
+        "per_page": 100,
+        "cursor": None,
+        "search_description": False,
+    }
+    data.update(kwargs)
+    return TaskFilters(**data)
+
+
+def make_search_filters(q: str, lang: SearchLanguage = SearchLanguage.en, **kwargs) -> TaskSearchFilters:
+    data = make_filters(**kwargs).__dict__ | {"q": q, "lang": lang}
+    return TaskSearchFilters(**data)
+
+
+TEST_TASK_QUERY_PLAN_PARAMS: list[BaseTestCase] = [
+    BaseTestCase(
+        data={"filters": make_filters()},
+        description="First page without filters"
+    ),
+    BaseTestCase(
+        data={"filters": make_filters(
+            cursor=encode_cursor((datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=2), seeded_id("task", 1)))
+        )},
+        description="Page after cursor"
+    ),
+    BaseTestCase(
+        data={"filters": make_filters(page=10, per_page=50)},
+        description="Offset page"
+    ),
+    BaseTestCase(
+        data={"filters": make_filters(ids=[seeded_id("task", 1), seeded_id("task", 2)])},
+        description="Filter by ids"
+    ),
+    BaseTestCase(
+        data={"filters": make_filters(status=[Status.todo])},
+        description="Filter by status"
+    ),
+    BaseTestCase(
+        data={"filters": make_filters(assignee_id=[seeded_id("user", 1)])},
+        description="Filter by assignee_id"
+    ),
+    BaseTestCase(
+        data={"filters": make_filters(assignee_id=[seeded_id("user", 1)], status=[Status.in_progress])},
+        description="Filter by assignee_id and status"
+    ),
+    BaseTestCase(
+        data={"filters": make_filters(author_id=[seeded_id("user", 2), seeded_id("user", 3)])},
+        description="Filter by author_id"
+    ),
+    BaseTestCase(
+        data={"filters": make_filters(author_id=[seeded_id("user", 2)], status=[Status.done])},
+        description="Filter by author_id and status"
+    ),
+    BaseTestCase(
+        data={"filters": make_filters(author_id=[seeded_id("user", 2)], assignee_id=[seeded_id("user", 14)])},
+        description="Filter by author_id and assignee_id"
+    ),
+    BaseTestCase(
+        data={"filters": make_filters(like="task 4242")},
+        description="Filter by like"
+    ),
+    BaseTestCase(
+        data={"filters": make_filters(like="DESCRIPTION 4242", search_description=True)},
+        description="Filter by like in title and description"
+    ),
+]
+
+TEST_TASK_SEARCH_QUERY_PLAN_PARAMS: list[BaseTestCase] = [
+    BaseTestCase(
+        data={"filters": make_search_filters("4242")},
+        description="Search"
+    ),
+    BaseTestCase(
+        data={"filters": make_search_filters("4242", lang=SearchLanguage.ru)},
+        description="Search in russian"
+    ),
+    BaseTestCase(
+        data={"filters": make_search_filters("description 4242", status=[Status.todo])},
+        description="Search filtered by status"
+    ),
+    BaseTestCase(
+        data={"filters": make_search_filters(
+            "4242", author_id=[seeded_id("user", 242)], cursor=encode_cursor((0.1, seeded_id("task", 1)))
+        )},
+        description="Search filtered by author_id after cursor"
+    ),
+]
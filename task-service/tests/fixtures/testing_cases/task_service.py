@@ -90,6 +90,34 @@ TEST_TASK_SERVICE_GET_TASKS_BY_FILTERS_PARAMS: list[BaseTestCase] = [
         expected_data=TASKS[:1],
         description="Filter by like"
     ),
+    BaseTestCase(
+        data={"filters": TaskFilters(
+            ids=None,
+            status=None,
+            author_id=None,
+            assignee_id=None,
+            page=None,
+            like="first task",
+            per_page=100,
+            search_description=False,
+        )},
+        expected_data=TASKS[:1],
+        description="Filter by like ignores case"
+    ),
+    BaseTestCase(
+        data={"filters": TaskFilters(
+            ids=None,
+            status=None,
+            author_id=None,
+            assignee_id=None,
+            page=None,
+            like="second task desc",
+            per_page=100,
+            search_description=True,
+        )},
+        expected_data=TASKS[1:2],
+        description="Filter by like in description"
+    ),
     BaseTestCase(
         data={"filters": TaskFilters(
             ids=None,
@@ -1,15 +1,20 @@
 """Contains tests for task routes."""
+import csv
+import io
+import json
 from unittest.mock import AsyncMock
 from uuid import UUID
 
 import pytest
 from fastapi import HTTPException
 from httpx import AsyncClient
-from starlette.status import HTTP_404_NOT_FOUND
+from starlette.status import HTTP_200_OK, HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND
 
 from src.api.v1.routers.task import TaskService
-from tests.fixtures import testing_cases, USERS
-from tests.utils import RequestTestCase, prepare_payload
+from tests.constants import BASE_ENDPOINT_URL
+from tests.fixtures import testing_cases, USERS, FakeTaskCardRepository
+from tests.fixtures.db_mocks import TASKS
+from tests.utils import RequestTestCase, prepare_payload, match_data_to_response_structure
 
 
 class TestTaskRouter:
@@ -26,7 +31,7 @@ class TestTaskRouter:
         mock = AsyncMock()
         if case.expected_status == 422:
             mock.side_effect = HTTPException(422)
-        monkeypatch.setattr(TaskService, "check_user_existence", mock)
+        monkeypatch.setattr(TaskService, "check_users_existence", mock)
 
         response = await async_client.post(case.url, json=case.data, headers=case.headers)
         assert response.status_code == case.expected_status
@@ -46,6 +51,122 @@ class TestTaskRouter:
         assert response.status_code == case.expected_status
         assert prepare_payload(response) == case.expected_data
 
+    @staticmethod
+    async def test_get_tasks_by_cursor(async_client: AsyncClient) -> None:
+        url = f"{BASE_ENDPOINT_URL}/tasks/"
+        first_page = await async_client.get(url, params={"per_page": 1})
+        assert first_page.status_code == HTTP_200_OK
+        assert first_page.json()["payload"] == [match_data_to_response_structure(TASKS[0])]
+
+        next_cursor = first_page.json()["next_cursor"]
+        assert next_cursor is not None
+        second_page = await async_client.get(url, params={"per_page": 1, "cursor": next_cursor})
+        assert second_page.status_code == HTTP_200_OK
+        assert second_page.json()["payload"] == [match_data_to_response_structure(TASKS[1])]
+
+        last_page = await async_client.get(
+            url, params={"per_page": 1, "cursor": second_page.json()["next_cursor"]}
+        )
+        assert last_page.json()["payload"] == []
+        assert last_page.json()["next_cursor"] is None
+
+        invalid_cursor = await async_client.get(url, params={"per_page": 1, "cursor": "invalid"})
+        assert invalid_cursor.status_code == HTTP_400_BAD_REQUEST
+
+    @staticmethod
+    async def test_get_tasks_passthrough(async_client: AsyncClient) -> None:
+        url = f"{BASE_ENDPOINT_URL}/tasks/"
+        first_page = await async_client.get(url, params={"per_page": 1, "passthrough": True})
+        assert first_page.status_code == HTTP_200_OK
+        assert first_page.json() == (await async_client.get(url, params={"per_page": 1})).json()
+
+        params = {"per_page": 1, "cursor": first_page.json()["next_cursor"]}
+        second_page = await async_client.get(url, params={**params, "passthrough": True})
+        assert second_page.status_code == HTTP_200_OK
+        assert second_page.json() == (await async_client.get(url, params=params)).json()
+        assert second_page.json()["payload"] == [match_data_to_response_structure(TASKS[1])]
+
+        invalid_cursor = await async_client.get(url, params={"cursor": "invalid", "passthrough": True})
+        assert invalid_cursor.status_code == HTTP_400_BAD_REQUEST
+
+    @staticmethod
+    async def test_export_tasks(async_client: AsyncClient) -> None:
+        url = f"{BASE_ENDPOINT_URL}/tasks/export"
+        tasks = (await async_client.get(f"{BASE_ENDPOINT_URL}/tasks/")).json()["payload"]
+
+        ndjson = await async_client.get(url)
+        assert ndjson.status_code == HTTP_200_OK
+        assert ndjson.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line) for line in ndjson.text.splitlines()] == tasks
+
+        csv_export = await async_client.get(url, params={"format": "csv", "status": "todo"})
+        assert csv_export.status_code == HTTP_200_OK
+        assert csv_export.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(csv_export.text)))
+        assert [row["id"] for row in rows] == [task["id"] for task in tasks if task["status"] == "todo"]
+        assert all(row["status"] == "todo" for row in rows)
+
+        invalid_cursor = await async_client.get(url, params={"cursor": "invalid"})
+        assert invalid_cursor.status_code == HTTP_400_BAD_REQUEST
+
+    @staticmethod
+    async def test_search_tasks(async_client: AsyncClient) -> None:
+        url = f"{BASE_ENDPOINT_URL}/tasks/search"
+        response = await async_client.get(url, params={"q": "second"})
+        assert response.status_code == HTTP_200_OK
+        assert response.json()["payload"] == [match_data_to_response_structure(TASKS[1])]
+
+        first_page = await async_client.get(url, params={"q": "task", "per_page": 1})
+        assert first_page.status_code == HTTP_200_OK
+        assert len(first_page.json()["payload"]) == 1
+        next_cursor = first_page.json()["next_cursor"]
+        assert next_cursor is not None
+
+        second_page = await async_client.get(url, params={"q": "task", "per_page": 1, "cursor": next_cursor})
+        assert second_page.status_code == HTTP_200_OK
+        assert len(second_page.json()["payload"]) == 1
+        assert second_page.json()["payload"] != first_page.json()["payload"]
+
+        filtered = await async_client.get(url, params={"q": "task", "status": TASKS[0]["status"]})
+        assert filtered.json()["payload"] == [
+            match_data_to_response_structure(task) for task in TASKS if task["status"] == TASKS[0]["status"]
+        ]
+
+        invalid_cursor = await async_client.get(url, params={"q": "task", "cursor": "invalid"})
+        assert invalid_cursor.status_code == HTTP_400_BAD_REQUEST
+
+        no_query = await async_client.get(url)
+        assert no_query.status_code == 422
+
+    @staticmethod
+    async def test_get_task_card(async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        task = TASKS[0]
+        cards = FakeTaskCardRepository([{
+            "_id": task["id"],
+            "title": task["title"],
+            "description": task["description"],
+            "status": task["status"],
+            "tags": ["tag 1"],
+            "created_at": "2026-01-01T00:00:00",
+            "author_id": task["author_id"],
+            "assignee_id": None,
+            "author": {"full_name": USERS[0]["full_name"], "email": USERS[0]["email"]},
+            "board": {"id": UUID("0b7f2a7e-3f0a-4c57-9c53-3c1f4b8d2a10"), "name": "Board"},
+            "projected_at": "2026-01-01T00:00:01",
+        }])
+        monkeypatch.setattr(TaskService, "task_cards", cards)
+
+        response = await async_client.get(f"{BASE_ENDPOINT_URL}/tasks/{task['id']}/card")
+        assert response.status_code == HTTP_200_OK
+        payload = response.json()["payload"]
+        assert payload["id"] == str(task["id"])
+        assert payload["author"] == {"full_name": USERS[0]["full_name"], "email": USERS[0]["email"]}
+        assert payload["board"]["name"] == "Board"
+        assert payload["tags"] == ["tag 1"]
+
+        missing = await async_client.get(f"{BASE_ENDPOINT_URL}/tasks/{TASKS[1]['id']}/card")
+        assert missing.status_code == HTTP_404_NOT_FOUND
+
     @staticmethod
     @pytest.mark.parametrize(
         "case", testing_cases.TEST_TASK_ROUTE_DELETE_PARAMS,
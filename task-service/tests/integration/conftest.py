@@ -0,0 +1,30 @@
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.fixtures.testing_cases.task_query_plans import SEED_TASKS_COUNT, SEED_USERS_COUNT
+
+
+@pytest_asyncio.fixture
+async def large_task_table(transaction_session: AsyncSession) -> None:
+    """Fills the task table with generated tasks and refreshes its statistics.
+    The tasks only exist within the session.
+    """
+    await transaction_session.execute(
+        text(
+            """
+            INSERT INTO task_schema.task (id, title, description, status, created_at, author_id, assignee_id)
+            SELECT
+                md5('task' || i)::uuid,
+                'Task ' || i,
+                'Task description ' || i,
+                (ARRAY['todo', 'in_progress', 'done'])[i % 3 + 1]::task_schema.status,
+                TIMEZONE('utc', now()) - i * interval '1 second',
+                md5('user' || (i % :users))::uuid,
+                md5('user' || ((i * 7) % :users))::uuid
+            FROM generate_series(1, :tasks) AS i
+            """
+        ),
+        {"tasks": SEED_TASKS_COUNT, "users": SEED_USERS_COUNT},
+    )
+    await transaction_session.execute(text("ANALYZE task_schema.task"))
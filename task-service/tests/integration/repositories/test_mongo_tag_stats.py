@@ -0,0 +1,34 @@
+"""Checks that the maintained tag counts agree with the aggregation over tasks."""
+from typing import AsyncGenerator
+from uuid import uuid4
+
+import pytest_asyncio
+from pymongo import AsyncMongoClient
+
+from src.config import settings
+from src.database.mongo_db import CODEC_OPTIONS, MONGO_CLIENT_OPTIONS
+from src.repositories.mongo_repository import AsyncMongoTaskRepository
+
+
+@pytest_asyncio.fixture
+async def mongo_repository() -> AsyncGenerator[AsyncMongoTaskRepository, None]:
+    """Returns a repository over a temporary database, dropped after the test."""
+    client = AsyncMongoClient(settings.MONGO_URL_noauth, **MONGO_CLIENT_OPTIONS)
+    db_name = f"test_tag_stats_{uuid4().hex}"
+    yield AsyncMongoTaskRepository(client.get_database(db_name, codec_options=CODEC_OPTIONS))
+    await client.drop_database(db_name)
+    await client.close()
+
+
+class TestMongoTagStats:
+    @staticmethod
+    async def test_repeated_tag_is_counted_once(mongo_repository: AsyncMongoTaskRepository) -> None:
+        await mongo_repository.bulk_create([{"tags": ["a", "a", "b"]}, {"tags": ["a"]}, {"title": "No tags"}])
+        maintained = await mongo_repository.get_tag_stats()
+
+        aggregated = await mongo_repository.aggregate_by_tags()
+        await mongo_repository.rebuild_tag_stats()
+
+        assert maintained == {"a": 2, "b": 1}
+        assert {data["_id"]: data["task_count"] for data in aggregated} == maintained
+        assert await mongo_repository.get_tag_stats() == maintained
@@ -0,0 +1,22 @@
+"""Checks the generic repository methods against the task table."""
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repositories.task import TaskRepository
+from tests.fixtures.testing_cases.task_query_plans import SEED_TASKS_COUNT
+
+
+class TestSqlAlchemyRepository:
+    @staticmethod
+    async def test_iter_chunks(
+        transaction_session: AsyncSession,
+        large_task_table: None,
+    ) -> None:
+        repository = TaskRepository(transaction_session)
+        chunk_sizes, task_ids = [], []
+        async for chunk in repository.iter_chunks(batch_size=7000):
+            chunk_sizes.append(len(chunk))
+            task_ids.extend(task.id for task in chunk)
+
+        assert max(chunk_sizes) == 7000
+        assert len(task_ids) == SEED_TASKS_COUNT
+        assert task_ids == sorted(task_ids)
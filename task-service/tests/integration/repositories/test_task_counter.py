@@ -0,0 +1,47 @@
+"""Checks the task counter upserts and the rebuild against the task table."""
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.task import Status
+from src.repositories.task import TaskRepository
+from src.repositories.task_counter import TaskCounterRepository, task_counter_deltas
+
+
+class TestTaskCounterRepository:
+    @staticmethod
+    async def test_deltas_match_rebuild(transaction_session: AsyncSession) -> None:
+        tasks = TaskRepository(transaction_session)
+        counters = TaskCounterRepository(transaction_session)
+        author_id, assignee_id = uuid4(), uuid4()
+
+        created = [
+            await tasks.add_one_and_get_obj(
+                title=f"Task {idx}", status=Status.todo, author_id=author_id,
+                assignee_id=assignee_id if idx % 2 else None,
+            )
+            for idx in range(4)
+        ]
+        for task in created:
+            await counters.apply_deltas(task_counter_deltas(task))
+
+        updated = created[1]
+        deltas = task_counter_deltas(updated, sign=-1)
+        updated = await tasks.update_one_by_id(updated.id, status=Status.done, assignee_id=author_id)
+        deltas.update(task_counter_deltas(updated))
+        await counters.apply_deltas(deltas)
+
+        deleted = created[3]
+        await counters.apply_deltas(task_counter_deltas(deleted, sign=-1))
+        await tasks.delete_task(deleted)
+        await transaction_session.flush()
+
+        # Counters that dropped to zero are kept by the upsert and not created by the rebuild
+        assert await counters.get_counts_for_users([author_id, assignee_id, uuid4()]) == {
+            author_id: (1, 3),
+            assignee_id: (0, 0),
+        }
+        assert await counters.get_counts_for_users([]) == {}
+
+        await counters.rebuild()
+        assert await counters.get_counts_for_users([author_id, assignee_id]) == {author_id: (1, 3)}
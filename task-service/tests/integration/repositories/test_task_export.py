@@ -0,0 +1,26 @@
+"""Checks that the task export streams every matching task in bounded batches."""
+from dataclasses import replace
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.task import Status
+from src.repositories.task import TaskRepository
+from tests.fixtures.testing_cases.task_query_plans import SEED_TASKS_COUNT, make_filters
+
+
+class TestTaskExport:
+    @staticmethod
+    async def test_stream_tasks_by_filters(
+        transaction_session: AsyncSession,
+        large_task_table: None,
+    ) -> None:
+        repository = TaskRepository(transaction_session)
+        filters = make_filters(status=[Status.done])
+        batch_sizes, streamed = [], []
+        async for rows in repository.stream_tasks_by_filters(filters, batch_size=1000):
+            batch_sizes.append(len(rows))
+            streamed.extend(row["id"] for row in rows)
+
+        tasks = await repository.get_tasks_by_filters(replace(filters, per_page=SEED_TASKS_COUNT))
+        assert streamed == [task.id for task in tasks]
+        assert max(batch_sizes) == 1000
@@ -0,0 +1,29 @@
+"""Checks that the JSON built by the database matches the ORM page of tasks."""
+import json
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repositories.task import TaskRepository
+from tests.fixtures import testing_cases
+from tests.utils import BaseTestCase
+
+
+class TestTaskJson:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "case", testing_cases.TEST_TASK_QUERY_PLAN_PARAMS,
+        ids=[case.description for case in testing_cases.TEST_TASK_QUERY_PLAN_PARAMS]
+    )
+    async def test_get_tasks_json_matches_orm(
+        case: BaseTestCase,
+        transaction_session: AsyncSession,
+        large_task_table: None,
+    ) -> None:
+        repository = TaskRepository(transaction_session)
+        tasks = await repository.get_tasks_by_filters(**case.data)
+        payload, count, last = await repository.get_tasks_json(**case.data)
+
+        assert json.loads(payload) == [task.to_schema().model_dump(mode="json") for task in tasks]
+        assert count == len(tasks)
+        assert last == ((tasks[-1].created_at, tasks[-1].id) if tasks else None)
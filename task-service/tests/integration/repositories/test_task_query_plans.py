@@ -0,0 +1,67 @@
+"""Checks that task list queries are served by indexes on a large table."""
+import json
+from typing import Any
+
+import pytest
+from sqlalchemy import Select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.task import Task
+from src.repositories.task import TaskRepository
+from tests.fixtures import testing_cases
+from tests.utils import BaseTestCase
+
+
+def find_seq_scans(plan: dict[str, Any], relation: str) -> list[dict[str, Any]]:
+    """Returns all sequential scans of the relation in the plan tree."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") == relation:
+        found.append(plan)
+    for subplan in plan.get("Plans", []):
+        found.extend(find_seq_scans(subplan, relation))
+    return found
+
+
+async def explain(session: AsyncSession, query: Select) -> dict[str, Any]:
+    """Returns the root node of the query plan."""
+    sql = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    res = await session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    plan = res.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+class TestTaskQueryPlans:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "case", testing_cases.TEST_TASK_QUERY_PLAN_PARAMS,
+        ids=[case.description for case in testing_cases.TEST_TASK_QUERY_PLAN_PARAMS]
+    )
+    async def test_get_tasks_by_filters_uses_index(
+        case: BaseTestCase,
+        transaction_session: AsyncSession,
+        large_task_table: None,
+    ) -> None:
+        query = TaskRepository(transaction_session).get_tasks_by_filters_query(**case.data)
+        plan = await explain(transaction_session, query)
+
+        seq_scans = find_seq_scans(plan, Task.__tablename__)
+        assert not seq_scans, f"Sequential scan on {Task.__tablename__}: {seq_scans}"
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "case", testing_cases.TEST_TASK_SEARCH_QUERY_PLAN_PARAMS,
+        ids=[case.description for case in testing_cases.TEST_TASK_SEARCH_QUERY_PLAN_PARAMS]
+    )
+    async def test_search_tasks_uses_index(
+        case: BaseTestCase,
+        transaction_session: AsyncSession,
+        large_task_table: None,
+    ) -> None:
+        query = TaskRepository(transaction_session).search_tasks_query(**case.data)
+        plan = await explain(transaction_session, query)
+
+        seq_scans = find_seq_scans(plan, Task.__tablename__)
+        assert not seq_scans, f"Sequential scan on {Task.__tablename__}: {seq_scans}"
@@ -1,11 +1,15 @@
 """Contains tests for task services."""
+from datetime import datetime
+
 import pytest
 from unittest.mock import AsyncMock, patch
 
 from _pytest.raises import RaisesExc
 from fastapi import HTTPException
 
-from src.schemas.task import CreateTaskRequest, TaskDB
+from src.models.task_outbox import TaskEvent
+from src.schemas.task import CreateTaskRequest, TaskDB, UpdateTaskRequest
+from tests.fixtures.db_mocks import TASKS, USERS
 from tests.fixtures import FakeTaskService, FakeUnitOfWork
 from tests.utils import compare_dicts_and_models, BaseTestCase
 from tests.fixtures import testing_cases
@@ -34,7 +38,7 @@ class TestTaskService:
             if error is not None:
                 mock.side_effect = HTTPException(422)
 
-            monkeypatch.setattr(self._TaskService, "check_user_existence", mock)
+            monkeypatch.setattr(self._TaskService, "check_users_existence", mock)
             task = CreateTaskRequest(**case.data)
             result = await service.create_task(task, task_id=case.data["id"])
             assert compare_dicts_and_models([result], case.expected_data, TaskDB)
@@ -68,7 +72,7 @@ class TestTaskService:
             if error is not None:
                 mock.side_effect = HTTPException(422)
 
-            monkeypatch.setattr(self._TaskService, "check_user_existence", mock)
+            monkeypatch.setattr(self._TaskService, "check_users_existence", mock)
             result = await service.partial_update_task(**case.data)
             assert compare_dicts_and_models([result], case.expected_data, TaskDB)
 
@@ -86,3 +90,79 @@ class TestTaskService:
             await service.delete_one_by_id(**case.data)
             tasks = fake_uow_with_data.get_tasks()
             assert compare_dicts_and_models(tasks, case.expected_data, TaskDB)
+
+    async def test_task_counters(
+        self,
+        fake_uow_with_data: FakeUnitOfWork,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        service = self.__get_service(fake_uow_with_data)
+        monkeypatch.setattr(self._TaskService, "check_users_existence", AsyncMock())
+        author_id, assignee_id = TASKS[0]["author_id"], TASKS[0]["assignee_id"]
+        new_assignee_id = USERS[2]["id"]
+
+        async def get_counts(user_id):
+            counts = await fake_uow_with_data.task_counter.get_counts_for_users([user_id])
+            return counts.get(user_id, (0, 0))
+
+        assert await get_counts(author_id) == (0, 1)
+        assert await get_counts(assignee_id) == (1, 0)
+
+        task = await service.create_task(CreateTaskRequest(
+            title="Third Task", status="todo", author_id=author_id, assignee_id=assignee_id
+        ))
+        assert await get_counts(author_id) == (0, 2)
+        assert await get_counts(assignee_id) == (2, 0)
+
+        await service.partial_update_task(task.id, UpdateTaskRequest(assignee_id=new_assignee_id))
+        assert await get_counts(assignee_id) == (1, 0)
+        assert await get_counts(new_assignee_id) == (1, 1)
+
+        await service.delete_one_by_id(task.id)
+        assert await get_counts(author_id) == (0, 1)
+        assert await get_counts(new_assignee_id) == (0, 1)
+
+    async def test_task_outbox_events(
+        self,
+        fake_uow_with_data: FakeUnitOfWork,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        service = self.__get_service(fake_uow_with_data)
+        monkeypatch.setattr(self._TaskService, "check_users_existence", AsyncMock())
+
+        task = await service.create_task(CreateTaskRequest(
+            title="Third Task", status="todo", author_id=TASKS[0]["author_id"]
+        ))
+        await service.partial_update_task(task.id, UpdateTaskRequest(title="Renamed Task"))
+        await service.delete_one_by_id(task.id)
+        assert fake_uow_with_data.get_events() == [
+            (task.id, TaskEvent.created),
+            (task.id, TaskEvent.updated),
+            (task.id, TaskEvent.deleted),
+        ]
+
+        with pytest.raises(HTTPException):
+            await service.delete_one_by_id(task.id)
+        assert len(fake_uow_with_data.get_events()) == 3
+
+    async def test_get_task_card(self, fake_uow_with_data: FakeUnitOfWork) -> None:
+        service = self.__get_service(fake_uow_with_data)
+        task = TASKS[0]
+        await service.task_cards.upsert_task_cards([{
+            "_id": task["id"],
+            "title": task["title"],
+            "status": task["status"],
+            "created_at": datetime(2026, 1, 1),
+            "author_id": task["author_id"],
+            "author": {"full_name": USERS[0]["full_name"], "email": USERS[0]["email"]},
+            "projected_at": datetime(2026, 1, 1),
+        }])
+
+        card = await service.get_task_card(task["id"])
+        assert card.id == task["id"]
+        assert card.author.full_name == USERS[0]["full_name"]
+        assert card.tags == []
+
+        with pytest.raises(HTTPException) as error:
+            await service.get_task_card(TASKS[1]["id"])
+        assert error.value.status_code == 404
@@ -0,0 +1,34 @@
+"""Contains tests for the MongoDB codec options."""
+import datetime
+from uuid import uuid4
+
+import bson
+
+from src.database.mongo_db import CODEC_OPTIONS
+from src.models.task import Status
+
+
+class TestMongoCodecOptions:
+    def test_round_trip(self) -> None:
+        created_at = datetime.datetime(2025, 1, 2, 3, 4, 5)
+        document = {
+            "status": Status.in_progress,
+            "author_id": uuid4(),
+            "author": {"id": uuid4()},
+            "participants": [{"user_id": uuid4()}],
+            "created_at": created_at,
+            "due_date": datetime.date(2025, 1, 31),
+        }
+
+        decoded = bson.decode(bson.encode(document, codec_options=CODEC_OPTIONS), codec_options=CODEC_OPTIONS)
+
+        assert decoded == {
+            **document,
+            "status": Status.in_progress.value,
+            "due_date": datetime.datetime(2025, 1, 31),
+        }
+
+    def test_uuids_are_stored_as_standard_binary(self) -> None:
+        user_id = uuid4()
+        raw = bson.decode(bson.encode({"author_id": user_id}, codec_options=CODEC_OPTIONS))
+        assert raw["author_id"] == bson.Binary.from_uuid(user_id)
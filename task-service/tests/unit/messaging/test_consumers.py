@@ -0,0 +1,16 @@
+"""Contains tests for the RPC handlers of task-service."""
+from unittest.mock import MagicMock
+
+from pydantic import ValidationError
+
+from src.messaging.consumers import handle_tasks_count_batch
+
+
+class TestHandleTasksCountBatch:
+    async def test_invalid_requests_return_errors(self) -> None:
+        messages = [MagicMock(body=b"{}"), MagicMock(body=b"not json")]
+
+        replies = await handle_tasks_count_batch(messages)
+
+        assert len(replies) == 2
+        assert all(isinstance(reply, ValidationError) for reply in replies)
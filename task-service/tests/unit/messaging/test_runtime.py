@@ -0,0 +1,142 @@
+"""Contains tests for the RPC consumer runtime."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.messaging.runtime import RpcConsumer, BatchRpcConsumer
+
+
+def make_message(delivery_tag: int) -> MagicMock:
+    message = MagicMock()
+    message.delivery_tag = delivery_tag
+    message.reply_to = None
+    message.body = b"{}"
+    message.ack = AsyncMock()
+    message.nack = AsyncMock()
+    return message
+
+
+class TestRpcConsumer:
+    @staticmethod
+    def __get_consumer(handler: AsyncMock, **kwargs) -> RpcConsumer:
+        kwargs.setdefault("ack_batch_size", 100)
+        return RpcConsumer("test_queue", handler, **kwargs)
+
+    async def test_ack_waits_for_earlier_deliveries(self) -> None:
+        consumer = self.__get_consumer(AsyncMock(return_value=None))
+        messages = [make_message(tag) for tag in (1, 2, 3)]
+        consumer._unsettled.update(message.delivery_tag for message in messages)
+
+        await consumer._process(MagicMock(), [messages[1]], 0)
+        await consumer._process(MagicMock(), [messages[2]], 0)
+        await consumer._flush_acks()
+        for message in messages:
+            message.ack.assert_not_awaited()
+
+        await consumer._process(MagicMock(), [messages[0]], 0)
+        await consumer._flush_acks()
+        messages[2].ack.assert_awaited_once_with(multiple=True)
+        messages[0].ack.assert_not_awaited()
+        messages[1].ack.assert_not_awaited()
+        assert not consumer._unsettled
+        assert consumer.stats.processed == 3
+        assert consumer.stats.in_flight == 0
+
+    @pytest.mark.parametrize("requeue_on, expected_requeue", [((ValueError,), True), ((), False)])
+    async def test_failed_message_is_nacked(self, requeue_on: tuple, expected_requeue: bool) -> None:
+        consumer = self.__get_consumer(AsyncMock(side_effect=ValueError("boom")), requeue_on=requeue_on)
+        message = make_message(1)
+        consumer._unsettled.add(1)
+
+        await consumer._process(MagicMock(), [message], 0)
+        message.nack.assert_awaited_once_with(requeue=expected_requeue)
+        assert consumer.stats.failed == 1
+        assert not consumer._unsettled
+
+    async def test_batch_size_triggers_flush(self) -> None:
+        consumer = self.__get_consumer(AsyncMock(return_value=None), ack_batch_size=2)
+        messages = [make_message(tag) for tag in (1, 2)]
+        consumer._unsettled.update((1, 2))
+
+        for message in messages:
+            await consumer._process(MagicMock(), [message], 0)
+        messages[1].ack.assert_awaited_once_with(multiple=True)
+
+    async def test_channel_reopen_drops_old_deliveries(self) -> None:
+        consumer = self.__get_consumer(AsyncMock(return_value=None))
+        old_messages = [make_message(tag) for tag in (1, 2)]
+        consumer._unsettled.update((1, 2))
+        await consumer._process(MagicMock(), [old_messages[0]], 0)
+
+        consumer._on_channel_reopen(MagicMock())
+        new_message = make_message(1)
+        consumer._unsettled.add(1)
+        await consumer._process(MagicMock(), [new_message], consumer._generation)
+        await consumer._process(MagicMock(), [old_messages[1]], 0)
+        await consumer._flush_acks()
+
+        new_message.ack.assert_awaited_once_with(multiple=True)
+        for message in old_messages:
+            message.ack.assert_not_awaited()
+        assert not consumer._unsettled
+        assert not consumer._completed
+        assert consumer.stats.processed == 3
+
+
+class TestBatchRpcConsumer:
+    async def test_batch_is_flushed_by_size(self) -> None:
+        handler = AsyncMock(side_effect=lambda messages: [None] * len(messages))
+        consumer = BatchRpcConsumer("test_queue", handler, max_batch_size=2, batch_window=60)
+        messages = [make_message(tag) for tag in (1, 2)]
+
+        for message in messages:
+            consumer._unsettled.add(message.delivery_tag)
+            await consumer._dispatch(MagicMock(), message)
+        await asyncio.gather(*consumer._tasks)
+
+        handler.assert_awaited_once_with(messages)
+        assert consumer.stats.processed == 2
+        assert consumer._window_task is None
+
+    async def test_batch_is_flushed_by_window(self) -> None:
+        handler = AsyncMock(side_effect=lambda messages: [None] * len(messages))
+        consumer = BatchRpcConsumer("test_queue", handler, max_batch_size=10, batch_window=0.01)
+        message = make_message(1)
+        consumer._unsettled.add(1)
+
+        await consumer._dispatch(MagicMock(), message)
+        handler.assert_not_awaited()
+        await asyncio.sleep(0.05)
+        await asyncio.gather(*consumer._tasks)
+
+        handler.assert_awaited_once_with([message])
+
+    async def test_channel_reopen_drops_buffered_deliveries(self) -> None:
+        handler = AsyncMock(side_effect=lambda messages: [None] * len(messages))
+        consumer = BatchRpcConsumer("test_queue", handler, max_batch_size=10, batch_window=60)
+        consumer._unsettled.add(1)
+        await consumer._dispatch(MagicMock(), make_message(1))
+
+        consumer._on_channel_reopen(MagicMock())
+        await consumer._drain()
+
+        handler.assert_not_awaited()
+        assert consumer._window_task is None
+        assert not consumer._tasks
+
+    async def test_failed_replies_reject_their_messages(self) -> None:
+        handler = AsyncMock(side_effect=lambda messages: [None, ValueError("invalid")])
+        consumer = BatchRpcConsumer("test_queue", handler, max_batch_size=2, batch_window=60, ack_batch_size=100)
+        messages = [make_message(tag) for tag in (1, 2)]
+
+        for message in messages:
+            consumer._unsettled.add(message.delivery_tag)
+            await consumer._dispatch(MagicMock(), message)
+        await asyncio.gather(*consumer._tasks)
+        await consumer._flush_acks()
+
+        messages[1].nack.assert_awaited_once_with(requeue=False)
+        messages[0].ack.assert_awaited_once_with(multiple=True)
+        assert (consumer.stats.processed, consumer.stats.failed) == (1, 1)
+        assert not consumer._unsettled
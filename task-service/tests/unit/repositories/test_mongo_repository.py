@@ -0,0 +1,132 @@
+"""Contains tests for the async MongoDB task repository."""
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from bson import ObjectId
+from pymongo import DeleteOne, InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError, ConnectionFailure
+
+from src.repositories.mongo_repository import AsyncMongoTaskRepository
+
+
+def make_repository() -> AsyncMongoTaskRepository:
+    db = MagicMock()
+    db.tasks.bulk_write = AsyncMock()
+    db.tasks.find_one_and_delete = AsyncMock()
+    db.tag_stats.bulk_write = AsyncMock()
+    db.tag_stats.delete_many = AsyncMock()
+    return AsyncMongoTaskRepository(db)
+
+
+def tag_stats_updates(repository: AsyncMongoTaskRepository) -> list[UpdateOne]:
+    return repository.tag_stats.bulk_write.await_args.args[0]
+
+
+class TestAsyncMongoTaskRepository:
+    async def test_bulk_create_sends_one_unordered_write(self) -> None:
+        repository = make_repository()
+        documents = [{"title": f"Task {idx}", "author_id": uuid4()} for idx in range(3)]
+
+        ids = await repository.bulk_create(documents)
+
+        repository.tasks.bulk_write.assert_awaited_once()
+        operations = repository.tasks.bulk_write.await_args.args[0]
+        assert repository.tasks.bulk_write.await_args.kwargs == {"ordered": False}
+        assert all(isinstance(operation, InsertOne) for operation in operations)
+        assert [operation._doc["_id"] for operation in operations] == ids
+        assert operations[0]._doc["author_id"] == documents[0]["author_id"]
+        assert "_id" not in documents[0]
+
+    async def test_bulk_create_skips_failed_documents(self) -> None:
+        repository = make_repository()
+        repository.tasks.bulk_write.side_effect = BulkWriteError(
+            {"writeErrors": [{"index": 1, "code": 11000, "errmsg": "duplicate key"}], "nInserted": 2}
+        )
+
+        ids = await repository.bulk_create([{"title": f"Task {idx}"} for idx in range(3)])
+
+        assert len(ids) == 2
+
+    async def test_bulk_delete(self) -> None:
+        repository = make_repository()
+        repository.tasks.bulk_write.return_value = MagicMock(deleted_count=2)
+        task_ids = [ObjectId(), str(ObjectId()), "invalid"]
+        repository.tasks.find.return_value.to_list = AsyncMock(return_value=[
+            {"_id": task_ids[0], "tags": ["a", "b"]},
+            {"_id": ObjectId(task_ids[1]), "tags": ["a"]},
+        ])
+
+        assert await repository.bulk_delete(task_ids) == 2
+
+        operations = repository.tasks.bulk_write.await_args.args[0]
+        assert operations == [DeleteOne({"_id": task_ids[0]}), DeleteOne({"_id": ObjectId(task_ids[1])})]
+        assert tag_stats_updates(repository) == [
+            UpdateOne({"_id": "a"}, {"$inc": {"task_count": -2}}, upsert=True),
+            UpdateOne({"_id": "b"}, {"$inc": {"task_count": -1}}, upsert=True),
+        ]
+        repository.tag_stats.delete_many.assert_awaited_once_with(
+            {"_id": {"$in": ["a", "b"]}, "task_count": {"$lte": 0}}
+        )
+        assert await repository.bulk_delete([]) == 0
+
+    async def test_bulk_create_increments_tag_stats(self) -> None:
+        repository = make_repository()
+        repository.tasks.bulk_write.side_effect = BulkWriteError(
+            {"writeErrors": [{"index": 2, "code": 11000, "errmsg": "duplicate key"}], "nInserted": 2}
+        )
+        documents = [{"tags": ["a", "b", "a"]}, {"tags": ["b"]}, {"tags": ["c"]}, {"title": "No tags"}]
+
+        await repository.bulk_create(documents)
+
+        assert tag_stats_updates(repository) == [
+            UpdateOne({"_id": "a"}, {"$inc": {"task_count": 1}}, upsert=True),
+            UpdateOne({"_id": "b"}, {"$inc": {"task_count": 2}}, upsert=True),
+        ]
+
+    async def test_delete_task_decrements_tag_stats(self) -> None:
+        repository = make_repository()
+        task_id = ObjectId()
+        repository.tasks.find_one_and_delete.return_value = {"_id": task_id, "tags": ["a"]}
+
+        assert await repository.delete_task(task_id)
+        assert tag_stats_updates(repository) == [
+            UpdateOne({"_id": "a"}, {"$inc": {"task_count": -1}}, upsert=True),
+        ]
+
+        repository.tasks.find_one_and_delete.return_value = None
+        repository.tag_stats.bulk_write.reset_mock()
+        assert await repository.delete_task(task_id)
+        repository.tag_stats.bulk_write.assert_not_awaited()
+
+    async def test_upsert_task_cards(self) -> None:
+        repository = make_repository()
+        repository.tasks.bulk_write.return_value = MagicMock(upserted_count=1, modified_count=1)
+        cards = [{"_id": uuid4(), "title": f"Task {idx}"} for idx in range(2)]
+
+        assert await repository.upsert_task_cards(cards) == 2
+
+        operations = repository.tasks.bulk_write.await_args.args[0]
+        assert repository.tasks.bulk_write.await_args.kwargs == {"ordered": False}
+        assert [operation._filter for operation in operations] == [{"_id": card["_id"]} for card in cards]
+        assert operations[0]._doc == {"$set": {"title": "Task 0"}, "$setOnInsert": {"tags": []}}
+        assert all(operation._upsert for operation in operations)
+        assert await repository.upsert_task_cards([]) == 0
+
+    async def test_delete_task_cards(self) -> None:
+        repository = make_repository()
+        repository.tasks.delete_many = AsyncMock(return_value=MagicMock(deleted_count=2))
+        task_ids = [uuid4(), uuid4()]
+
+        assert await repository.delete_task_cards(task_ids) == 2
+
+        repository.tasks.delete_many.assert_awaited_once_with({"_id": {"$in": task_ids}})
+        repository.tag_stats.bulk_write.assert_not_awaited()
+        assert await repository.delete_task_cards([]) == 0
+
+    async def test_get_task_card_raises_mongo_errors(self) -> None:
+        repository = make_repository()
+        repository.tasks.find_one = AsyncMock(side_effect=ConnectionFailure("Mongo is down"))
+
+        with pytest.raises(ConnectionFailure):
+            await repository.get_task_card(uuid4())
@@ -0,0 +1,88 @@
+"""Contains tests for the task card projector."""
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from pymongo.errors import ConnectionFailure
+
+from src.models.task import Task
+from src.models.task_outbox import TaskEvent
+from src.schemas.messaging import UserInfo
+from src.utils.task_projector import TaskProjector, ProjectionError
+from tests.fixtures import FakeUnitOfWork, FakeTaskCardRepository
+from tests.fixtures.db_mocks import TASKS, USERS
+
+USERS_INFO = {user["id"]: UserInfo(full_name=user["full_name"], email=user["email"]) for user in USERS}
+
+
+def make_projector(uow: FakeUnitOfWork, users_info: dict | None = USERS_INFO) -> TaskProjector:
+    async def load(user_ids):
+        return None if users_info is None else {user_id: users_info[user_id] for user_id in user_ids}
+
+    return TaskProjector(
+        uow_factory=lambda: uow,
+        cards=FakeTaskCardRepository(),
+        users_info_loader=AsyncMock(side_effect=load),
+        batch_size=10,
+    )
+
+
+@pytest.fixture
+def fake_uow() -> FakeUnitOfWork:
+    return FakeUnitOfWork(tasks=[Task(**task) for task in TASKS])
+
+
+class TestTaskProjector:
+    async def test_project_batch(self, fake_uow: FakeUnitOfWork) -> None:
+        projector = make_projector(fake_uow)
+        deleted_id = uuid4()
+        await projector.cards.upsert_task_cards([{"_id": deleted_id, "title": "Deleted"}])
+        for task_id, event in (
+            (TASKS[0]["id"], TaskEvent.created),
+            (TASKS[0]["id"], TaskEvent.updated),
+            (TASKS[1]["id"], TaskEvent.updated),
+            (deleted_id, TaskEvent.deleted),
+        ):
+            await fake_uow.task_outbox.add_event(task_id, event)
+
+        assert await projector.project_batch() == 4
+
+        projector.users_info_loader.assert_awaited_once()
+        assert set(projector.cards.cards) == {TASKS[0]["id"], TASKS[1]["id"]}
+        card = projector.cards.cards[TASKS[0]["id"]]
+        assert card["title"] == TASKS[0]["title"]
+        assert card["author"] == {"full_name": USERS[0]["full_name"], "email": USERS[0]["email"]}
+        assert card["assignee"] == {"full_name": USERS[1]["full_name"], "email": USERS[1]["email"]}
+        assert card["board"] is None
+        assert card["tags"] == []
+        assert fake_uow.get_events() == []
+        assert await projector.project_batch() == 0
+
+    async def test_project_batch_keeps_events_without_users_info(self, fake_uow: FakeUnitOfWork) -> None:
+        projector = make_projector(fake_uow, users_info=None)
+        await fake_uow.task_outbox.add_event(TASKS[0]["id"], TaskEvent.updated)
+
+        with pytest.raises(ProjectionError):
+            await projector.project_batch()
+        assert projector.cards.cards == {}
+        assert fake_uow.get_events() == [(TASKS[0]["id"], TaskEvent.updated)]
+
+    async def test_project_batch_skips_when_locked(self, fake_uow: FakeUnitOfWork) -> None:
+        projector = make_projector(fake_uow)
+        await fake_uow.task_outbox.add_event(TASKS[0]["id"], TaskEvent.updated)
+        fake_uow.task_outbox.locked = True
+
+        assert await projector.project_batch() == 0
+        assert len(fake_uow.get_events()) == 1
+
+    async def test_project_batch_keeps_events_when_delete_fails(self, fake_uow: FakeUnitOfWork) -> None:
+        projector = make_projector(fake_uow)
+        deleted_id = uuid4()
+        await projector.cards.upsert_task_cards([{"_id": deleted_id, "title": "Deleted"}])
+        await fake_uow.task_outbox.add_event(deleted_id, TaskEvent.deleted)
+        projector.cards.delete_task_cards = AsyncMock(side_effect=ConnectionFailure("Mongo is down"))
+
+        with pytest.raises(ConnectionFailure):
+            await projector.project_batch()
+        assert deleted_id in projector.cards.cards
+        assert fake_uow.get_events() == [(deleted_id, TaskEvent.deleted)]